@@ -8,10 +8,13 @@ import json
 import os
 import random
 import re
+import shlex
 import subprocess
+import threading
 import time as time_module
 import uuid
 from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any, cast
@@ -22,6 +25,7 @@ from trajectly.constants import (
     EXIT_REGRESSION,
     EXIT_SUCCESS,
     SCHEMA_VERSION,
+    STATE_DIR,
     TRACE_EVENT_TYPES,
     TRT_NORMALIZER_VERSION,
     TRT_SPEC_SCHEMA_VERSION,
@@ -65,7 +69,7 @@ from trajectly.sync import (
     SyncTrajectoryEnvelope,
     trajectory_from_trace_events,
 )
-from trajectly.trace.io import read_trace_meta, write_trace_meta
+from trajectly.trace.io import read_trace_meta_version, write_trace_meta
 from trajectly.trace.models import TraceMetaV03
 from trajectly.trt.runner import TRTResult, evaluate_trt
 from trajectly.trt.types import TRTViolation
@@ -92,32 +96,39 @@ __all__ = [
 ]
 
 
+_WORKSPACE_SEED_FILES: tuple[tuple[Path, bytes], ...] = (
+    (
+        STATE_DIR / "config.yaml",
+        b"schema_version: v1\ndefault_fixture_policy: by_index\ndefault_strict: false\n",
+    ),
+    (
+        Path("tests") / "sample.agent.yaml",
+        (
+            b"schema_version: \"0.4\"\n"
+            b"name: sample\n"
+            b"command: python agents/simple_agent.py\n"
+            b"fixture_policy: by_index\n"
+            b"strict: true\n"
+        ),
+    ),
+)
+
+
 def initialize_workspace(project_root: Path) -> None:
     """Create required state directories and a starter sample spec."""
     paths = _state_paths(project_root)
     _ensure_state_dirs(paths)
 
-    config_path = paths.state / "config.yaml"
-    if not config_path.exists():
-        config_path.write_text(
-            "schema_version: v1\ndefault_fixture_policy: by_index\ndefault_strict: false\n",
-            encoding="utf-8",
-        )
-
-    sample_spec_dir = project_root / "tests"
-    sample_spec_dir.mkdir(parents=True, exist_ok=True)
-    sample_spec = sample_spec_dir / "sample.agent.yaml"
-    if not sample_spec.exists():
-        sample_spec.write_text(
-            (
-                "schema_version: \"0.4\"\n"
-                "name: sample\n"
-                "command: python agents/simple_agent.py\n"
-                "fixture_policy: by_index\n"
-                "strict: true\n"
-            ),
-            encoding="utf-8",
-        )
+    # Exclusive-create replaces the exists()/write pair and never clobbers
+    # files a user has already edited.
+    for rel_path, body in _WORKSPACE_SEED_FILES:
+        path = project_root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with path.open("xb") as handle:
+                handle.write(body)
+        except FileExistsError:
+            continue
 
 
 _AUTO_SPEC_EXCLUDED_DIRS = {
@@ -141,6 +152,10 @@ _DETERMINISM_CODE_RE = re.compile(
     r"(NONDETERMINISM_CLOCK_DETECTED|NONDETERMINISM_RANDOM_DETECTED|NONDETERMINISM_UUID_DETECTED|NONDETERMINISM_FILESYSTEM_DETECTED)"
 )
 
+# Third-party semantic plugins and run hooks are not assumed to be
+# thread-safe; under TRAJECTLY_PARALLEL=1 their calls are serialized.
+_PLUGIN_LOCK = threading.Lock()
+
 
 def _validate_baseline_version(version: str) -> str:
     """Execute `_validate_baseline_version`."""
@@ -676,15 +691,33 @@ def discover_spec_files(project_root: Path) -> list[Path]:
     """Discover agent specs for auto-mode commands in deterministic order."""
     root = project_root.resolve()
     discovered: list[Path] = []
-    for walk_root, dirs, files in os.walk(root):
-        dirs[:] = sorted(
-            directory
-            for directory in dirs
-            if directory not in _AUTO_SPEC_EXCLUDED_DIRS and not directory.startswith(".")
-        )
-        for filename in sorted(files):
-            if filename.endswith(".agent.yaml"):
-                discovered.append((Path(walk_root) / filename).resolve())
+    # Iterative scandir walk that prunes excluded/hidden directories before
+    # descending; like os.walk it does not follow directory symlinks and skips
+    # unreadable directories. Ordering comes from the final sort. Because the
+    # root is resolved and directory links are never entered, entry paths are
+    # already canonical; only file symlinks still need resolving.
+    pending = [str(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if (
+                            name not in _AUTO_SPEC_EXCLUDED_DIRS
+                            and not name.startswith(".")
+                            and not entry.is_symlink()
+                        ):
+                            pending.append(entry.path)
+                    elif name.endswith(".agent.yaml"):
+                        path = Path(entry.path)
+                        discovered.append(path.resolve() if entry.is_symlink() else path)
+        except OSError:
+            continue
     return sorted(discovered, key=lambda path: str(path))
 
 
@@ -702,9 +735,9 @@ def apply_enable_template(project_root: Path, template: str) -> list[Path]:
         raise ValueError(f"Unsupported template: {template}. Supported templates: {supported}")
 
     created: list[Path] = []
-    assets = _template_assets(normalized)
-    for rel_path, content in assets.items():
-        path = (project_root.resolve() / rel_path).resolve()
+    root = project_root.resolve()
+    for rel_path, content in _template_assets(normalized).items():
+        path = (root / rel_path).resolve()
         path.parent.mkdir(parents=True, exist_ok=True)
         if path.exists():
             continue
@@ -782,8 +815,13 @@ def _build_trace(spec: AgentSpec, result: ExecutionResult, run_id: str) -> list[
 
     if spec.redact:
         for event in events:
-            event.payload = apply_redactions(event.payload, spec.redact)
-            event.meta = apply_redactions(event.meta, spec.redact)
+            payload = apply_redactions(event.payload, spec.redact)
+            meta = apply_redactions(event.meta, spec.redact)
+            if payload is event.payload and meta is event.meta:
+                # Nothing matched, so the id computed at build time still holds.
+                continue
+            event.payload = payload
+            event.meta = meta
             event.event_id = compute_event_id(event)
 
     return events
@@ -849,8 +887,7 @@ def _write_counterexample_prefix(
     return prefix_path
 
 
-def _augment_report_with_trt(
-    report_json: Path,
+def _trt_report_payload(
     trt_result: TRTResult,
     *,
     baseline_version: str | None = None,
@@ -860,11 +897,8 @@ def _augment_report_with_trt(
     fixture_usage: dict[str, Any] | None = None,
     determinism_diagnostics: list[dict[str, Any]] | None = None,
     replay_mode: str | None = None,
-) -> None:
-    """Execute `_augment_report_with_trt`."""
-    raw = json.loads(report_json.read_text(encoding="utf-8"))
-    if not isinstance(raw, dict):
-        return
+) -> dict[str, Any]:
+    """Execute `_trt_report_payload`."""
     trt_payload = trt_result.report.to_dict()
     if baseline_version is not None:
         trt_payload["baseline_version"] = baseline_version
@@ -881,7 +915,15 @@ def _augment_report_with_trt(
         trt_payload["determinism_diagnostics"] = determinism_diagnostics
     if replay_mode is not None:
         trt_payload["replay_mode"] = replay_mode
-    raw["trt_v03"] = trt_payload
+    return trt_payload
+
+
+def _augment_report_with_trt(report_json: Path, trt_result: TRTResult) -> None:
+    """Execute `_augment_report_with_trt`."""
+    raw = json.loads(report_json.read_text(encoding="utf-8"))
+    if not isinstance(raw, dict):
+        return
+    raw["trt_v03"] = _trt_report_payload(trt_result)
     report_json.write_text(json.dumps(raw, indent=2, sort_keys=True), encoding="utf-8")
 
 
@@ -924,12 +966,12 @@ def _aggregate_markdown(rows: list[dict[str, Any]], errors: list[str]) -> str:
 
 def _build_repro_command(spec_path: Path, project_root: Path, strict_override: bool | None = None) -> str:
     """Execute `_build_repro_command`."""
-    command = f'python -m trajectly run "{spec_path}" --project-root "{project_root}"'
+    argv = ["python", "-m", "trajectly", "run", os.fspath(spec_path), "--project-root", os.fspath(project_root)]
     if strict_override is True:
-        command += " --strict"
+        argv.append("--strict")
     if strict_override is False:
-        command += " --no-strict"
-    return command
+        argv.append("--no-strict")
+    return shlex.join(argv)
 
 
 def _determinism_payload(spec: AgentSpec) -> dict[str, object]:
@@ -1225,230 +1267,226 @@ def record_specs(
     return CommandOutcome(exit_code=exit_code, processed_specs=len(specs), errors=errors)
 
 
-def run_specs(
-    targets: list[str],
-    project_root: Path,
-    baseline_dir: Path | None = None,
-    fixtures_dir: Path | None = None,
-    strict_override: bool | None = None,
-    baseline_version: str | None = None,
-) -> CommandOutcome:
-    """Replay specs against baselines, evaluate TRT, and write reports."""
-    paths = _state_paths(project_root)
-    _ensure_state_dirs(paths)
+def _parallel_runs_enabled() -> bool:
+    """Return whether `run_specs` may replay independent specs concurrently.
 
-    try:
-        specs = load_specs(targets, cwd=project_root)
-    except Exception as exc:
-        return CommandOutcome(exit_code=EXIT_INTERNAL_ERROR, processed_specs=0, errors=[str(exc)])
+    Semantic plugins and run hooks still run one at a time, but from worker
+    threads rather than the calling thread.
+    """
+    return os.getenv("TRAJECTLY_PARALLEL") == "1"
 
-    if fixtures_dir is not None:
-        return CommandOutcome(
-            exit_code=EXIT_INTERNAL_ERROR,
-            processed_specs=0,
-            errors=[
-                "Hard cutover active: --fixtures-dir is not supported in v0.4. "
-                "Use versioned baselines under .trajectly/baselines/<slug>/<version>/fixtures.json."
-            ],
-        )
-    baseline_root = baseline_dir.resolve() if baseline_dir else paths.baselines
 
+def _run_one_spec(
+    spec: AgentSpec,
+    *,
+    paths: _StatePaths,
+    baseline_root: Path,
+    project_root: Path,
+    strict_override: bool | None,
+    baseline_version: str | None,
+) -> tuple[list[str], dict[str, Any] | None]:
+    """Replay one spec and return its errors and latest-report row."""
     errors: list[str] = []
-    regressions = 0
-    rows: list[dict[str, Any]] = []
-
-    for spec in specs:
-        slug = _slugify(spec.name)
-        legacy_error = _reject_legacy_baseline_layout(paths, slug)
-        if legacy_error is not None:
-            errors.append(f"{spec.name}: {legacy_error}")
-            continue
-
-        resolved_version = baseline_version or _read_promoted_version(paths, slug)
-        if resolved_version is None:
-            errors.append(
-                f"{spec.name}: no promoted baseline version found. "
-                "Create one with `python -m trajectly baseline create --name v1 <spec>` and promote it."
-            )
-            continue
-        resolved_version = _validate_baseline_version(resolved_version)
-
-        version_dir = baseline_root / slug / resolved_version
-        baseline_path = version_dir / "trace.jsonl"
-        fixture_path = version_dir / "fixtures.json"
-        runtime_meta_path = version_dir / "baseline.meta.json"
-
-        if not baseline_path.exists():
+    slug = _slugify(spec.name)
+    legacy_error = _reject_legacy_baseline_layout(paths, slug)
+    if legacy_error is not None:
+        errors.append(f"{spec.name}: {legacy_error}")
+        return errors, None
+
+    resolved_version = baseline_version or _read_promoted_version(paths, slug)
+    if resolved_version is None:
+        errors.append(
+            f"{spec.name}: no promoted baseline version found. "
+            "Create one with `python -m trajectly baseline create --name v1 <spec>` and promote it."
+        )
+        return errors, None
+    resolved_version = _validate_baseline_version(resolved_version)
+
+    version_dir = baseline_root / slug / resolved_version
+    baseline_path = version_dir / "trace.jsonl"
+    fixture_path = version_dir / "fixtures.json"
+    runtime_meta_path = version_dir / "baseline.meta.json"
+
+    if not baseline_path.exists():
+        errors.append(
+            f"{spec.name}: missing baseline trace at {baseline_path} for baseline version `{resolved_version}`. "
+            "Create it with `python -m trajectly baseline create --name <version> <spec>`."
+        )
+        return errors, None
+    if spec.schema_version == TRT_SPEC_SCHEMA_VERSION:
+        baseline_meta_path = version_dir / "trace.meta.json"
+        if not baseline_meta_path.exists():
             errors.append(
-                f"{spec.name}: missing baseline trace at {baseline_path} for baseline version `{resolved_version}`. "
-                "Create it with `python -m trajectly baseline create --name <version> <spec>`."
+                f"{spec.name}: NORMALIZER_VERSION_MISMATCH: missing baseline meta at {baseline_meta_path}. "
+                "Re-run `python -m trajectly record` to regenerate baseline artifacts."
             )
-            continue
-        if spec.schema_version == TRT_SPEC_SCHEMA_VERSION:
-            baseline_meta_path = version_dir / "trace.meta.json"
-            if not baseline_meta_path.exists():
-                errors.append(
-                    f"{spec.name}: NORMALIZER_VERSION_MISMATCH: missing baseline meta at {baseline_meta_path}. "
-                    "Re-run `python -m trajectly record` to regenerate baseline artifacts."
-                )
-                continue
-            try:
-                baseline_meta = read_trace_meta(baseline_meta_path)
-            except Exception as exc:
-                errors.append(
-                    f"{spec.name}: NORMALIZER_VERSION_MISMATCH: invalid baseline meta at {baseline_meta_path}: {exc}"
-                )
-                continue
-            if baseline_meta.normalizer_version != TRT_NORMALIZER_VERSION:
-                errors.append(
-                    f"{spec.name}: NORMALIZER_VERSION_MISMATCH: baseline={baseline_meta.normalizer_version} "
-                    f"runtime={TRT_NORMALIZER_VERSION}. Re-record baselines."
-                )
-                continue
-        if not fixture_path.exists():
+            return errors, None
+        try:
+            baseline_normalizer_version = read_trace_meta_version(baseline_meta_path)
+        except Exception as exc:
             errors.append(
-                f"{spec.name}: missing fixtures at {fixture_path} for baseline version `{resolved_version}`. "
-                "Re-record this version."
+                f"{spec.name}: NORMALIZER_VERSION_MISMATCH: invalid baseline meta at {baseline_meta_path}: {exc}"
             )
-            continue
-        if not runtime_meta_path.exists():
+            return errors, None
+        if baseline_normalizer_version != TRT_NORMALIZER_VERSION:
             errors.append(
-                f"{spec.name}: missing baseline runtime metadata at {runtime_meta_path}. "
-                "Re-record this baseline version."
+                f"{spec.name}: NORMALIZER_VERSION_MISMATCH: baseline={baseline_normalizer_version} "
+                f"runtime={TRT_NORMALIZER_VERSION}. Re-record baselines."
             )
-            continue
-        try:
-            runtime_meta = _load_runtime_baseline_meta(runtime_meta_path)
-        except Exception as exc:
-            errors.append(f"{spec.name}: invalid baseline runtime metadata at {runtime_meta_path}: {exc}")
-            continue
+            return errors, None
+    if not fixture_path.exists():
+        errors.append(
+            f"{spec.name}: missing fixtures at {fixture_path} for baseline version `{resolved_version}`. "
+            "Re-record this version."
+        )
+        return errors, None
+    if not runtime_meta_path.exists():
+        errors.append(
+            f"{spec.name}: missing baseline runtime metadata at {runtime_meta_path}. "
+            "Re-record this baseline version."
+        )
+        return errors, None
+    try:
+        runtime_meta = _load_runtime_baseline_meta(runtime_meta_path)
+    except Exception as exc:
+        errors.append(f"{spec.name}: invalid baseline runtime metadata at {runtime_meta_path}: {exc}")
+        return errors, None
 
-        strict = strict_override if strict_override is not None else spec.strict
-        run_id = f"{slug}-{uuid.uuid4().hex[:8]}"
-        raw_events_path = paths.tmp / f"{slug}.run.events.jsonl"
+    strict = strict_override if strict_override is not None else spec.strict
+    run_id = f"{slug}-{uuid.uuid4().hex[:8]}"
+    raw_events_path = paths.tmp / f"{slug}.run.events.jsonl"
 
-        clock_seed_raw = runtime_meta.get("clock_seed")
-        random_seed_raw = runtime_meta.get("random_seed")
-        clock_seed_value = float(clock_seed_raw) if isinstance(clock_seed_raw, (int, float, str)) else None
-        random_seed_value = int(random_seed_raw) if isinstance(random_seed_raw, (int, float, str)) else None
+    clock_seed_raw = runtime_meta.get("clock_seed")
+    random_seed_raw = runtime_meta.get("random_seed")
+    clock_seed_value = float(clock_seed_raw) if isinstance(clock_seed_raw, (int, float, str)) else None
+    random_seed_value = int(random_seed_raw) if isinstance(random_seed_raw, (int, float, str)) else None
 
-        result = execute_spec(
-            spec=spec,
-            mode="replay",
-            events_path=raw_events_path,
-            fixtures_path=fixture_path,
-            strict=strict,
-            determinism_config=_determinism_payload(spec),
-            clock_seed=clock_seed_value,
-            random_seed=random_seed_value,
-            project_root=project_root,
-        )
+    result = execute_spec(
+        spec=spec,
+        mode="replay",
+        events_path=raw_events_path,
+        fixtures_path=fixture_path,
+        strict=strict,
+        determinism_config=_determinism_payload(spec),
+        clock_seed=clock_seed_value,
+        random_seed=random_seed_value,
+        project_root=project_root,
+    )
 
-        current_events = _build_trace(spec=spec, result=result, run_id=run_id)
-        current_path = _current_run_trace_path(paths, slug)
-        write_events_jsonl(current_path, current_events)
+    current_events = _build_trace(spec=spec, result=result, run_id=run_id)
+    current_path = _current_run_trace_path(paths, slug)
+    write_events_jsonl(current_path, current_events)
 
-        baseline_events = read_events_jsonl(baseline_path)
-        diff_result = compare_traces(
-            baseline=baseline_events,
-            current=current_events,
-            budgets=spec.budget_thresholds,
-        )
+    baseline_events = read_events_jsonl(baseline_path)
+    diff_result = compare_traces(
+        baseline=baseline_events,
+        current=current_events,
+        budgets=spec.budget_thresholds,
+    )
 
-        if result.internal_error:
-            diff_result.findings.append(
-                Finding(
-                    classification="runtime_error",
-                    message=f"Internal runtime error: {result.internal_error}",
-                )
+    if result.internal_error:
+        diff_result.findings.append(
+            Finding(
+                classification="runtime_error",
+                message=f"Internal runtime error: {result.internal_error}",
             )
+        )
 
-        if result.returncode != 0:
-            diff_result.findings.append(
-                Finding(
-                    classification="runtime_error",
-                    message=f"Replay command exited non-zero ({result.returncode})",
-                    baseline=0,
-                    current=result.returncode,
-                )
+    if result.returncode != 0:
+        diff_result.findings.append(
+            Finding(
+                classification="runtime_error",
+                message=f"Replay command exited non-zero ({result.returncode})",
+                baseline=0,
+                current=result.returncode,
             )
-        determinism_warnings = _extract_determinism_warnings(result)
-        for warning in determinism_warnings:
-            diff_result.findings.append(
-                Finding(
-                    classification=warning["code"].lower(),
-                    message=warning["message"],
-                    path="$.runtime.determinism",
-                )
+        )
+    determinism_warnings = _extract_determinism_warnings(result)
+    for warning in determinism_warnings:
+        diff_result.findings.append(
+            Finding(
+                classification=warning["code"].lower(),
+                message=warning["message"],
+                path="$.runtime.determinism",
             )
+        )
 
+    with _PLUGIN_LOCK:
         plugin_findings = run_semantic_plugins(baseline=baseline_events, current=current_events)
-        diff_result.findings.extend(plugin_findings)
-        contract_findings = evaluate_contracts(current=current_events, contracts=spec.contracts)
-        diff_result.findings.extend(contract_findings)
+    diff_result.findings.extend(plugin_findings)
+    contract_findings = evaluate_contracts(current=current_events, contracts=spec.contracts)
+    diff_result.findings.extend(contract_findings)
 
-        repro_command = _build_repro_command(spec_path=spec.source_path, project_root=paths.root)
-        trt_result = evaluate_trt(
-            baseline_events=baseline_events,
+    repro_command = _build_repro_command(spec_path=spec.source_path, project_root=paths.root)
+    trt_result = evaluate_trt(
+        baseline_events=baseline_events,
+        current_events=current_events,
+        spec=spec,
+        repro_command=repro_command,
+        counterexample_paths={},
+    )
+    counterexample_prefix: Path | None = None
+    if trt_result.witness is not None:
+        counterexample_prefix = _write_counterexample_prefix(
+            paths=paths,
+            slug=slug,
             current_events=current_events,
-            spec=spec,
-            repro_command=repro_command,
-            counterexample_paths={},
+            witness_index=trt_result.witness.witness_index,
         )
-        counterexample_prefix: Path | None = None
-        if trt_result.witness is not None:
-            counterexample_prefix = _write_counterexample_prefix(
-                paths=paths,
-                slug=slug,
-                current_events=current_events,
-                witness_index=trt_result.witness.witness_index,
-            )
-            trt_result.report.counterexample_paths["prefix"] = str(counterexample_prefix)
+        trt_result.report.counterexample_paths["prefix"] = str(counterexample_prefix)
 
-        if trt_result.status == "FAIL":
-            _merge_trt_findings(diff_result, trt_result)
+    if trt_result.status == "FAIL":
+        _merge_trt_findings(diff_result, trt_result)
 
-        _refresh_summary(diff_result)
+    _refresh_summary(diff_result)
 
-        available_baselines = _collect_available_baselines(paths, slug)
-        baseline_metadata = _collect_baseline_metadata(paths, slug, available_baselines)
-        fixture_usage = _build_fixture_usage(current_events, fixture_path)
-        determinism_diagnostics = _build_determinism_diagnostics(
-            spec=spec,
-            determinism_warnings=determinism_warnings,
-            diff_result=diff_result,
-        )
-        warning_messages = _determinism_warning_messages(determinism_warnings)
-
-        report_json = paths.reports / f"{slug}.json"
-        report_md = paths.reports / f"{slug}.md"
-        write_reports(spec_name=spec.name, result=diff_result, json_path=report_json, md_path=report_md)
-        _augment_report_with_trt(
-            report_json,
-            trt_result,
-            baseline_version=resolved_version,
-            determinism_warnings=determinism_warnings,
-            available_baselines=available_baselines,
-            baseline_metadata=baseline_metadata,
-            fixture_usage=fixture_usage,
-            determinism_diagnostics=determinism_diagnostics,
-            replay_mode=spec.replay.mode,
-        )
-        repro_artifact = _write_repro_artifact(
-            paths=paths,
-            spec=spec,
-            slug=slug,
-            diff_result=diff_result,
-            baseline_events=baseline_events,
-            current_events=current_events,
-            report_json=report_json,
-            report_md=report_md,
-            trt_status=trt_result.status,
-            trt_failure_class=trt_result.report.failure_class,
-            trt_witness_index=trt_result.report.witness_index,
-            trt_counterexample_prefix=counterexample_prefix,
-        )
+    available_baselines = _collect_available_baselines(paths, slug)
+    baseline_metadata = _collect_baseline_metadata(paths, slug, available_baselines)
+    fixture_usage = _build_fixture_usage(current_events, fixture_path)
+    determinism_diagnostics = _build_determinism_diagnostics(
+        spec=spec,
+        determinism_warnings=determinism_warnings,
+        diff_result=diff_result,
+    )
+    warning_messages = _determinism_warning_messages(determinism_warnings)
+
+    report_json = paths.reports / f"{slug}.json"
+    report_md = paths.reports / f"{slug}.md"
+    # The TRT section is attached before the first write so the report is
+    # serialized once instead of written, read back and rewritten.
+    trt_payload = _trt_report_payload(
+        trt_result,
+        baseline_version=resolved_version,
+        determinism_warnings=determinism_warnings,
+        available_baselines=available_baselines,
+        baseline_metadata=baseline_metadata,
+        fixture_usage=fixture_usage,
+        determinism_diagnostics=determinism_diagnostics,
+        replay_mode=spec.replay.mode,
+    )
+    write_reports(
+        spec_name=spec.name,
+        result=diff_result,
+        json_path=report_json,
+        md_path=report_md,
+        extra={"trt_v03": trt_payload},
+    )
+    repro_artifact = _write_repro_artifact(
+        paths=paths,
+        spec=spec,
+        slug=slug,
+        diff_result=diff_result,
+        baseline_events=baseline_events,
+        current_events=current_events,
+        report_json=report_json,
+        report_md=report_md,
+        trt_status=trt_result.status,
+        trt_failure_class=trt_result.report.failure_class,
+        trt_witness_index=trt_result.report.witness_index,
+        trt_counterexample_prefix=counterexample_prefix,
+    )
 
+    with _PLUGIN_LOCK:
         run_run_hooks(
             context={
                 "schema_version": SCHEMA_VERSION,
@@ -1469,35 +1507,92 @@ def run_specs(
             },
         )
 
-        if diff_result.summary.get("regression", False):
-            regressions += 1
+    return errors, {
+        "spec": spec.name,
+        "slug": slug,
+        "regression": diff_result.summary.get("regression", False),
+        "report_json": str(report_json),
+        "report_md": str(report_md),
+        "baseline": str(baseline_path),
+        "current": str(current_path),
+        "baseline_version": resolved_version,
+        "spec_path": str(spec.source_path),
+        "repro_artifact": str(repro_artifact),
+        "repro_command": repro_command,
+        "trt_status": trt_result.status,
+        "trt_failure_class": trt_result.report.failure_class,
+        "trt_witness_index": trt_result.report.witness_index,
+        "trt_primary_violation": (
+            trt_result.report.primary_violation.to_dict() if trt_result.report.primary_violation else None
+        ),
+        "trt_counterexample_prefix": str(counterexample_prefix) if counterexample_prefix else None,
+        "available_baselines": available_baselines,
+        "baseline_metadata": baseline_metadata,
+        "determinism_warnings": warning_messages,
+        "determinism_warnings_structured": determinism_warnings,
+    }
 
-        rows.append(
-            {
-                "spec": spec.name,
-                "slug": slug,
-                "regression": diff_result.summary.get("regression", False),
-                "report_json": str(report_json),
-                "report_md": str(report_md),
-                "baseline": str(baseline_path),
-                "current": str(current_path),
-                "baseline_version": resolved_version,
-                "spec_path": str(spec.source_path),
-                "repro_artifact": str(repro_artifact),
-                "repro_command": repro_command,
-                "trt_status": trt_result.status,
-                "trt_failure_class": trt_result.report.failure_class,
-                "trt_witness_index": trt_result.report.witness_index,
-                "trt_primary_violation": (
-                    trt_result.report.primary_violation.to_dict() if trt_result.report.primary_violation else None
-                ),
-                "trt_counterexample_prefix": str(counterexample_prefix) if counterexample_prefix else None,
-                "available_baselines": available_baselines,
-                "baseline_metadata": baseline_metadata,
-                "determinism_warnings": warning_messages,
-                "determinism_warnings_structured": determinism_warnings,
-            }
+
+def run_specs(
+    targets: list[str],
+    project_root: Path,
+    baseline_dir: Path | None = None,
+    fixtures_dir: Path | None = None,
+    strict_override: bool | None = None,
+    baseline_version: str | None = None,
+) -> CommandOutcome:
+    """Replay specs against baselines, evaluate TRT, and write reports."""
+    paths = _state_paths(project_root)
+    _ensure_state_dirs(paths)
+
+    try:
+        specs = load_specs(targets, cwd=project_root)
+    except Exception as exc:
+        return CommandOutcome(exit_code=EXIT_INTERNAL_ERROR, processed_specs=0, errors=[str(exc)])
+
+    if fixtures_dir is not None:
+        return CommandOutcome(
+            exit_code=EXIT_INTERNAL_ERROR,
+            processed_specs=0,
+            errors=[
+                "Hard cutover active: --fixtures-dir is not supported in v0.4. "
+                "Use versioned baselines under .trajectly/baselines/<slug>/<version>/fixtures.json."
+            ],
         )
+    baseline_root = baseline_dir.resolve() if baseline_dir else paths.baselines
+
+    errors: list[str] = []
+    regressions = 0
+    rows: list[dict[str, Any]] = []
+
+    def run_one(spec: AgentSpec) -> tuple[list[str], dict[str, Any] | None]:
+        # Report an unexpected failure against its spec so parallel and
+        # sequential runs fail the same way instead of aborting the batch.
+        try:
+            return _run_one_spec(
+                spec,
+                paths=paths,
+                baseline_root=baseline_root,
+                project_root=project_root,
+                strict_override=strict_override,
+                baseline_version=baseline_version,
+            )
+        except Exception as exc:
+            return [f"{spec.name}: internal error: {exc}"], None
+
+    if _parallel_runs_enabled() and len(specs) > 1 and len({_slugify(spec.name) for spec in specs}) == len(specs):
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(specs))) as executor:
+            outcomes = list(executor.map(run_one, specs))
+    else:
+        outcomes = [run_one(spec) for spec in specs]
+
+    for spec_errors, row in outcomes:
+        errors.extend(spec_errors)
+        if row is None:
+            continue
+        if row["regression"]:
+            regressions += 1
+        rows.append(row)
 
     aggregate = {
         "schema_version": SCHEMA_VERSION,
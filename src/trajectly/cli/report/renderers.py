@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -55,12 +56,24 @@ def render_markdown(spec_name: str, result: DiffResult) -> str:
     return "\n".join(lines)
 
 
-def write_reports(spec_name: str, result: DiffResult, json_path: Path, md_path: Path) -> None:
-    """Execute `write_reports`."""
+def write_reports(
+    spec_name: str,
+    result: DiffResult,
+    json_path: Path,
+    md_path: Path,
+    *,
+    extra: Mapping[str, Any] | None = None,
+) -> None:
+    """Execute `write_reports`.
+
+    ``extra`` adds top-level sections to the JSON report after validation.
+    """
     json_path.parent.mkdir(parents=True, exist_ok=True)
     md_path.parent.mkdir(parents=True, exist_ok=True)
     report_payload = {"schema_version": SCHEMA_VERSION, **result.to_dict()}
     validated_payload = validate_diff_report_dict(report_payload)
+    if extra:
+        validated_payload.update(extra)
     json_path.write_text(json.dumps(validated_payload, indent=2, sort_keys=True), encoding="utf-8")
     md_path.write_text(render_markdown(spec_name=spec_name, result=result), encoding="utf-8")
 
@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
+# Version strings are interned so validators can hand back these exact
+# objects, and the equality checks against them short-circuit on identity.
 # Legacy schema version used by pre-TRT modules. This remains until full v0.3 cutover.
-SCHEMA_VERSION = "v1"
+SCHEMA_VERSION = sys.intern("v1")
 
 # TRT v0.4 contract versions.
-TRT_SPEC_SCHEMA_VERSION = "0.4"
-TRT_TRACE_SCHEMA_VERSION = "0.4"
-TRT_REPORT_SCHEMA_VERSION = "0.4"
-TRT_NORMALIZER_VERSION = "1"
-TRT_SIDE_EFFECT_REGISTRY_VERSION = "1"
+TRT_SPEC_SCHEMA_VERSION = sys.intern("0.4")
+TRT_TRACE_SCHEMA_VERSION = sys.intern("0.4")
+TRT_REPORT_SCHEMA_VERSION = sys.intern("0.4")
+TRT_NORMALIZER_VERSION = sys.intern("1")
+TRT_SIDE_EFFECT_REGISTRY_VERSION = sys.intern("1")
 
 # Structured nondeterminism codes.
 NONDETERMINISM_CLOCK_DETECTED = "NONDETERMINISM_CLOCK_DETECTED"
@@ -39,6 +42,8 @@ SIDE_EFFECT_TOOL_REGISTRY_V1 = (
     "filesystem_write",
     "http_request",
 )
+# Membership view of the registry; the tuple keeps the canonical order.
+SIDE_EFFECT_TOOL_SET = frozenset(SIDE_EFFECT_TOOL_REGISTRY_V1)
 
 STATE_DIR = Path(".trajectly")
 BASELINES_DIR = STATE_DIR / "baselines"
@@ -49,15 +54,17 @@ TMP_DIR = STATE_DIR / "tmp"
 REPROS_DIR = STATE_DIR / "repros"
 SYNC_DIR = STATE_DIR / "sync"
 
-TRACE_EVENT_TYPES = {
-    "run_started",
-    "agent_step",
-    "llm_called",
-    "llm_returned",
-    "tool_called",
-    "tool_returned",
-    "run_finished",
-}
+TRACE_EVENT_TYPES = frozenset(
+    {
+        "run_started",
+        "agent_step",
+        "llm_called",
+        "llm_returned",
+        "tool_called",
+        "tool_returned",
+        "run_finished",
+    }
+)
 
 EXIT_SUCCESS = 0
 EXIT_REGRESSION = 1
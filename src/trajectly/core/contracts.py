@@ -21,6 +21,8 @@ from __future__ import annotations
 
 import re
 from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
@@ -46,6 +48,56 @@ _RE_PHONE = re.compile(r"\b(?:\+?1[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d
 
 _REGEX_CACHE: dict[str, re.Pattern[str]] = {}
 
+_OUTBOUND_KIND_EVENT_TYPES = {
+    "TOOL_CALL": "tool_called",
+    "LLM_REQUEST": "llm_called",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledContracts:
+    """Contract obligations pre-reduced to the lookup structures the evaluator scans with.
+
+    Built at the start of every ``evaluate_contracts`` call, so in-place edits
+    to ``AgentContracts`` are always seen.
+    """
+
+    deny_tools: frozenset[str]
+    allow_tools: frozenset[str]
+    forbid: frozenset[str]
+    never: frozenset[str]
+    network_default: str
+    allow_domains: frozenset[str]
+    allow_domains_sorted: tuple[str, ...]
+    outbound_event_types: tuple[str, ...]
+    secret_patterns: tuple[str, ...]
+
+
+def _compile_contracts(contracts: AgentContracts) -> _CompiledContracts:
+    """Execute `_compile_contracts`."""
+    network_allowlist = contracts.network.allowlist or contracts.network.allow_domains
+    allow_domains = frozenset(domain.strip().lower() for domain in network_allowlist if domain.strip())
+    # Keep outbound kinds in declaration order so first-match data-leak findings
+    # do not depend on set iteration order.
+    outbound_event_types: list[str] = []
+    for kind in contracts.data_leak.outbound_kinds:
+        event_type = _OUTBOUND_KIND_EVENT_TYPES.get(kind)
+        if event_type is not None and event_type not in outbound_event_types:
+            outbound_event_types.append(event_type)
+    for pattern in contracts.data_leak.secret_patterns:
+        _compiled_pattern(pattern)
+    return _CompiledContracts(
+        deny_tools=frozenset(contracts.tools.deny),
+        allow_tools=frozenset(contracts.tools.allow),
+        forbid=frozenset(contracts.sequence.forbid),
+        never=frozenset(contracts.sequence.never),
+        network_default=(contracts.network.default or "deny").strip().lower(),
+        allow_domains=allow_domains,
+        allow_domains_sorted=tuple(sorted(allow_domains)),
+        outbound_event_types=tuple(outbound_event_types),
+        secret_patterns=tuple(contracts.data_leak.secret_patterns),
+    )
+
 
 def _tool_name_from_event(event: TraceEvent) -> str | None:
     """Execute `_tool_name_from_event`."""
@@ -112,12 +164,16 @@ def _find_required_sequence_missing(requirements: list[str], operations: list[st
     return missing
 
 
-def _safe_find_operation_index(operations: list[str], target: str) -> int | None:
-    """Execute `_safe_find_operation_index`."""
-    try:
-        return _resolve_operation(target, operations)
-    except ValueError:
-        return None
+def _first_operation_index(first_index: dict[str, int], target: str) -> int | None:
+    """Execute `_first_operation_index`.
+
+    Dictionary counterpart of ``_resolve_operation`` from the start of the
+    trace: literal name first, then the ``tool:`` prefixed signature.
+    """
+    index = first_index.get(target)
+    if index is not None:
+        return index
+    return first_index.get(f"tool:{target}")
 
 
 def _extract_tool_input(event: TraceEvent) -> dict[str, Any]:
@@ -207,8 +263,13 @@ def _extract_url_from_event(event: TraceEvent) -> str | None:
     return None
 
 
+@lru_cache(maxsize=2048)
 def _extract_domain(value: str) -> str | None:
-    """Execute `_extract_domain`."""
+    """Execute `_extract_domain`.
+
+    Memoized because network-heavy traces repeat the same handful of URLs and
+    ``urlparse`` dominates the per-event cost of the network checks.
+    """
     parsed = urlparse(value)
     host = parsed.hostname
     if host:
@@ -326,14 +387,15 @@ def _validate_tool_schema(tool_name: str, event: TraceEvent, schema: dict[str, A
 
 def evaluate_contracts(current: list[TraceEvent], contracts: AgentContracts) -> list[Finding]:
     """Execute `evaluate_contracts`."""
+    compiled = _compile_contracts(contracts)
     findings: list[Finding] = []
 
     tool_events = [event for event in current if event.event_type == "tool_called"]
     tool_names = [name for event in tool_events if (name := _tool_name_from_event(event))]
     operations = [signature for event in current if (signature := _operation_signature(event))]
 
-    deny_tools = set(contracts.tools.deny)
-    allow_tools = set(contracts.tools.allow)
+    deny_tools = compiled.deny_tools
+    allow_tools = compiled.allow_tools
 
     # 1) Tool-level policy checks.
     for position, tool_name in enumerate(tool_names):
@@ -413,22 +475,35 @@ def evaluate_contracts(current: list[TraceEvent], contracts: AgentContracts) ->
             )
         )
 
-    forbid_set = set(contracts.sequence.forbid)
-    if forbid_set:
-        for position, operation in enumerate(operations):
-            if operation in forbid_set:
-                findings.append(
-                    Finding(
-                        classification="contract_sequence_forbidden_seen",
-                        message=f"Forbidden sequence operation observed: {operation}",
-                        path=f"$.operations[{position}]",
-                        current=operation,
-                    )
-                )
+    # Single fused pass over the operations: first occurrence, counts and
+    # forbid/never hits feed every remaining sequence obligation.
+    forbid_set = compiled.forbid
+    never_set = compiled.never
+    first_index: dict[str, int] = {}
+    operation_counts: Counter[str] = Counter()
+    forbidden_seen: list[tuple[int, str]] = []
+    never_seen: list[tuple[int, str]] = []
+    for position, operation in enumerate(operations):
+        operation_counts[operation] += 1
+        first_index.setdefault(operation, position)
+        if operation in forbid_set:
+            forbidden_seen.append((position, operation))
+        if operation in never_set:
+            never_seen.append((position, operation))
+
+    for position, operation in forbidden_seen:
+        findings.append(
+            Finding(
+                classification="contract_sequence_forbidden_seen",
+                message=f"Forbidden sequence operation observed: {operation}",
+                path=f"$.operations[{position}]",
+                current=operation,
+            )
+        )
 
     for required_before, required_after in contracts.sequence.require_before:
-        before_idx = _safe_find_operation_index(operations, required_before)
-        after_idx = _safe_find_operation_index(operations, required_after)
+        before_idx = _first_operation_index(first_index, required_before)
+        after_idx = _first_operation_index(first_index, required_after)
         if before_idx is None or after_idx is None or before_idx > after_idx:
             findings.append(
                 Finding(
@@ -440,7 +515,7 @@ def evaluate_contracts(current: list[TraceEvent], contracts: AgentContracts) ->
             )
 
     for required in contracts.sequence.eventually:
-        if required not in operations:
+        if required not in operation_counts:
             findings.append(
                 Finding(
                     classification="contract_sequence_eventually_missing",
@@ -450,21 +525,18 @@ def evaluate_contracts(current: list[TraceEvent], contracts: AgentContracts) ->
                 )
             )
 
-    never_set = set(contracts.sequence.never)
-    if never_set:
-        for position, operation in enumerate(operations):
-            if operation in never_set:
-                findings.append(
-                    Finding(
-                        classification="contract_sequence_never_seen",
-                        message=f"Operation forbidden by `never`: {operation}",
-                        path=f"$.operations[{position}]",
-                        current=operation,
-                    )
-                )
+    for position, operation in never_seen:
+        findings.append(
+            Finding(
+                classification="contract_sequence_never_seen",
+                message=f"Operation forbidden by `never`: {operation}",
+                path=f"$.operations[{position}]",
+                current=operation,
+            )
+        )
 
     for target in contracts.sequence.at_most_once:
-        count = operations.count(target)
+        count = operation_counts[target]
         if count > 1:
             findings.append(
                 Finding(
@@ -488,15 +560,14 @@ def evaluate_contracts(current: list[TraceEvent], contracts: AgentContracts) ->
         findings.extend(_validate_tool_schema(event_tool_name, event, tool_schema_raw))
 
     # 5) Outbound network policy checks.
-    network_allowlist = contracts.network.allowlist or contracts.network.allow_domains
-    network_default = (contracts.network.default or "deny").strip().lower()
+    network_default = compiled.network_default
     network_events = [
         (position, event)
         for position, event in enumerate(tool_events)
         if _tool_name_from_event(event) in {"http_request", "web_search"}
     ]
     if network_events:
-        allow_domains = {domain.strip().lower() for domain in network_allowlist if domain.strip()}
+        allow_domains = compiled.allow_domains
         for position, event in network_events:
             tool_name = _tool_name_from_event(event) or "unknown"
             url = _extract_url_from_event(event)
@@ -508,7 +579,7 @@ def evaluate_contracts(current: list[TraceEvent], contracts: AgentContracts) ->
                             classification="contract_network_domain_denied",
                             message=f"Outbound network call blocked (no domain): {tool_name}",
                             path=f"$.tool_calls[{position}]",
-                            baseline=sorted(allow_domains),
+                            baseline=list(compiled.allow_domains_sorted),
                             current=url,
                         )
                     )
@@ -519,7 +590,7 @@ def evaluate_contracts(current: list[TraceEvent], contracts: AgentContracts) ->
                             classification="contract_network_domain_denied",
                             message=f"Network domain denied by contracts.network.allow_domains: {domain}",
                             path=f"$.tool_calls[{position}]",
-                            baseline=sorted(allow_domains),
+                            baseline=list(compiled.allow_domains_sorted),
                             current=domain,
                         )
                     )
@@ -530,12 +601,12 @@ def evaluate_contracts(current: list[TraceEvent], contracts: AgentContracts) ->
                         classification="contract_network_domain_denied",
                         message=f"Network domain not in allowlist: {domain}",
                         path=f"$.tool_calls[{position}]",
-                        baseline=sorted(allow_domains),
+                        baseline=list(compiled.allow_domains_sorted),
                         current=domain,
                     )
                 )
 
-    if network_allowlist:
+    if contracts.network.allowlist or contracts.network.allow_domains:
         run_finished = [event for event in current if event.event_type == "run_finished"]
         if run_finished:
             payload: dict[str, Any] = run_finished[-1].payload
@@ -554,17 +625,17 @@ def evaluate_contracts(current: list[TraceEvent], contracts: AgentContracts) ->
 
     # 6) Data-leak checks (PII first, then secret patterns) with deterministic
     # first-match behavior to keep witness ordering stable.
-    outbound_kinds = set(contracts.data_leak.outbound_kinds)
-    event_kind_map = {
-        "TOOL_CALL": "tool_called",
-        "LLM_REQUEST": "llm_called",
-    }
     eligible_events: list[TraceEvent] = []
-    for kind in outbound_kinds:
-        event_type = event_kind_map.get(kind)
-        if event_type is None:
-            continue
-        eligible_events.extend(event for event in current if event.event_type == event_type)
+    if compiled.outbound_event_types and (contracts.data_leak.deny_pii_outbound or compiled.secret_patterns):
+        # One pass buckets events by eligible type; buckets are concatenated in
+        # outbound_kinds order so first-match results stay stable.
+        buckets: dict[str, list[TraceEvent]] = {event_type: [] for event_type in compiled.outbound_event_types}
+        for event in current:
+            bucket = buckets.get(event.event_type)
+            if bucket is not None:
+                bucket.append(event)
+        for bucket in buckets.values():
+            eligible_events.extend(bucket)
 
     if contracts.data_leak.deny_pii_outbound:
         for event in eligible_events:
@@ -579,7 +650,7 @@ def evaluate_contracts(current: list[TraceEvent], contracts: AgentContracts) ->
                 )
                 break
 
-    for pattern in contracts.data_leak.secret_patterns:
+    for pattern in compiled.secret_patterns:
         for event in eligible_events:
             if _contains_regex(event.payload, pattern):
                 findings.append(
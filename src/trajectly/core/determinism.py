@@ -1,4 +1,11 @@
-"""Core implementation module: trajectly/core/determinism.py."""
+"""Core implementation module: trajectly/core/determinism.py.
+
+Determinism hooks replace process-wide callables (``time.time``, ``uuid.uuid4``,
+``builtins.open``, ...), so activation state is deliberately process-global
+rather than per-context: a ``ContextVar`` could not scope a patched module
+attribute. Test runners that parallelize across worker processes (e.g.
+pytest-xdist) are already isolated; within one process use ``reset_for_tests``.
+"""
 
 from __future__ import annotations
 
@@ -15,6 +22,7 @@ import time as time_module
 import uuid as uuid_module
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
@@ -121,6 +129,8 @@ class RuntimeState:
     allow_read_paths: list[Path] = field(default_factory=list)
     allow_write_paths: list[Path] = field(default_factory=list)
     allow_commands: set[str] = field(default_factory=set)
+    allow_read_exact: frozenset[str] = frozenset()
+    allow_write_exact: frozenset[str] = frozenset()
 
     deterministic_rng: random.Random | None = None
     frozen_timestamp: float | None = None
@@ -132,7 +142,7 @@ def _sha(value: Any) -> str:
         raw = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
     except TypeError:
         raw = repr(value)
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return hashlib.sha256(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
 
 
 def _raise_violation(
@@ -157,8 +167,12 @@ def _raise_violation(
     raise DeterminismViolationError(code=code, message=message, details=details)
 
 
+@lru_cache(maxsize=32)
 def _parse_config(raw: str | None) -> DeterminismConfig:
-    """Execute `_parse_config`."""
+    """Execute `_parse_config`.
+
+    Cached by the raw env JSON; callers treat the returned config as read-only.
+    """
     if not raw:
         return DeterminismConfig()
     payload = json.loads(raw)
@@ -249,6 +263,10 @@ def _build_state_from_env() -> RuntimeState | None:
         state.allow_read_paths.append(path_value.parent)
         state.allow_write_paths.append(path_value.parent)
 
+    # Allowlist entries are already resolved, so an exact string hit needs no further
+    # normalization; the guard uses these to skip Path.resolve() on the common path.
+    state.allow_read_exact = frozenset(str(item) for item in state.allow_read_paths)
+    state.allow_write_exact = frozenset(str(item) for item in state.allow_write_paths)
     return state
 
 
@@ -278,13 +296,16 @@ def _guard_path_access(state: RuntimeState, file: str | os.PathLike[str], mode:
     """Execute `_guard_path_access`."""
     if state.config.filesystem.mode != "strict":
         return
+    is_read, is_write = _parse_access_mode(mode)
+    raw = os.fspath(file)
+    if (not is_read or raw in state.allow_read_exact) and (not is_write or raw in state.allow_write_exact):
+        return
     candidate = Path(file).resolve()
 
     # Only enforce for project-local paths to avoid breaking interpreter/module internals.
     if not _is_within(state.project_root, candidate):
         return
 
-    is_read, is_write = _parse_access_mode(mode)
     if is_read and not _allowed_path(candidate, state.allow_read_paths):
         _raise_violation(
             code=NONDETERMINISM_FILESYSTEM_DETECTED,
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import json
 from collections import Counter
+from itertools import zip_longest
 from typing import Any
 
 from trajectly.core.diff.lcs import lcs_pairs
 from trajectly.core.diff.models import DiffResult, Finding
-from trajectly.core.diff.structural import structural_diff
+from trajectly.core.diff.structural import StructuralChange, structural_diff
 from trajectly.core.events import TraceEvent
 from trajectly.core.specs import BudgetThresholds
 
@@ -32,50 +34,77 @@ def _signature(event: TraceEvent) -> str:
     return f"other:{event.event_type}"
 
 
-def _tracked(events: list[TraceEvent]) -> list[TraceEvent]:
-    """Execute `_tracked`."""
-    return [event for event in events if event.event_type in _TRACKED_EVENT_TYPES]
-
-
-def _sum_tokens(events: list[TraceEvent]) -> int:
-    """Execute `_sum_tokens`."""
-    total = 0
-    for event in events:
-        if event.event_type != "llm_returned":
-            continue
-        usage = event.payload.get("usage", {})
-        if isinstance(usage, dict):
-            tokens = usage.get("total_tokens", 0)
-            if isinstance(tokens, int):
-                total += tokens
-    return total
+def _payload_digest(payload: dict[str, Any]) -> str | None:
+    """Execute `_payload_digest`.
 
+    Traces are persisted as JSON, so payloads with the same canonical JSON
+    encoding are indistinguishable after a round trip. Returns ``None`` when
+    the payload cannot be encoded and must be walked instead; non-finite
+    floats are refused because ``NaN`` encodes equal to itself but never
+    compares equal.
+    """
+    try:
+        return json.dumps(payload, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    except (TypeError, ValueError):
+        return None
 
-def _duration_ms(events: list[TraceEvent]) -> int:
-    """Execute `_duration_ms`."""
-    finished = [event for event in events if event.event_type == "run_finished"]
-    if not finished:
-        return 0
-    payload = finished[-1].payload
-    value = payload.get("duration_ms", 0)
-    return int(value) if isinstance(value, int | float | str) else 0
 
+def _payload_changes(baseline: dict[str, Any], current: dict[str, Any]) -> list[StructuralChange]:
+    """Execute `_payload_changes`.
 
-def _tool_calls(events: list[TraceEvent]) -> int:
-    """Execute `_tool_calls`."""
-    return sum(1 for event in events if event.event_type == "tool_called")
+    Single payload comparison for findings and ``first_divergence`` so one
+    report cannot disagree with itself; equal digests skip the walk.
+    """
+    digest = _payload_digest(baseline)
+    if digest is not None and digest == _payload_digest(current):
+        return []
+    return structural_diff(baseline, current, path="$.payload")
 
 
-def _first_divergence(baseline_ops: list[TraceEvent], current_ops: list[TraceEvent]) -> dict[str, Any] | None:
-    """Execute `_first_divergence`."""
-    limit = max(len(baseline_ops), len(current_ops))
-    for index in range(limit):
-        baseline_event = baseline_ops[index] if index < len(baseline_ops) else None
-        current_event = current_ops[index] if index < len(current_ops) else None
+def _tracked(events: list[TraceEvent]) -> list[TraceEvent]:
+    """Execute `_tracked`."""
+    return [event for event in events if event.event_type in _TRACKED_EVENT_TYPES]
 
-        baseline_signature = _signature(baseline_event) if baseline_event else None
-        current_signature = _signature(current_event) if current_event else None
 
+def _tally(events: list[TraceEvent]) -> tuple[int, int, int]:
+    """Return ``(duration_ms, tool_calls, tokens)`` for *events* in one pass."""
+    duration = 0
+    tool_calls = 0
+    tokens = 0
+    for event in events:
+        event_type = event.event_type
+        if event_type == "tool_called":
+            tool_calls += 1
+        elif event_type == "llm_returned":
+            usage = event.payload.get("usage", {})
+            if isinstance(usage, dict):
+                value = usage.get("total_tokens", 0)
+                if isinstance(value, int):
+                    tokens += value
+        elif event_type == "run_finished":
+            # Last run_finished wins, matching the previous per-metric scan.
+            value = event.payload.get("duration_ms", 0)
+            duration = int(value) if isinstance(value, int | float | str) else 0
+    return duration, tool_calls, tokens
+
+
+def _first_divergence(
+    baseline_ops: list[TraceEvent],
+    current_ops: list[TraceEvent],
+    base_signatures: list[str],
+    curr_signatures: list[str],
+) -> dict[str, Any] | None:
+    """Execute `_first_divergence`.
+
+    Walks both traces in lockstep and stops at the first differing signature
+    or payload, reusing the signatures already computed for alignment.
+    """
+    lockstep = zip_longest(
+        zip(baseline_ops, base_signatures, strict=True),
+        zip(current_ops, curr_signatures, strict=True),
+        fillvalue=(None, None),
+    )
+    for index, ((baseline_event, baseline_signature), (current_event, current_signature)) in enumerate(lockstep):
         if baseline_signature != current_signature:
             return {
                 "kind": "sequence",
@@ -86,7 +115,7 @@ def _first_divergence(baseline_ops: list[TraceEvent], current_ops: list[TraceEve
 
         if baseline_event is None or current_event is None:
             continue
-        changes = structural_diff(baseline_event.payload, current_event.payload, path="$.payload")
+        changes = _payload_changes(baseline_event.payload, current_event.payload)
         if changes:
             first_change = changes[0]
             return {
@@ -140,11 +169,8 @@ def compare_traces(
             )
 
     for left_idx, right_idx in pairs:
-        left_event = baseline_ops[left_idx]
-        right_event = current_ops[right_idx]
-        if _signature(left_event) != _signature(right_event):
-            continue
-        changes = structural_diff(left_event.payload, right_event.payload, path="$.payload")
+        # LCS pairs always share a signature, so only payloads need comparing.
+        changes = _payload_changes(baseline_ops[left_idx].payload, current_ops[right_idx].payload)
         for change in changes:
             findings.append(
                 Finding(
@@ -157,12 +183,8 @@ def compare_traces(
             )
 
     budgets = budgets or BudgetThresholds()
-    duration_baseline = _duration_ms(baseline)
-    duration_current = _duration_ms(current)
-    tool_calls_baseline = _tool_calls(baseline)
-    tool_calls_current = _tool_calls(current)
-    tokens_baseline = _sum_tokens(baseline)
-    tokens_current = _sum_tokens(current)
+    duration_baseline, tool_calls_baseline, tokens_baseline = _tally(baseline)
+    duration_current, tool_calls_current, tokens_current = _tally(current)
 
     if budgets.max_latency_ms is not None and duration_current > budgets.max_latency_ms:
         findings.append(
@@ -205,7 +227,7 @@ def compare_traces(
         "regression": bool(findings),
         "finding_count": len(findings),
         "classifications": dict(classification_counts),
-        "first_divergence": _first_divergence(baseline_ops, current_ops),
+        "first_divergence": _first_divergence(baseline_ops, current_ops, base_signatures, curr_signatures),
         "baseline": {
             "duration_ms": duration_baseline,
             "tool_calls": tool_calls_baseline,
@@ -15,45 +15,53 @@ class StructuralChange:
     current: Any
 
 
+_MISSING = object()
+
+
 def structural_diff(baseline: Any, current: Any, path: str = "$") -> list[StructuralChange]:
     """Execute `structural_diff`."""
     changes: list[StructuralChange] = []
+    # Depth-first walk over an explicit stack: children are pushed in reverse
+    # so changes come out in key/index order, and deeply nested payloads cannot
+    # hit the recursion limit. A side absent from its parent is ``_MISSING``.
+    stack: list[tuple[Any, Any, str]] = [(baseline, current, path)]
+    while stack:
+        left, right, node_path = stack.pop()
+
+        if left is _MISSING or right is _MISSING:
+            changes.append(
+                StructuralChange(
+                    path=node_path,
+                    baseline=None if left is _MISSING else left,
+                    current=None if right is _MISSING else right,
+                )
+            )
+            continue
 
-    if type(baseline) is not type(current):
-        changes.append(StructuralChange(path=path, baseline=baseline, current=current))
-        return changes
-
-    if isinstance(baseline, Mapping):
-        keys = sorted(set(baseline.keys()) | set(current.keys()), key=str)
-        for key in keys:
-            key_path = f"{path}.{key}"
-            left_missing = key not in baseline
-            right_missing = key not in current
-            if left_missing or right_missing:
-                changes.append(
-                    StructuralChange(
-                        path=key_path,
-                        baseline=baseline.get(key),
-                        current=current.get(key),
+        if type(left) is not type(right):
+            changes.append(StructuralChange(path=node_path, baseline=left, current=right))
+            continue
+
+        if isinstance(left, Mapping):
+            keys = sorted(set(left.keys()) | set(right.keys()), key=str)
+            for key in reversed(keys):
+                stack.append((left.get(key, _MISSING), right.get(key, _MISSING), f"{node_path}.{key}"))
+            continue
+
+        if isinstance(left, Sequence) and not isinstance(left, (str, bytes, bytearray)):
+            left_len = len(left)
+            right_len = len(right)
+            for idx in range(max(left_len, right_len) - 1, -1, -1):
+                stack.append(
+                    (
+                        left[idx] if idx < left_len else _MISSING,
+                        right[idx] if idx < right_len else _MISSING,
+                        f"{node_path}[{idx}]",
                     )
                 )
-                continue
-            changes.extend(structural_diff(baseline[key], current[key], key_path))
-        return changes
-
-    if isinstance(baseline, Sequence) and not isinstance(baseline, (str, bytes, bytearray)):
-        max_len = max(len(baseline), len(current))
-        for idx in range(max_len):
-            idx_path = f"{path}[{idx}]"
-            if idx >= len(baseline) or idx >= len(current):
-                left = baseline[idx] if idx < len(baseline) else None
-                right = current[idx] if idx < len(current) else None
-                changes.append(StructuralChange(path=idx_path, baseline=left, current=right))
-                continue
-            changes.extend(structural_diff(baseline[idx], current[idx], idx_path))
-        return changes
-
-    if baseline != current:
-        changes.append(StructuralChange(path=path, baseline=baseline, current=current))
+            continue
+
+        if left != right:
+            changes.append(StructuralChange(path=node_path, baseline=left, current=right))
 
     return changes
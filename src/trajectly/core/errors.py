@@ -23,6 +23,9 @@ ERROR_CODE_NONDETERMINISM_CLOCK_DETECTED = "NONDETERMINISM_CLOCK_DETECTED"
 ERROR_CODE_NONDETERMINISM_RANDOM_DETECTED = "NONDETERMINISM_RANDOM_DETECTED"
 ERROR_CODE_NONDETERMINISM_UUID_DETECTED = "NONDETERMINISM_UUID_DETECTED"
 ERROR_CODE_NONDETERMINISM_FILESYSTEM_DETECTED = "NONDETERMINISM_FILESYSTEM_DETECTED"
+ERROR_CODE_SCHEMA_INVALID = "SCHEMA_INVALID"
+ERROR_CODE_SCHEMA_VERSION_MISSING = "SCHEMA_VERSION_MISSING"
+ERROR_CODE_SCHEMA_VERSION_UNSUPPORTED = "SCHEMA_VERSION_UNSUPPORTED"
 
 
 @dataclass(slots=True, frozen=True)
@@ -48,11 +51,13 @@ class TrajectlyError:
         return payload
 
 
-VALID_FAILURE_CLASSES = {
-    FAILURE_CLASS_REFINEMENT,
-    FAILURE_CLASS_CONTRACT,
-    FAILURE_CLASS_TOOLING,
-}
+VALID_FAILURE_CLASSES = frozenset(
+    {
+        FAILURE_CLASS_REFINEMENT,
+        FAILURE_CLASS_CONTRACT,
+        FAILURE_CLASS_TOOLING,
+    }
+)
 
 
 __all__ = [
@@ -62,6 +67,9 @@ __all__ = [
     "ERROR_CODE_NONDETERMINISM_RANDOM_DETECTED",
     "ERROR_CODE_NONDETERMINISM_UUID_DETECTED",
     "ERROR_CODE_NORMALIZER_VERSION_MISMATCH",
+    "ERROR_CODE_SCHEMA_INVALID",
+    "ERROR_CODE_SCHEMA_VERSION_MISSING",
+    "ERROR_CODE_SCHEMA_VERSION_UNSUPPORTED",
     "VALID_FAILURE_CLASSES",
     "FailureClass",
     "TrajectlyError",
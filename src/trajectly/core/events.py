@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from trajectly.core.canonical import sha256_of_subset
+from trajectly.core.canonical import sha256_of_data
 from trajectly.core.constants import SCHEMA_VERSION, TRACE_EVENT_TYPES
+from trajectly.core.normalize.canonical import JSONL_ENCODER
 from trajectly.core.schema import validate_trace_event_dict
 
+_JSONL_DECODER = json.JSONDecoder()
+
 
 @dataclass(slots=True)
 class TraceEvent:
@@ -24,6 +28,10 @@ class TraceEvent:
     schema_version: str = SCHEMA_VERSION
     event_id: str = ""
 
+    def __post_init__(self) -> None:
+        """Intern ``event_type`` so the evaluators' equality checks hit the identity fast path."""
+        self.event_type = sys.intern(self.event_type)
+
     def to_dict(self) -> dict[str, Any]:
         """Execute `to_dict`."""
         data: dict[str, Any] = {
@@ -43,16 +51,18 @@ class TraceEvent:
     def from_dict(cls, data: dict[str, Any]) -> TraceEvent:
         """Execute `from_dict`."""
         normalized = validate_trace_event_dict(data)
-        event_id = str(normalized.get("event_id", ""))
+        # The validator already guarantees every field's type; only the
+        # mutable containers are copied so the event owns them. Its int check
+        # also admits bools, so ``seq``/``rel_ms`` are still coerced to int.
         event = cls(
-            schema_version=str(normalized.get("schema_version", SCHEMA_VERSION)),
-            event_type=str(normalized["event_type"]),
+            schema_version=normalized["schema_version"],
+            event_type=normalized["event_type"],
             seq=int(normalized["seq"]),
-            run_id=str(normalized["run_id"]),
+            run_id=normalized["run_id"],
             rel_ms=int(normalized["rel_ms"]),
-            payload=dict(normalized.get("payload", {})),
-            meta=dict(normalized.get("meta", {})),
-            event_id=event_id,
+            payload=dict(normalized["payload"]),
+            meta=dict(normalized["meta"]),
+            event_id=normalized.get("event_id", ""),
         )
         if not event.event_id:
             event.event_id = compute_event_id(event)
@@ -60,9 +70,21 @@ class TraceEvent:
 
 
 def compute_event_id(event: TraceEvent) -> str:
-    """Execute `compute_event_id`."""
-    payload = event.to_dict()
-    return sha256_of_subset(payload, ignored_keys={"event_id", "rel_ms", "meta"})
+    """Execute `compute_event_id`.
+
+    Hashes the identity fields directly; this is exactly the ``to_dict()``
+    subset without ``event_id``, ``rel_ms`` and ``meta``, minus the
+    intermediate dict copies.
+    """
+    return sha256_of_data(
+        {
+            "schema_version": event.schema_version,
+            "event_type": event.event_type,
+            "seq": event.seq,
+            "run_id": event.run_id,
+            "payload": event.payload,
+        }
+    )
 
 
 def make_event(
@@ -91,20 +113,21 @@ def make_event(
 def write_events_jsonl(path: Path, events: list[TraceEvent]) -> None:
     """Execute `write_events_jsonl`."""
     path.parent.mkdir(parents=True, exist_ok=True)
+    encode = JSONL_ENCODER.encode
     with path.open("w", encoding="utf-8") as handle:
-        for event in events:
-            validated = validate_trace_event_dict(event.to_dict())
-            handle.write(json.dumps(validated, sort_keys=True, separators=(",", ":")))
-            handle.write("\n")
+        handle.writelines(f"{encode(validate_trace_event_dict(event.to_dict()))}\n" for event in events)
 
 
 def read_events_jsonl(path: Path) -> list[TraceEvent]:
     """Execute `read_events_jsonl`."""
     events: list[TraceEvent] = []
-    with path.open("r", encoding="utf-8") as handle:
+    # The buffered text layer decodes UTF-8 in bulk, and the shared decoder
+    # skips json.loads' per-line argument handling and encoding sniffing;
+    # utf-8-sig keeps tolerating a leading BOM as json.loads(bytes) did.
+    decode = _JSONL_DECODER.decode
+    with path.open("r", encoding="utf-8-sig") as handle:
         for line in handle:
-            stripped = line.strip()
-            if not stripped:
+            if line.isspace():
                 continue
-            events.append(TraceEvent.from_dict(json.loads(stripped)))
+            events.append(TraceEvent.from_dict(decode(line)))
     return events
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from collections import defaultdict, deque
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -12,6 +13,20 @@ from trajectly.core.canonical import sha256_of_data
 from trajectly.core.events import TraceEvent
 
 
+def _memoized_sha256(value: dict[str, Any], memo: dict[int, tuple[dict[str, Any], str]]) -> str:
+    """Execute `_memoized_sha256`.
+
+    Keyed by object identity; the memo keeps a reference to *value* so an id
+    cannot be recycled while the memo is alive.
+    """
+    cached = memo.get(id(value))
+    if cached is not None and cached[0] is value:
+        return cached[1]
+    digest = sha256_of_data(value)
+    memo[id(value)] = (value, digest)
+    return digest
+
+
 class FixtureLookupError(RuntimeError):
     """Represent `FixtureLookupError`."""
     pass
@@ -71,12 +86,17 @@ class FixtureEntry:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> FixtureEntry:
-        """Execute `from_dict`."""
+        """Execute `from_dict`.
+
+        Rows without an ``input_hash`` get one computed here, once, so
+        hand-written fixtures replay under ``by_hash`` without a rehash pass.
+        """
+        input_payload = dict(data.get("input_payload", {}))
         return cls(
             kind=str(data["kind"]),
             name=str(data["name"]),
-            input_payload=dict(data.get("input_payload", {})),
-            input_hash=str(data.get("input_hash", "")),
+            input_payload=input_payload,
+            input_hash=str(data.get("input_hash") or "") or sha256_of_data(input_payload),
             output_payload=dict(data.get("output_payload", {})),
             error=data.get("error"),
         )
@@ -99,21 +119,25 @@ class FixtureStore:
         return cls(entries=entries)
 
     @classmethod
-    def from_events(cls, events: list[TraceEvent]) -> FixtureStore:
+    def from_events(cls, events: Sequence[TraceEvent]) -> FixtureStore:
         """Execute `from_events`."""
         pending_tool: deque[dict[str, Any]] = deque()
         pending_llm: deque[dict[str, Any]] = deque()
         entries: list[FixtureEntry] = []
+        # Traces built in-process often share one input dict across repeated
+        # calls; hash each distinct object once.
+        hash_memo: dict[int, tuple[dict[str, Any], str]] = {}
 
         for event in events:
             payload = event.payload
             if event.event_type == "tool_called":
                 tool_name = str(payload.get("tool_name", "unknown"))
-                input_payload = dict(payload.get("input", {}))
+                raw_input = payload.get("input", {})
+                input_payload = dict(raw_input)
                 pending_tool.append({
                     "name": tool_name,
                     "input": input_payload,
-                    "hash": sha256_of_data(input_payload),
+                    "hash": _memoized_sha256(raw_input if isinstance(raw_input, dict) else input_payload, hash_memo),
                 })
             elif event.event_type == "tool_returned" and pending_tool:
                 prior = pending_tool.popleft()
@@ -135,11 +159,14 @@ class FixtureStore:
                 provider = str(payload.get("provider", "unknown"))
                 model = str(payload.get("model", "unknown"))
                 name = f"{provider}:{model}"
-                request_payload = dict(payload.get("request", {}))
+                raw_request = payload.get("request", {})
+                request_payload = dict(raw_request)
                 pending_llm.append({
                     "name": name,
                     "input": request_payload,
-                    "hash": sha256_of_data(request_payload),
+                    "hash": _memoized_sha256(
+                        raw_request if isinstance(raw_request, dict) else request_payload, hash_memo
+                    ),
                 })
             elif event.event_type == "llm_returned" and pending_llm:
                 prior = pending_llm.popleft()
@@ -184,51 +211,56 @@ class FixtureMatcher:
         for entry in store.entries:
             self._entries[(entry.kind, entry.name)].append(entry)
         self._index: dict[tuple[str, str], int] = defaultdict(int)
-        self._used_hash_slots: set[tuple[tuple[str, str], int]] = set()
+        # by_hash: unconsumed entries per (kind, name, input_hash) in recorded
+        # order, plus the recorded total for exhaustion reporting.
+        self._by_hash: dict[tuple[str, str, str], deque[FixtureEntry]] = {}
+        self._hash_totals: dict[tuple[str, str, str], int] = defaultdict(int)
+        for entry in store.entries if policy != "by_index" else ():
+            hash_key = (entry.kind, entry.name, entry.input_hash)
+            self._by_hash.setdefault(hash_key, deque()).append(entry)
+            self._hash_totals[hash_key] += 1
 
     def match(self, kind: str, name: str, input_payload: dict[str, Any]) -> FixtureEntry | None:
         """Execute `match`."""
         key = (kind, name)
-        entries = self._entries.get(key, [])
-        request_hash = sha256_of_data(input_payload)
 
         if self._policy == "by_index":
+            # The request is only canonicalized when a strict check or an
+            # error message needs its hash; lenient replay never pays for it.
+            entries = self._entries.get(key, [])
             idx = self._index[key]
             if idx >= len(entries):
                 if entries:
                     raise FixtureExhaustedError(
                         kind=kind,
                         name=name,
-                        expected_signature=request_hash,
+                        expected_signature=sha256_of_data(input_payload),
                         consumed_count=idx,
                         available_count=len(entries),
                     )
                 return None
             candidate = entries[idx]
-            self._index[key] += 1
-            if self._strict and candidate.input_hash != request_hash:
-                raise FixtureLookupError(
-                    f"by_index mismatch for {kind}:{name}; expected hash {candidate.input_hash}, got {request_hash}"
-                )
+            self._index[key] = idx + 1
+            if self._strict:
+                request_hash = sha256_of_data(input_payload)
+                if candidate.input_hash != request_hash:
+                    raise FixtureLookupError(
+                        f"by_index mismatch for {kind}:{name}; expected hash {candidate.input_hash}, got {request_hash}"
+                    )
             return candidate
 
-        matching_indices: list[int] = []
-        for idx, candidate in enumerate(entries):
-            if candidate.input_hash != request_hash:
-                continue
-            matching_indices.append(idx)
-            slot = (key, idx)
-            if slot in self._used_hash_slots:
-                continue
-            self._used_hash_slots.add(slot)
-            return candidate
-        if matching_indices:
-            consumed_count = sum(1 for idx in matching_indices if (key, idx) in self._used_hash_slots)
+        request_hash = sha256_of_data(input_payload)
+        hash_key = (kind, name, request_hash)
+        pending = self._by_hash.get(hash_key)
+        if pending:
+            return pending.popleft()
+        if pending is not None:
+            total = self._hash_totals[hash_key]
             raise FixtureExhaustedError(
                 kind=kind,
                 name=name,
                 expected_signature=request_hash,
-                consumed_count=consumed_count,
-                available_count=len(matching_indices),
+                consumed_count=total,
+                available_count=total,
             )
         return None
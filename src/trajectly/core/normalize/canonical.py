@@ -6,7 +6,7 @@ import hashlib
 import json
 import math
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from trajectly.core.normalize.version import NORMALIZER_VERSION
@@ -21,6 +21,18 @@ DEFAULT_VOLATILE_KEYS = (
     "updated_at",
 )
 
+_PASSTHROUGH_TYPES = frozenset({str, int, bool, type(None)})
+_NO_KEYS: frozenset[str] = frozenset()
+
+# Shared encoders: json.dumps builds a new JSONEncoder per call when options
+# are passed, so each output format gets one module-level instance.
+# No sort_keys for canonical hashing: `normalize`/`strip_volatile` already emit
+# every mapping with str keys in sorted order, so it would only re-sort.
+_CANONICAL_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=True)
+# Compact, sorted, ASCII lines for every JSONL file trajectly writes: event
+# logs, v0.3 trace lines and SDK event records.
+JSONL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
 
 @dataclass(slots=True, frozen=True)
 class CanonicalNormalizer:
@@ -28,6 +40,13 @@ class CanonicalNormalizer:
     version: str = NORMALIZER_VERSION
     volatile_keys: tuple[str, ...] = DEFAULT_VOLATILE_KEYS
     float_precision: int = 12
+    _volatile_key_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Execute `__post_init__`."""
+        # strip_volatile tests every mapping key; keep that an O(1) set lookup
+        # instead of a scan of the public tuple.
+        object.__setattr__(self, "_volatile_key_set", frozenset(self.volatile_keys))
 
     def _normalize_float(self, value: float) -> float | str:
         """Execute `_normalize_float`."""
@@ -37,20 +56,22 @@ class CanonicalNormalizer:
             return "Infinity" if value > 0 else "-Infinity"
         return round(value, self.float_precision)
 
-    def strip_volatile(self, value: Any) -> Any:
-        # Canonical ordering is required so hashing/signatures stay stable across
-        # Python versions and mapping insertion order differences.
-        """Execute `strip_volatile`."""
+    def _walk(self, value: Any, skip_keys: frozenset[str]) -> Any:
+        """Execute `_walk`."""
+        # Exact JSON scalars are by far the most common nodes and can never be
+        # containers, so they bypass the isinstance chain below.
+        if type(value) in _PASSTHROUGH_TYPES:
+            return value
         if isinstance(value, Mapping):
-            stripped: dict[str, Any] = {}
+            walked: dict[str, Any] = {}
             for key in sorted(value.keys(), key=str):
                 key_text = str(key)
-                if key_text in self.volatile_keys:
+                if key_text in skip_keys:
                     continue
-                stripped[key_text] = self.strip_volatile(value[key])
-            return stripped
+                walked[key_text] = self._walk(value[key], skip_keys)
+            return walked
         if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
-            return [self.strip_volatile(item) for item in value]
+            return [self._walk(item, skip_keys) for item in value]
         if isinstance(value, bytes):
             return value.decode("utf-8", errors="replace")
         if isinstance(value, float):
@@ -59,30 +80,29 @@ class CanonicalNormalizer:
             return value
         return str(value)
 
+    def strip_volatile(self, value: Any) -> Any:
+        # Canonical ordering is required so hashing/signatures stay stable across
+        # Python versions and mapping insertion order differences.
+        """Execute `strip_volatile`."""
+        return self._walk(value, self._volatile_key_set)
+
     def normalize(self, value: Any, *, strip_volatile: bool = True) -> Any:
         """Execute `normalize`."""
-        if strip_volatile:
-            return self.strip_volatile(value)
-        if isinstance(value, Mapping):
-            return {str(k): self.normalize(value[k], strip_volatile=False) for k in sorted(value.keys(), key=str)}
-        if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
-            return [self.normalize(item, strip_volatile=False) for item in value]
-        if isinstance(value, bytes):
-            return value.decode("utf-8", errors="replace")
-        if isinstance(value, float):
-            return self._normalize_float(value)
-        if value is None or isinstance(value, (str, int, bool)):
-            return value
-        return str(value)
+        return self._walk(value, self._volatile_key_set if strip_volatile else _NO_KEYS)
 
     def canonical_dumps(self, value: Any, *, strip_volatile: bool = True) -> str:
         """Execute `canonical_dumps`."""
         normalized = self.normalize(value, strip_volatile=strip_volatile)
-        return json.dumps(normalized, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        return _CANONICAL_ENCODER.encode(normalized)
 
     def sha256(self, value: Any, *, strip_volatile: bool = True) -> str:
         """Execute `sha256`."""
-        digest = hashlib.sha256(self.canonical_dumps(value, strip_volatile=strip_volatile).encode("utf-8"))
+        # Content fingerprint, not a security primitive: flagging it keeps OpenSSL
+        # on its fast path under FIPS-restricted builds. Digests are unchanged.
+        digest = hashlib.sha256(
+            self.canonical_dumps(value, strip_volatile=strip_volatile).encode("utf-8"),
+            usedforsecurity=False,
+        )
         return digest.hexdigest()
 
     def sha256_subset(self, value: Mapping[str, Any], ignored_keys: set[str] | None = None) -> str:
@@ -120,6 +140,7 @@ def sha256_of_subset(value: Mapping[str, Any], ignored_keys: set[str] | None = N
 __all__ = [
     "DEFAULT_CANONICAL_NORMALIZER",
     "DEFAULT_VOLATILE_KEYS",
+    "JSONL_ENCODER",
     "CanonicalNormalizer",
     "canonical_dumps",
     "normalize_for_json",
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Mapping, Sequence
+from functools import lru_cache
 from typing import Any
 
 REDACTION_TOKEN = "[REDACTED]"
@@ -17,20 +18,43 @@ def _redact_string(value: str, patterns: Sequence[re.Pattern[str]]) -> str:
     return redacted
 
 
+@lru_cache(maxsize=256)
+def _compile_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """Execute `_compile_patterns`."""
+    # Patterns stay separate and are applied in order: folding them into one
+    # alternation would renumber backreferences and change overlap handling.
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
 def apply_redactions(value: Any, regex_patterns: Sequence[str]) -> Any:
-    """Execute `apply_redactions`."""
+    """Return `value` with every pattern match in its strings redacted.
+
+    Copy-on-write: any subtree with nothing to redact is returned as the same
+    object (``dict``s with only ``str`` keys and ``list``s included), so callers
+    can detect an untouched payload by identity. With no patterns the input is
+    returned unchanged.
+    """
     if not regex_patterns:
         return value
-    compiled = [re.compile(pattern) for pattern in regex_patterns]
+    compiled = _compile_patterns(tuple(regex_patterns))
 
     def walk(node: Any) -> Any:
         """Execute `walk`."""
         if isinstance(node, str):
+            # re.sub hands back the same str object when nothing matched.
             return _redact_string(node, compiled)
         if isinstance(node, Mapping):
-            return {str(key): walk(v) for key, v in node.items()}
+            rebuilt = {str(key): walk(v) for key, v in node.items()}
+            if type(node) is dict and all(
+                type(key) is str and rebuilt[key] is child for key, child in node.items()
+            ):
+                return node
+            return rebuilt
         if isinstance(node, Sequence) and not isinstance(node, (str, bytes, bytearray)):
-            return [walk(item) for item in node]
+            items = [walk(item) for item in node]
+            if type(node) is list and all(new is old for new, old in zip(items, node, strict=True)):
+                return node
+            return items
         return node
 
     return walk(value)
@@ -17,6 +17,7 @@ the only active obligations).
 
 from __future__ import annotations
 
+from collections.abc import Sequence, Set
 from dataclasses import dataclass, field
 
 from trajectly.core.constants import FAILURE_CLASS_REFINEMENT
@@ -53,7 +54,10 @@ def _is_subsequence_with_matches(
     baseline_idx = 0
     current_idx = 0
 
-    while baseline_idx < len(baseline_names) and current_idx < len(current_names):
+    baseline_len = len(baseline_names)
+    current_len = len(current_names)
+
+    while baseline_idx < baseline_len and current_idx < current_len:
         if baseline_names[baseline_idx] == current_names[current_idx]:
             matches.append(current_idx)
             baseline_idx += 1
@@ -61,7 +65,7 @@ def _is_subsequence_with_matches(
             continue
         current_idx += 1
 
-    if baseline_idx == len(baseline_names):
+    if baseline_idx == baseline_len:
         return True, matches, None
 
     return False, matches, baseline_names[baseline_idx]
@@ -69,10 +73,10 @@ def _is_subsequence_with_matches(
 
 def check_skeleton_refinement(
     *,
-    baseline_steps: list[SkeletonStep],
-    current_steps: list[SkeletonStep],
+    baseline_steps: Sequence[SkeletonStep],
+    current_steps: Sequence[SkeletonStep],
     policy: RefinementPolicy,
-    side_effect_tools: set[str],
+    side_effect_tools: Set[str],
 ) -> RefinementCheckResult:
     """Execute `check_skeleton_refinement`."""
     if policy.mode == "none":
@@ -102,10 +106,18 @@ def check_skeleton_refinement(
             )
         )
 
+    if len(matched_indices) == len(current_steps):
+        return RefinementCheckResult(violations=violations, refinement_skeleton_vacuous=False)
+
     matched_set = set(matched_indices)
     baseline_tool_set = set(baseline_names)
     allowed_extra_tools = set(policy.allow_extra_tools)
     allowed_extra_side_effect = set(policy.allow_extra_side_effect_tools)
+    # Sorted `expected` payloads are identical for every extra call, so they
+    # are built once rather than re-sorted per violation.
+    expected_extra_tools = sorted(allowed_extra_tools)
+    expected_extra_side_effect = sorted(allowed_extra_side_effect)
+    expected_tool_names = sorted(baseline_tool_set.union(allowed_extra_tools))
 
     for index, step in enumerate(current_steps):
         # Extra calls are evaluated against both generic allow-lists and
@@ -121,7 +133,7 @@ def check_skeleton_refinement(
                     message=f"Extra tool call not allowed by refinement policy: {tool_name}",
                     failure_class=FAILURE_CLASS_REFINEMENT,
                     event_index=step.event_index,
-                    expected=sorted(allowed_extra_tools),
+                    expected=expected_extra_tools,
                     observed=tool_name,
                     hint="Add tool to refinement.allow_extra_tools or remove the extra call.",
                 )
@@ -134,7 +146,7 @@ def check_skeleton_refinement(
                     message=f"Extra side-effect tool call not allowed: {tool_name}",
                     failure_class=FAILURE_CLASS_REFINEMENT,
                     event_index=step.event_index,
-                    expected=sorted(allowed_extra_side_effect),
+                    expected=expected_extra_side_effect,
                     observed=tool_name,
                     hint="Allow explicitly via refinement.allow_extra_side_effect_tools.",
                 )
@@ -151,7 +163,7 @@ def check_skeleton_refinement(
                     message=f"New tool name not permitted by refinement policy: {tool_name}",
                     failure_class=FAILURE_CLASS_REFINEMENT,
                     event_index=step.event_index,
-                    expected=sorted(baseline_tool_set.union(allowed_extra_tools)),
+                    expected=expected_tool_names,
                     observed=tool_name,
                     hint="Set refinement.allow_new_tool_names=true or update allow_extra_tools.",
                 )
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from trajectly.core.abstraction.pipeline import AbstractTrace
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class SkeletonStep:
     """Represent `SkeletonStep`."""
     event_index: int
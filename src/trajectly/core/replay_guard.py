@@ -18,8 +18,8 @@ class NetworkBlockedError(RuntimeError):
 
 
 _PATCHED = False
-_ALLOWLIST: tuple[str, ...] = ()
-_SUBPROCESS_ALLOWLIST: tuple[str, ...] = ()
+_ALLOWLIST: frozenset[str] = frozenset()
+_SUBPROCESS_ALLOWLIST: frozenset[str] = frozenset()
 _SUBPROCESS_DENYLIST = ("curl", "wget", "http", "https", "nc", "ncat", "telnet")
 
 _ORIGINAL_CREATE_CONNECTION: Any = socket.create_connection
@@ -90,9 +90,16 @@ def _allowed(address: Any) -> bool:
     host = _extract_host(address)
     if not host:
         return False
-    for allowed_host in _ALLOWLIST:
-        if host == allowed_host or host.endswith(f".{allowed_host}"):
+    # `host` is allowed when it, or any suffix following one of its dots,
+    # is an allowlisted host; probing those suffixes against the set costs
+    # one lookup per label instead of one comparison per allowlist entry.
+    if host in _ALLOWLIST:
+        return True
+    dot = host.find(".")
+    while dot != -1:
+        if host[dot + 1 :] in _ALLOWLIST:
             return True
+        dot = host.find(".", dot + 1)
     return False
 
 
@@ -244,13 +251,16 @@ def activate() -> None:
     global _HTTPX_CLIENT_REQUEST
     global _HTTPX_ASYNC_CLIENT_REQUEST
     global _WEBSOCKET_CREATE_CONNECTION
+    # Idempotent, and deliberately process-global: the guard patches shared
+    # modules in place, so it is installed once per replay subprocess and
+    # must not be toggled concurrently from several threads.
     if _PATCHED:
         return
 
     allowlist = os.getenv("TRAJECTLY_NETWORK_ALLOWLIST", "")
-    _ALLOWLIST = tuple(host.strip().lower() for host in allowlist.split(",") if host.strip())
+    _ALLOWLIST = frozenset(host.strip().lower() for host in allowlist.split(",") if host.strip())
     subprocess_allowlist = os.getenv("TRAJECTLY_SUBPROCESS_ALLOWLIST", "")
-    _SUBPROCESS_ALLOWLIST = tuple(
+    _SUBPROCESS_ALLOWLIST = frozenset(
         name.strip().lower()
         for name in subprocess_allowlist.split(",")
         if name.strip()
@@ -6,12 +6,15 @@ import json
 import os
 import subprocess
 import time
+from collections.abc import Callable
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from trajectly.core.specs import AgentSpec
 from trajectly.core.trace.meta import default_trace_meta_path, default_trace_path
 
+CommandRunner = Callable[..., subprocess.CompletedProcess[str]]
+
 
 @dataclass(slots=True)
 class ExecutionResult:
@@ -57,8 +60,14 @@ def execute_spec(
     clock_seed: float | None = None,
     random_seed: int | None = None,
     project_root: Path | None = None,
+    *,
+    runner: CommandRunner = subprocess.run,
 ) -> ExecutionResult:
-    """Execute one spec command with Trajectly runtime environment wiring."""
+    """Execute one spec command with Trajectly runtime environment wiring.
+
+    ``runner`` is called with ``subprocess.run`` keyword arguments; tests can
+    pass an in-process stand-in to inspect the wiring without spawning a shell.
+    """
     events_path.parent.mkdir(parents=True, exist_ok=True)
     if events_path.exists():
         events_path.unlink()
@@ -113,7 +122,7 @@ def execute_spec(
 
     start = time.monotonic()
     try:
-        completed = subprocess.run(
+        completed = runner(
             spec.command,
             shell=True,
             cwd=str(spec.resolved_workdir()),
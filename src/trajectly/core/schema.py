@@ -10,6 +10,11 @@ from trajectly.core.constants import (
     TRT_NORMALIZER_VERSION,
     TRT_TRACE_SCHEMA_VERSION,
 )
+from trajectly.core.errors import (
+    ERROR_CODE_SCHEMA_INVALID,
+    ERROR_CODE_SCHEMA_VERSION_MISSING,
+    ERROR_CODE_SCHEMA_VERSION_UNSUPPORTED,
+)
 from trajectly.core.trace.validate import TraceValidationError, validate_trace_event_v03, validate_trace_meta_v03
 
 SUPPORTED_TRACE_SCHEMA_VERSIONS = {SCHEMA_VERSION}
@@ -18,8 +23,16 @@ SUPPORTED_TRAJECTORY_JSON_SCHEMA_VERSIONS = {TRT_TRACE_SCHEMA_VERSION}
 
 
 class SchemaValidationError(ValueError):
-    """Represent `SchemaValidationError`."""
-    pass
+    """Represent `SchemaValidationError`.
+
+    ``code`` is one of the ``ERROR_CODE_SCHEMA_*`` constants, so callers can
+    branch on the failure kind without matching the message text.
+    """
+
+    def __init__(self, message: str, *, code: str = ERROR_CODE_SCHEMA_INVALID) -> None:
+        """Execute `__init__`."""
+        super().__init__(message)
+        self.code = code
 
 
 def _unsupported_version_message(kind: str, version: str, supported: set[str]) -> str:
@@ -42,11 +55,17 @@ def _normalize_schema_version(
     if value is None:
         if allow_missing:
             return SCHEMA_VERSION
-        raise SchemaValidationError(f"Missing required {kind} schema_version")
+        raise SchemaValidationError(
+            f"Missing required {kind} schema_version",
+            code=ERROR_CODE_SCHEMA_VERSION_MISSING,
+        )
 
     version = str(value)
     if version not in supported:
-        raise SchemaValidationError(_unsupported_version_message(kind, version, supported))
+        raise SchemaValidationError(
+            _unsupported_version_message(kind, version, supported),
+            code=ERROR_CODE_SCHEMA_VERSION_UNSUPPORTED,
+        )
     return version
 
 
@@ -55,12 +74,18 @@ def validate_trace_event_dict(data: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(data, dict):
         raise SchemaValidationError("Trace event must be an object")
 
-    schema_version = _normalize_schema_version(
-        data.get("schema_version"),
-        kind="trace",
-        supported=SUPPORTED_TRACE_SCHEMA_VERSIONS,
-        allow_missing=True,
-    )
+    raw_version = data.get("schema_version")
+    if raw_version is None or raw_version == SCHEMA_VERSION:
+        # Common case: hand back the interned constant so parsed events share
+        # one version string instead of each keeping its own decoded copy.
+        schema_version = SCHEMA_VERSION
+    else:
+        schema_version = _normalize_schema_version(
+            raw_version,
+            kind="trace",
+            supported=SUPPORTED_TRACE_SCHEMA_VERSIONS,
+            allow_missing=True,
+        )
 
     event_type = data.get("event_type")
     if not isinstance(event_type, str) or not event_type:
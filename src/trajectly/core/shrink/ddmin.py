@@ -44,6 +44,12 @@ def ddmin_shrink(
 
     started = monotonic()
     current = list(events)
+    # Positions of ``current`` in ``events``. Candidates are always
+    # subsequences of the input, so the position tuple identifies one
+    # exactly; verdicts are kept so a candidate reached again through a
+    # different chunking is not re-evaluated.
+    current_ids = list(range(len(events)))
+    verdicts: dict[tuple[int, ...], bool] = {}
     granularity = 2
     iterations = 0
 
@@ -61,13 +67,18 @@ def ddmin_shrink(
                 break
 
             end = min(len(current), start + chunk_size)
-            candidate = [*current[:start], *current[end:]]
-            if not candidate:
+            candidate_ids = (*current_ids[:start], *current_ids[end:])
+            if not candidate_ids:
                 continue
 
-            iterations += 1
-            if failure_predicate(candidate):
-                current = candidate
+            verdict = verdicts.get(candidate_ids)
+            if verdict is None:
+                iterations += 1
+                verdict = failure_predicate([*current[:start], *current[end:]])
+                verdicts[candidate_ids] = verdict
+            if verdict:
+                current = [*current[:start], *current[end:]]
+                current_ids = list(candidate_ids)
                 granularity = max(2, granularity - 1)
                 reduced_this_round = True
                 break
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import copy
 import glob
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -17,22 +19,11 @@ from trajectly.core.specs.compat_v02 import (
     ToolContracts,
 )
 from trajectly.core.specs.v03 import AgentSpec, parse_spec_with_compat
+from trajectly.core.specs.yaml_io import load_yaml_mapping
 
 _MAX_EXTENDS_DEPTH = 10
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    """Execute `_load_yaml`."""
-    import yaml
-
-    loaded = yaml.safe_load(path.read_text(encoding="utf-8"))
-    if loaded is None:
-        return {}
-    if not isinstance(loaded, dict):
-        raise ValueError(f"Spec file must be a mapping: {path}")
-    return loaded
-
-
 def deep_merge(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str, Any]:
     """Deterministic deep-merge: dicts merge recursively, lists/scalars override."""
     merged = dict(base)
@@ -59,14 +50,28 @@ def _resolve_extends(data: dict[str, Any], source_path: Path, depth: int = 0) ->
     if not extends_path.exists():
         raise ValueError(f"extends target not found: {extends_path}")
 
-    base_data = _load_yaml(extends_path)
+    stat = extends_path.stat()
+    # The cached mapping is shared between callers; resolve and merge a
+    # private copy so each ancestor is re-checked against its own stat.
+    base_data = copy.deepcopy(_load_base_yaml(extends_path, stat.st_mtime_ns, stat.st_size))
     base_data = _resolve_extends(base_data, extends_path, depth + 1)
     return deep_merge(base_data, data)
 
 
+@lru_cache(maxsize=128)
+def _load_base_yaml(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Execute `_load_base_yaml`.
+
+    Memoizes the raw parsed YAML of an ``extends`` target so sibling specs
+    sharing a base parse it once; the mtime and size in the key drop stale
+    entries when the file changes.
+    """
+    return load_yaml_mapping(path)
+
+
 def load_spec(path: Path) -> AgentSpec:
     """Execute `load_spec`."""
-    data = _load_yaml(path)
+    data = load_yaml_mapping(path)
     data = _resolve_extends(data, path.resolve())
     return parse_spec_with_compat(data, source_path=path.resolve())
 
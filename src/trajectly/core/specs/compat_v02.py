@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal, cast
@@ -134,6 +135,18 @@ def _parse_string_list(raw: Any, *, field_name: str) -> list[str]:
     return [str(item) for item in raw]
 
 
+def _validate_regex_patterns(patterns: list[str], *, field_name: str) -> list[str]:
+    """Execute `_validate_regex_patterns`."""
+    # Fail at load time rather than mid-run; re's own cache keeps the compiled
+    # patterns warm for the redaction and data-leak passes.
+    for pattern in patterns:
+        try:
+            re.compile(pattern)
+        except re.error as exc:
+            raise ValueError(f"{field_name} has invalid regex {pattern!r}: {exc}") from exc
+    return patterns
+
+
 def _parse_budget_thresholds(raw: Any) -> BudgetThresholds:
     """Execute `_parse_budget_thresholds`."""
     if raw is None:
@@ -288,8 +301,11 @@ def parse_contracts_v1(raw: Any) -> AgentContracts:
                 data_leak_raw.get("outbound_kinds"),
                 field_name="contracts.data_leak.outbound_kinds",
             ),
-            secret_patterns=_parse_string_list(
-                data_leak_raw.get("secret_patterns"),
+            secret_patterns=_validate_regex_patterns(
+                _parse_string_list(
+                    data_leak_raw.get("secret_patterns"),
+                    field_name="contracts.data_leak.secret_patterns",
+                ),
                 field_name="contracts.data_leak.secret_patterns",
             ),
         ),
@@ -326,7 +342,7 @@ def parse_v02_spec(data: dict[str, Any], *, source_path: Path, schema_version: s
         env={str(k): str(v) for k, v in raw_env.items()},
         fixture_policy=parsed_policy,
         strict=bool(data.get("strict", False)),
-        redact=[str(pattern) for pattern in raw_redact],
+        redact=_validate_regex_patterns([str(pattern) for pattern in raw_redact], field_name="redact"),
         budget_thresholds=_parse_budget_thresholds(data.get("budget_thresholds")),
         contracts=parse_contracts_v1(data.get("contracts")),
         replay=ReplayConfig(fixture_policy=parsed_policy, strict_sequence=bool(data.get("strict", False))),
@@ -11,6 +11,7 @@ import yaml
 from trajectly.core.constants import TRT_SPEC_SCHEMA_VERSION
 from trajectly.core.specs import load_spec
 from trajectly.core.specs.v03 import AgentSpec, parse_spec_with_compat
+from trajectly.core.specs.yaml_io import YAML_SAFE_DUMPER, YAML_SAFE_LOADER
 
 
 def _omit_none(value: dict[str, Any]) -> dict[str, Any]:
@@ -91,12 +92,12 @@ def migrate_spec_file(
     try:
         spec = load_spec(source)
     except ValueError:
-        payload = yaml.safe_load(source.read_text(encoding="utf-8"))
+        payload = yaml.load(source.read_text(encoding="utf-8"), Loader=YAML_SAFE_LOADER)
         if not isinstance(payload, dict):
             raise
         spec = parse_spec_with_compat(payload, source_path=source, allow_legacy=True)
     payload = spec_to_v03_payload(spec)
-    rendered = yaml.safe_dump(payload, sort_keys=False, default_flow_style=False)
+    rendered = yaml.dump(payload, Dumper=YAML_SAFE_DUMPER, sort_keys=False, default_flow_style=False)
 
     if in_place:
         destination = source
@@ -7,16 +7,16 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal, cast
 
-import yaml
-
 from trajectly.core.constants import TRT_SPEC_SCHEMA_VERSION
 from trajectly.core.specs.compat_v02 import (
     AgentContracts,
     BudgetThresholds,
     FixturePolicy,
+    _validate_regex_patterns,
     parse_contracts_v1,
     parse_v02_spec,
 )
+from trajectly.core.specs.yaml_io import load_yaml_mapping
 
 ModeProfile = Literal["ci_safe", "permissive", "strict"]
 ReplayMode = Literal["offline", "online"]
@@ -120,16 +120,6 @@ class AgentSpec:
         return (self.source_path.parent / candidate).resolve()
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    """Execute `_load_yaml`."""
-    loaded = yaml.safe_load(path.read_text(encoding="utf-8"))
-    if loaded is None:
-        return {}
-    if not isinstance(loaded, dict):
-        raise ValueError(f"Spec file must be a mapping: {path}")
-    return loaded
-
-
 def _parse_string_list(raw: Any, *, field_name: str) -> list[str]:
     """Execute `_parse_string_list`."""
     if raw is None:
@@ -298,7 +288,7 @@ def _load_contracts_from_config(source_path: Path, config_path: str) -> tuple[st
     if not resolved.exists():
         raise ValueError(f"contracts.config not found: {resolved}")
 
-    payload = _load_yaml(resolved)
+    payload = load_yaml_mapping(resolved)
     if "contracts" in payload:
         contracts_raw = payload.get("contracts")
     else:
@@ -414,7 +404,7 @@ def parse_v03_spec(data: dict[str, Any], *, source_path: Path) -> AgentSpec:
         env={str(k): str(v) for k, v in raw_env.items()},
         fixture_policy=parsed_policy,
         strict=strict_raw,
-        redact=[str(pattern) for pattern in raw_redact],
+        redact=_validate_regex_patterns([str(pattern) for pattern in raw_redact], field_name="redact"),
         budget_thresholds=_parse_budget_thresholds(data.get("budget_thresholds")),
         contracts=contracts,
         baseline_trace=str(baseline_trace_raw) if baseline_trace_raw is not None else None,
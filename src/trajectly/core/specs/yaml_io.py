@@ -0,0 +1,31 @@
+"""Core implementation module: trajectly/core/specs/yaml_io.py."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# libyaml's C loader and dumper accept the same safe subset as
+# ``yaml.safe_load``/``yaml.safe_dump`` and run several times faster; PyYAML
+# builds without libyaml lack them.
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_SAFE_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def load_yaml_mapping(path: Path) -> dict[str, Any]:
+    """Execute `load_yaml_mapping`."""
+    loaded = yaml.load(path.read_text(encoding="utf-8"), Loader=YAML_SAFE_LOADER)
+    if loaded is None:
+        return {}
+    if not isinstance(loaded, dict):
+        raise ValueError(f"Spec file must be a mapping: {path}")
+    return loaded
+
+
+__all__ = [
+    "YAML_SAFE_DUMPER",
+    "YAML_SAFE_LOADER",
+    "load_yaml_mapping",
+]
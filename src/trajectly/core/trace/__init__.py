@@ -5,6 +5,7 @@ from trajectly.core.trace.io import (
     read_legacy_trajectory,
     read_trace_events,
     read_trace_meta,
+    read_trace_meta_version,
     read_trajectory_json,
     write_trace_events,
     write_trace_meta,
@@ -26,6 +27,7 @@ __all__ = [
     "read_legacy_trajectory",
     "read_trace_events",
     "read_trace_meta",
+    "read_trace_meta_version",
     "read_trajectory_json",
     "validate_trace_event_v03",
     "validate_trace_meta_v03",
@@ -6,6 +6,7 @@ import json
 from pathlib import Path
 from typing import Any
 
+from trajectly.core.normalize.canonical import JSONL_ENCODER
 from trajectly.core.trace.meta import default_trace_meta_path
 from trajectly.core.trace.models import TraceEventV03, TraceMetaV03, TrajectoryV03
 from trajectly.core.trace.validate import validate_trace_event_v03, validate_trace_meta_v03
@@ -17,8 +18,7 @@ def append_trace_event(path: Path, event: TraceEventV03 | dict[str, Any]) -> Non
     raw = event.to_dict() if isinstance(event, TraceEventV03) else event
     validated = validate_trace_event_v03(raw)
     with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(validated, sort_keys=True, separators=(",", ":"), ensure_ascii=True))
-        handle.write("\n")
+        handle.write(JSONL_ENCODER.encode(validated) + "\n")
 
 
 def write_trace_events(path: Path, events: list[TraceEventV03 | dict[str, Any]]) -> None:
@@ -28,8 +28,7 @@ def write_trace_events(path: Path, events: list[TraceEventV03 | dict[str, Any]])
         for event in events:
             raw = event.to_dict() if isinstance(event, TraceEventV03) else event
             validated = validate_trace_event_v03(raw)
-            handle.write(json.dumps(validated, sort_keys=True, separators=(",", ":"), ensure_ascii=True))
-            handle.write("\n")
+            handle.write(JSONL_ENCODER.encode(validated) + "\n")
 
 
 def read_trace_events(path: Path) -> list[TraceEventV03]:
@@ -69,6 +68,21 @@ def read_trace_meta(path: Path) -> TraceMetaV03:
     )
 
 
+def read_trace_meta_version(path: Path) -> str:
+    """Return only the top-level ``normalizer_version`` of a trace meta file.
+
+    Skips full meta validation so callers that only gate on the normalizer
+    version can report a mismatch instead of a generic validation error.
+    """
+    raw = json.loads(path.read_bytes())
+    if not isinstance(raw, dict):
+        raise ValueError("Trace meta payload must be an object")
+    version = raw.get("normalizer_version")
+    if not isinstance(version, str):
+        raise ValueError("Trace meta requires string field `normalizer_version`")
+    return version
+
+
 def write_trajectory_json(path: Path, trajectory: TrajectoryV03 | dict[str, Any]) -> None:
     """Write a bundled trajectory JSON artifact for platform ingestion."""
 
@@ -87,7 +101,13 @@ def read_trajectory_json(path: Path) -> TrajectoryV03:
 
     raw = json.loads(path.read_text(encoding="utf-8"))
     validated = validate_trajectory_json_dict(raw)
-    return TrajectoryV03.from_dict(validated)
+    # Every field was just checked at the ingest boundary; build the models
+    # directly instead of re-running the same checks in ``from_dict``.
+    return TrajectoryV03(
+        schema_version=validated["schema_version"],
+        meta=TraceMetaV03(**validated["meta"]),
+        events=[TraceEventV03(**event) for event in validated["events"]],
+    )
 
 
 def read_legacy_trajectory(trace_path: Path, meta_path: Path | None = None) -> TrajectoryV03:
@@ -104,6 +124,7 @@ __all__ = [
     "read_legacy_trajectory",
     "read_trace_events",
     "read_trace_meta",
+    "read_trace_meta_version",
     "read_trajectory_json",
     "write_trace_events",
     "write_trace_meta",
@@ -25,9 +25,9 @@ from dataclasses import dataclass, field
 from typing import Any, Literal, cast
 
 from trajectly.core.abstraction.pipeline import AbstractionConfig, AbstractTrace, build_abstract_trace
-from trajectly.core.constants import FAILURE_CLASS_CONTRACT, SIDE_EFFECT_TOOL_REGISTRY_V1
+from trajectly.core.constants import FAILURE_CLASS_CONTRACT, SIDE_EFFECT_TOOL_SET
 from trajectly.core.contracts import evaluate_contracts
-from trajectly.core.errors import FailureClass
+from trajectly.core.errors import VALID_FAILURE_CLASSES, FailureClass
 from trajectly.core.events import TraceEvent
 from trajectly.core.refinement.checker import RefinementPolicy, check_skeleton_refinement
 from trajectly.core.refinement.skeleton import extract_call_skeleton
@@ -38,8 +38,6 @@ from trajectly.core.trt.witness import WitnessResolution, resolve_witness
 
 TRTStatus = Literal["PASS", "FAIL", "ERROR"]
 
-_VALID_FAILURE_CLASSES = {"REFINEMENT", "CONTRACT", "TOOLING"}
-
 
 @dataclass(slots=True)
 class TRTResult:
@@ -218,7 +216,7 @@ def _to_report(
     if witness is not None:
         primary_failure_class = (
             witness.primary_violation.failure_class
-            if witness.primary_violation.failure_class in _VALID_FAILURE_CLASSES
+            if witness.primary_violation.failure_class in VALID_FAILURE_CLASSES
             else "TOOLING"
         )
         report.witness_index = witness.witness_index
@@ -238,7 +236,7 @@ def _to_report(
                 message=violation.message,
                 failure_class=cast(
                     FailureClass,
-                    violation.failure_class if violation.failure_class in _VALID_FAILURE_CLASSES else "TOOLING",
+                    violation.failure_class if violation.failure_class in VALID_FAILURE_CLASSES else "TOOLING",
                 ),
                 event_index=violation.event_index,
                 expected=violation.expected,
@@ -268,20 +266,20 @@ def evaluate_trt(
         current_abstract=current_abs,
         spec=spec,
     )
-    side_effect_tools = set(SIDE_EFFECT_TOOL_REGISTRY_V1)
     refinement_policy = RefinementPolicy(
         mode=spec.refinement.mode,
         allow_extra_tools=spec.refinement.allow_extra_tools,
         allow_extra_side_effect_tools=spec.refinement.allow_extra_side_effect_tools,
         allow_new_tool_names=spec.refinement.allow_new_tool_names,
     )
-    baseline_steps = extract_call_skeleton(baseline_abs, ignore_call_tools=set(spec.refinement.ignore_call_tools))
-    current_steps = extract_call_skeleton(current_abs, ignore_call_tools=set(spec.refinement.ignore_call_tools))
+    ignore_call_tools = set(spec.refinement.ignore_call_tools)
+    baseline_steps = extract_call_skeleton(baseline_abs, ignore_call_tools=ignore_call_tools)
+    current_steps = extract_call_skeleton(current_abs, ignore_call_tools=ignore_call_tools)
     refinement_result = check_skeleton_refinement(
         baseline_steps=baseline_steps,
         current_steps=current_steps,
         policy=refinement_policy,
-        side_effect_tools=side_effect_tools,
+        side_effect_tools=SIDE_EFFECT_TOOL_SET,
     )
 
     all_violations = [*refinement_result.violations, *contract_violations]
@@ -26,12 +26,17 @@ class WitnessResolution:
     all_violations_at_witness: list[TRTViolation]
 
 
+_CLASS_RANK = {value: idx for idx, value in enumerate(WITNESS_FAILURE_CLASS_ORDER)}
+
+
 def _class_rank(failure_class: str) -> int:
     """Execute `_class_rank`."""
-    for idx, value in enumerate(WITNESS_FAILURE_CLASS_ORDER):
-        if value == failure_class:
-            return idx
-    return len(WITNESS_FAILURE_CLASS_ORDER)
+    return _CLASS_RANK.get(failure_class, len(WITNESS_FAILURE_CLASS_ORDER))
+
+
+def _tie_break_key(violation: TRTViolation) -> tuple[int, str]:
+    """Execute `_tie_break_key`."""
+    return _class_rank(violation.failure_class), violation.code
 
 
 def resolve_witness(violations: list[TRTViolation]) -> WitnessResolution | None:
@@ -42,8 +47,10 @@ def resolve_witness(violations: list[TRTViolation]) -> WitnessResolution | None:
     witness_index = min(violation.event_index for violation in violations)
     at_witness = [violation for violation in violations if violation.event_index == witness_index]
     # Deterministic tie-break policy is contractually stable: class rank first,
-    # then lexical code order within class.
-    at_witness.sort(key=lambda item: (_class_rank(item.failure_class), item.code))
+    # then lexical code order within class. Only the violations at the witness
+    # index are ordered; the full list is reduced with linear scans.
+    if len(at_witness) > 1:
+        at_witness.sort(key=_tie_break_key)
     return WitnessResolution(
         witness_index=witness_index,
         primary_violation=at_witness[0],
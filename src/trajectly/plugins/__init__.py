@@ -1,6 +1,6 @@
 """Plugin module: trajectly/plugins/__init__.py."""
 
 from trajectly.plugins.interfaces import RunHookPlugin, SemanticDiffPlugin
-from trajectly.plugins.loader import run_run_hooks, run_semantic_plugins
+from trajectly.plugins.loader import reset_plugin_cache, run_run_hooks, run_semantic_plugins
 
-__all__ = ["RunHookPlugin", "SemanticDiffPlugin", "run_run_hooks", "run_semantic_plugins"]
+__all__ = ["RunHookPlugin", "SemanticDiffPlugin", "reset_plugin_cache", "run_run_hooks", "run_semantic_plugins"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from importlib.metadata import entry_points
 from pathlib import Path
 from typing import Any
@@ -11,12 +12,18 @@ from trajectly.events import TraceEvent
 from trajectly.plugins.interfaces import RunHookPlugin, SemanticDiffPlugin
 
 
-def _load_group(group: str) -> list[Any]:
+@cache
+def _load_group(group: str) -> tuple[Any, ...]:
     """Execute `_load_group`."""
-    loaded: list[Any] = []
-    for entry in entry_points().select(group=group):
-        loaded.append(entry.load())
-    return loaded
+    # Scanning installed distributions for entry points is slow and the set
+    # cannot change under a running process without a reinstall, so each
+    # group is resolved once. Call `reset_plugin_cache` to force a rescan.
+    return tuple(entry.load() for entry in entry_points().select(group=group))
+
+
+def reset_plugin_cache() -> None:
+    """Drop cached plugin entry points so the next run rescans them."""
+    _load_group.cache_clear()
 
 
 def run_semantic_plugins(
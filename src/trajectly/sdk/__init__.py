@@ -48,10 +48,11 @@ def tool(
 
             return async_wrapper
 
-        @wraps(fn)
+        sync_fn = cast(Callable[..., T], fn)
+
+        @wraps(sync_fn)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             """Execute `wrapper`."""
-            sync_fn = cast(Callable[..., T], fn)
             return get_context().invoke_tool(tool_name, sync_fn, args, kwargs)
 
         return wrapper
@@ -84,10 +85,11 @@ def llm_call(
 
             return async_wrapper
 
-        @wraps(fn)
+        sync_fn = cast(Callable[..., T], fn)
+
+        @wraps(sync_fn)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             """Execute `wrapper`."""
-            sync_fn = cast(Callable[..., T], fn)
             return get_context().invoke_llm(provider=provider, model=model, fn=sync_fn, args=args, kwargs=kwargs)
 
         return wrapper
@@ -9,6 +9,8 @@ from trajectly.sdk.context import get_context
 
 T = TypeVar("T")
 
+_MISSING = object()
+
 
 class SDKContextLike(Protocol):
     """Minimal protocol required by adapter helpers."""
@@ -65,7 +67,9 @@ def _resolve_context(context: SDKContextLike | None) -> SDKContextLike:
 
 def _as_mapping(value: Any) -> Mapping[str, Any] | None:
     """Convert mapping-like objects to ``Mapping[str, Any]`` when possible."""
-    if isinstance(value, Mapping):
+    # Plain dicts are the common SDK payload; an exact type check skips the
+    # ABC machinery behind ``isinstance(value, Mapping)``.
+    if type(value) is dict or isinstance(value, Mapping):
         return cast(Mapping[str, Any], value)
     if hasattr(value, "__dict__"):
         raw = cast(dict[str, Any], vars(value))
@@ -93,10 +97,11 @@ def _resolve_nested_attribute(root: Any, segments: tuple[str, ...], label: str)
     """Resolve nested object attributes and raise a clear adapter error."""
     current = root
     for segment in segments:
-        if not hasattr(current, segment):
+        # One getattr per segment; hasattr followed by getattr resolved each twice.
+        current = getattr(current, segment, _MISSING)
+        if current is _MISSING:
             joined = ".".join(segments)
             raise ValueError(f"{label} client must expose `{joined}`")
-        current = getattr(current, segment)
     return current
 
 
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any, TypeVar, cast
 
 from trajectly.constants import TRT_TRACE_SCHEMA_VERSION
+from trajectly.core.normalize.canonical import JSONL_ENCODER
 from trajectly.fixtures import (
     FixtureExhaustedError,
     FixtureLookupError,
@@ -146,6 +147,7 @@ class SDKContext:
         self._matcher: FixtureMatcher | None = None
         self._tool_calls_total = 0
         self._trace_event_index = 0
+        self._events_dir_ready = False
         self._normalizer = DEFAULT_CANONICAL_NORMALIZER
 
         if settings.mode == "replay" and settings.fixtures_path and settings.fixtures_path.exists():
@@ -632,21 +634,28 @@ class SDKContext:
 
     def _emit(self, event_type: str, payload: dict[str, Any], meta: dict[str, Any] | None = None) -> None:
         """Write JSON event records and normalized trace events atomically."""
-        safe_payload = self._safe(payload)
-        safe_meta = self._safe(meta or {})
         record = {
             "event_type": event_type,
             "rel_ms": int((time.monotonic() - self._start) * 1000),
-            "payload": safe_payload,
-            "meta": safe_meta,
+            "payload": payload,
+            "meta": meta or {},
         }
+        # The record is serialized once; that same pass doubles as the
+        # JSON-safety probe for its payload.
+        try:
+            line = JSONL_ENCODER.encode(record)
+        except TypeError:
+            record["payload"] = self._safe(payload)
+            record["meta"] = self._safe(record["meta"])
+            line = JSONL_ENCODER.encode(record)
+        safe_payload = record["payload"]
         with self._lock:
             if self._settings.events_path is not None:
-                line = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-                self._settings.events_path.parent.mkdir(parents=True, exist_ok=True)
+                if not self._events_dir_ready:
+                    self._settings.events_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._events_dir_ready = True
                 with self._settings.events_path.open("a", encoding="utf-8") as handle:
-                    handle.write(line)
-                    handle.write("\n")
+                    handle.write(line + "\n")
 
             trace_kind = _EVENT_TYPE_TO_TRACE_KIND.get(event_type)
             if trace_kind is not None and self._settings.trace_path is not None:
@@ -7,7 +7,9 @@ from pathlib import Path
 
 from typer.testing import CliRunner
 
+from trajectly import __version__
 from trajectly.cli import app
+from trajectly.cli.engine import discover_spec_files
 
 runner = CliRunner()
 
@@ -168,8 +170,6 @@ class TestCliSmoke:
         assert run.exit_code == 0
 
     def test_version_flag(self) -> None:
-        from trajectly import __version__
-
         result = runner.invoke(app, ["--version"])
         assert result.exit_code == 0
         assert __version__ in result.output
@@ -177,8 +177,6 @@ class TestCliSmoke:
 
     def test_spec_discovery_ordering_deterministic(self, tmp_path: Path) -> None:
         """discover_spec_files returns sorted paths regardless of creation order."""
-        from trajectly.cli.engine import discover_spec_files
-
         specs_dir = tmp_path / "specs"
         specs_dir.mkdir()
         for name in ["zebra.agent.yaml", "alpha.agent.yaml", "middle.agent.yaml"]:
@@ -0,0 +1,30 @@
+"""Lightweight event builders for evaluator-focused unit tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from trajectly.events import TraceEvent
+
+
+def fake_event(
+    event_type: str,
+    seq: int,
+    run_id: str,
+    rel_ms: int,
+    payload: dict[str, Any],
+    meta: dict[str, Any] | None = None,
+) -> TraceEvent:
+    """Build a `TraceEvent` without validation or event-id hashing.
+
+    Use only where the code under test reads ``event_type``/``payload``;
+    tests covering event identity or serialization should keep ``make_event``.
+    """
+    return TraceEvent(
+        event_type=event_type,
+        seq=seq,
+        run_id=run_id,
+        rel_ms=rel_ms,
+        payload=payload,
+        meta=meta or {},
+    )
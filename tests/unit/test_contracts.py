@@ -44,12 +44,14 @@ def test_evaluate_contracts_reports_tool_contract_violations() -> None:
     )
 
     findings = evaluate_contracts(current=events, contracts=contracts)
-    classifications = [finding.classification for finding in findings]
+    classifications = {finding.classification for finding in findings}
 
-    assert "contract_tool_denied" in classifications
-    assert "contract_tool_not_allowed" in classifications
-    assert "contract_side_effect_write_tool_denied" in classifications
-    assert "contract_max_calls_total_exceeded" in classifications
+    assert classifications >= {
+        "contract_tool_denied",
+        "contract_tool_not_allowed",
+        "contract_side_effect_write_tool_denied",
+        "contract_max_calls_total_exceeded",
+    }
 
 
 def test_evaluate_contracts_reports_sequence_require_and_forbid() -> None:
@@ -84,10 +86,12 @@ def test_evaluate_contracts_reports_sequence_require_and_forbid() -> None:
     )
 
     findings = evaluate_contracts(current=events, contracts=contracts)
-    classifications = [finding.classification for finding in findings]
+    classifications = {finding.classification for finding in findings}
 
-    assert "contract_sequence_required_missing" in classifications
-    assert "contract_sequence_forbidden_seen" in classifications
+    assert classifications >= {
+        "contract_sequence_required_missing",
+        "contract_sequence_forbidden_seen",
+    }
 
 
 def test_evaluate_contracts_network_allowlist_blocked_signal() -> None:
@@ -110,7 +114,7 @@ def test_evaluate_contracts_network_allowlist_blocked_signal() -> None:
     contracts = AgentContracts(network=NetworkContracts(allowlist=["api.example.com"]))
 
     findings = evaluate_contracts(current=events, contracts=contracts)
-    classifications = [finding.classification for finding in findings]
+    classifications = {finding.classification for finding in findings}
 
     assert "contract_network_allowlist_blocked" in classifications
 
@@ -190,10 +194,12 @@ def test_evaluate_contracts_supports_args_and_per_tool_limits_and_pii() -> None:
     findings = evaluate_contracts(current=events, contracts=contracts)
     classifications = {finding.classification for finding in findings}
 
-    assert "contract_args_max_violation" in classifications
-    assert "contract_max_calls_per_tool_exceeded" in classifications
-    assert "contract_tool_denied" in classifications
-    assert "contract_data_leak_pii_outbound" in classifications
+    assert classifications >= {
+        "contract_args_max_violation",
+        "contract_max_calls_per_tool_exceeded",
+        "contract_tool_denied",
+        "contract_data_leak_pii_outbound",
+    }
 
 
 def test_evaluate_contracts_reports_network_domain_denied() -> None:
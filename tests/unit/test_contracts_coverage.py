@@ -4,8 +4,9 @@ tool schema edge cases."""
 
 from __future__ import annotations
 
+from tests.unit._fakes import fake_event
 from trajectly.contracts import evaluate_contracts
-from trajectly.events import make_event
+from trajectly.core.contracts import _compile_contracts
 from trajectly.specs import (
     AgentContracts,
     DataLeakContracts,
@@ -16,7 +17,7 @@ from trajectly.specs import (
 
 
 def _tool_event(tool_name: str, seq: int, **kwargs: object) -> object:
-    return make_event(
+    return fake_event(
         event_type="tool_called",
         seq=seq,
         run_id="r1",
@@ -26,7 +27,7 @@ def _tool_event(tool_name: str, seq: int, **kwargs: object) -> object:
 
 
 def _step_event(name: str, seq: int) -> object:
-    return make_event(
+    return fake_event(
         event_type="agent_step",
         seq=seq,
         run_id="r1",
@@ -48,7 +49,7 @@ def test_require_before_order_satisfied() -> None:
         sequence=SequenceContracts(require_before=[("tool:lookup", "tool:send_email")])
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_sequence_require_before_violated" not in codes
 
 
@@ -61,7 +62,7 @@ def test_require_before_order_violated() -> None:
         sequence=SequenceContracts(require_before=[("tool:lookup", "tool:send_email")])
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_sequence_require_before_violated" in codes
 
 
@@ -71,7 +72,7 @@ def test_require_before_missing_first_element() -> None:
         sequence=SequenceContracts(require_before=[("tool:lookup", "tool:send_email")])
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_sequence_require_before_violated" in codes
 
 
@@ -85,7 +86,7 @@ def test_eventually_satisfied() -> None:
         sequence=SequenceContracts(eventually=["tool:finalize"])
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_sequence_eventually_missing" not in codes
 
 
@@ -95,7 +96,7 @@ def test_eventually_missing() -> None:
         sequence=SequenceContracts(eventually=["tool:finalize"])
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_sequence_eventually_missing" in codes
 
 
@@ -109,7 +110,7 @@ def test_never_not_seen() -> None:
         sequence=SequenceContracts(never=["tool:dangerous"])
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_sequence_never_seen" not in codes
 
 
@@ -119,7 +120,7 @@ def test_never_seen() -> None:
         sequence=SequenceContracts(never=["tool:dangerous"])
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_sequence_never_seen" in codes
 
 
@@ -133,7 +134,7 @@ def test_at_most_once_satisfied() -> None:
         sequence=SequenceContracts(at_most_once=["tool:charge"])
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_sequence_at_most_once_exceeded" not in codes
 
 
@@ -143,7 +144,7 @@ def test_at_most_once_exceeded() -> None:
         sequence=SequenceContracts(at_most_once=["tool:charge"])
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_sequence_at_most_once_exceeded" in codes
 
 
@@ -153,7 +154,7 @@ def test_at_most_once_exceeded() -> None:
 
 def test_network_default_allow_domain_not_in_allowlist() -> None:
     events = [
-        make_event(
+        fake_event(
             event_type="tool_called",
             seq=1,
             run_id="r1",
@@ -171,13 +172,13 @@ def test_network_default_allow_domain_not_in_allowlist() -> None:
         )
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_network_domain_denied" in codes
 
 
 def test_network_default_allow_domain_in_allowlist() -> None:
     events = [
-        make_event(
+        fake_event(
             event_type="tool_called",
             seq=1,
             run_id="r1",
@@ -195,14 +196,14 @@ def test_network_default_allow_domain_in_allowlist() -> None:
         )
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_network_domain_denied" not in codes
 
 
 def test_network_default_allow_no_allowlist() -> None:
     """When default=allow and no allowlist, no violation."""
     events = [
-        make_event(
+        fake_event(
             event_type="tool_called",
             seq=1,
             run_id="r1",
@@ -217,10 +218,25 @@ def test_network_default_allow_no_allowlist() -> None:
         network=NetworkContracts(default="allow", allow_domains=[])
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_network_domain_denied" not in codes
 
 
+def test_network_allowlist_is_exact_host_match() -> None:
+    """Allowlisted hosts do not implicitly allow their subdomains or parents."""
+    events = [
+        _tool_event("http_request", 1, url="https://api.safe.example.com/x"),
+        _tool_event("http_request", 2, url="https://example.com/x"),
+        _tool_event("http_request", 3, url="https://SAFE.example.com/x"),
+    ]
+    contracts = AgentContracts(
+        network=NetworkContracts(default="deny", allow_domains=["safe.example.com"])
+    )
+    findings = evaluate_contracts(current=events, contracts=contracts)
+    denied = [f.current for f in findings if f.classification == "contract_network_domain_denied"]
+    assert denied == ["api.safe.example.com", "example.com"]
+
+
 # ---------------------------------------------------------------------------
 # Data-leak: outbound_kinds filtering
 # ---------------------------------------------------------------------------
@@ -228,7 +244,7 @@ def test_network_default_allow_no_allowlist() -> None:
 def test_pii_not_detected_in_non_eligible_kind() -> None:
     """PII in an llm_called event is not flagged when outbound_kinds=TOOL_CALL only."""
     events = [
-        make_event(
+        fake_event(
             event_type="llm_called",
             seq=1,
             run_id="r1",
@@ -243,14 +259,14 @@ def test_pii_not_detected_in_non_eligible_kind() -> None:
         )
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_data_leak_pii_outbound" not in codes
 
 
 def test_pii_detected_in_llm_kind() -> None:
     """PII in an llm_called event IS flagged when outbound_kinds=LLM_REQUEST."""
     events = [
-        make_event(
+        fake_event(
             event_type="llm_called",
             seq=1,
             run_id="r1",
@@ -265,14 +281,14 @@ def test_pii_detected_in_llm_kind() -> None:
         )
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_data_leak_pii_outbound" in codes
 
 
 def test_secret_pattern_outbound_kinds_filtering() -> None:
     """Secret pattern only checked in eligible outbound_kinds."""
     events = [
-        make_event(
+        fake_event(
             event_type="tool_called",
             seq=1,
             run_id="r1",
@@ -287,7 +303,7 @@ def test_secret_pattern_outbound_kinds_filtering() -> None:
         )
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_data_leak_secret_pattern" not in codes
 
 
@@ -297,7 +313,7 @@ def test_secret_pattern_outbound_kinds_filtering() -> None:
 
 def test_schema_min_violation() -> None:
     events = [
-        make_event(
+        fake_event(
             event_type="tool_called",
             seq=1,
             run_id="r1",
@@ -320,13 +336,13 @@ def test_schema_min_violation() -> None:
         )
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_args_min_violation" in codes
 
 
 def test_schema_type_violation_not_numeric() -> None:
     events = [
-        make_event(
+        fake_event(
             event_type="tool_called",
             seq=1,
             run_id="r1",
@@ -349,13 +365,13 @@ def test_schema_type_violation_not_numeric() -> None:
         )
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_args_type_violation" in codes
 
 
 def test_schema_enum_violation() -> None:
     events = [
-        make_event(
+        fake_event(
             event_type="tool_called",
             seq=1,
             run_id="r1",
@@ -378,13 +394,13 @@ def test_schema_enum_violation() -> None:
         )
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_args_enum_violation" in codes
 
 
 def test_schema_regex_violation() -> None:
     events = [
-        make_event(
+        fake_event(
             event_type="tool_called",
             seq=1,
             run_id="r1",
@@ -407,13 +423,13 @@ def test_schema_regex_violation() -> None:
         )
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_args_regex_violation" in codes
 
 
 def test_schema_required_key_missing() -> None:
     events = [
-        make_event(
+        fake_event(
             event_type="tool_called",
             seq=1,
             run_id="r1",
@@ -434,7 +450,7 @@ def test_schema_required_key_missing() -> None:
         )
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_args_required_key_missing" in codes
 
 
@@ -444,7 +460,7 @@ def test_schema_required_key_missing() -> None:
 
 def test_network_deny_no_domain_in_url() -> None:
     events = [
-        make_event(
+        fake_event(
             event_type="tool_called",
             seq=1,
             run_id="r1",
@@ -459,5 +475,36 @@ def test_network_deny_no_domain_in_url() -> None:
         network=NetworkContracts(default="deny", allow_domains=["safe.com"])
     )
     findings = evaluate_contracts(current=events, contracts=contracts)
-    codes = [f.classification for f in findings]
+    codes = {f.classification for f in findings}
     assert "contract_network_domain_denied" in codes
+
+
+# ---------------------------------------------------------------------------
+# In-place contract edits
+# ---------------------------------------------------------------------------
+
+def test_contracts_edited_in_place_are_seen_on_next_evaluation() -> None:
+    contracts = AgentContracts(
+        tools=ToolContracts(deny=["delete_account"]),
+        network=NetworkContracts(default="deny", allow_domains=[" Safe.com "]),
+    )
+    denied = [_tool_event("delete_account", 1)]
+    allowed = [_tool_event("http_request", 1, url="https://safe.com/x")]
+    assert [f.classification for f in evaluate_contracts(current=denied, contracts=contracts)] == [
+        "contract_tool_denied"
+    ]
+    assert evaluate_contracts(current=allowed, contracts=contracts) == []
+
+    contracts.tools.deny = []
+
+    assert evaluate_contracts(current=denied, contracts=contracts) == []
+
+
+def test_outbound_kinds_follow_declaration_order() -> None:
+    contracts = AgentContracts(
+        data_leak=DataLeakContracts(
+            deny_pii_outbound=True,
+            outbound_kinds=["LLM_REQUEST", "TOOL_CALL", "LLM_REQUEST"],
+        )
+    )
+    assert _compile_contracts(contracts).outbound_event_types == ("llm_called", "tool_called")
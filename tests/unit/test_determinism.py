@@ -157,3 +157,36 @@ def test_filesystem_strict_mode_allows_allowlisted_read(tmp_path: Path, monkeypa
     determinism.activate_from_env()
 
     assert target.read_text(encoding="utf-8").strip() == "ok"
+
+
+def test_filesystem_strict_mode_allows_exact_allowlisted_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    target = tmp_path / "events.jsonl"
+    _configure_env(
+        monkeypatch,
+        project_root=tmp_path,
+        config={
+            "filesystem": {
+                "mode": "strict",
+                "allow_read_paths": [],
+                "allow_write_paths": [],
+            }
+        },
+    )
+    monkeypatch.setenv("TRAJECTLY_EVENTS_FILE", str(target))
+    determinism.activate_from_env()
+
+    with open(str(target.resolve()), "a+", encoding="utf-8") as handle:
+        handle.write("{}\n")
+
+    assert target.read_text(encoding="utf-8") == "{}\n"
+
+
+def test_parse_config_is_cached_by_raw_json_across_resets() -> None:
+    config = {"filesystem": {"mode": "strict", "allow_read_paths": ["config"], "allow_write_paths": []}}
+    raw = json.dumps(config)
+
+    first = determinism._parse_config(raw)
+    determinism.reset_for_tests()
+
+    assert determinism._parse_config(raw) is first
+    assert first.filesystem.allow_read_paths == ["config"]
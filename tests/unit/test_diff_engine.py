@@ -65,3 +65,47 @@ def test_compare_traces_detects_budget_breaches() -> None:
     first_divergence = result.summary["first_divergence"]
     assert first_divergence["kind"] == "sequence"
     assert first_divergence["index"] == 0
+
+
+def test_compare_traces_identical_payloads_produce_no_structural_findings() -> None:
+    payload = {"tool_name": "add", "input": {"args": [1, 2], "kwargs": {"b": 1, "a": 2}}}
+    reordered = {"input": {"kwargs": {"a": 2, "b": 1}, "args": [1, 2]}, "tool_name": "add"}
+    baseline = [_event("tool_called", 1, payload)]
+    current = [_event("tool_called", 1, reordered)]
+
+    result = compare_traces(baseline, current)
+
+    assert result.findings == []
+    assert result.summary["first_divergence"] is None
+
+
+def test_compare_traces_reports_int_float_payload_change() -> None:
+    baseline = [_event("tool_returned", 1, {"tool_name": "add", "output": 3})]
+    current = [_event("tool_returned", 1, {"tool_name": "add", "output": 3.0})]
+
+    result = compare_traces(baseline, current)
+
+    assert [finding.path for finding in result.findings] == ["$.payload.output"]
+
+
+def test_compare_traces_nan_payload_reports_mismatch_and_divergence_consistently() -> None:
+    baseline = [_event("tool_returned", 1, {"tool_name": "add", "output": float("nan")})]
+    current = [_event("tool_returned", 1, {"tool_name": "add", "output": float("nan")})]
+
+    result = compare_traces(baseline, current)
+
+    assert [finding.classification for finding in result.findings] == ["structural_mismatch"]
+    assert result.summary["regression"] is True
+    first_divergence = result.summary["first_divergence"]
+    assert first_divergence["kind"] == "payload"
+    assert first_divergence["path"] == "$.payload.output"
+
+
+def test_compare_traces_json_equivalent_payloads_agree_on_no_divergence() -> None:
+    baseline = [_event("tool_called", 1, {"tool_name": "add", "input": {"args": (1, 2), "kwargs": {1: "x"}}})]
+    current = [_event("tool_called", 1, {"tool_name": "add", "input": {"args": [1, 2], "kwargs": {"1": "x"}}})]
+
+    result = compare_traces(baseline, current)
+
+    assert result.findings == []
+    assert result.summary["first_divergence"] is None
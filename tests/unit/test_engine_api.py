@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import shlex
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -39,6 +41,16 @@ def test_initialize_workspace_creates_expected_files(tmp_path: Path) -> None:
     assert (tmp_path / "tests" / "sample.agent.yaml").exists()
 
 
+def test_initialize_workspace_keeps_existing_files(tmp_path: Path) -> None:
+    initialize_workspace(tmp_path)
+    config = tmp_path / ".trajectly" / "config.yaml"
+    config.write_text("schema_version: v1\ndefault_strict: true\n", encoding="utf-8")
+
+    initialize_workspace(tmp_path)
+
+    assert config.read_text(encoding="utf-8") == "schema_version: v1\ndefault_strict: true\n"
+
+
 def test_enable_workspace_returns_discovered_specs(tmp_path: Path) -> None:
     discovered = enable_workspace(tmp_path)
 
@@ -82,6 +94,35 @@ def test_discover_spec_files_excludes_runtime_and_hidden_dirs(tmp_path: Path) ->
     ]
 
 
+def test_discover_spec_files_does_not_follow_directory_symlinks(tmp_path: Path) -> None:
+    outside = tmp_path / "outside"
+    project = tmp_path / "project"
+    (project / "nested" / "deep").mkdir(parents=True)
+    outside.mkdir()
+    (outside / "linked.agent.yaml").write_text("command: python x.py\n", encoding="utf-8")
+    (project / "nested" / "deep" / "b.agent.yaml").write_text("command: python b.py\n", encoding="utf-8")
+    (project / "link").symlink_to(outside, target_is_directory=True)
+
+    discovered = discover_spec_files(project)
+
+    assert discovered == [(project / "nested" / "deep" / "b.agent.yaml").resolve()]
+
+
+def test_discover_spec_files_resolves_file_symlinks(tmp_path: Path) -> None:
+    outside = tmp_path / "outside"
+    project = tmp_path / "project"
+    outside.mkdir()
+    project.mkdir()
+    target = outside / "real.agent.yaml"
+    target.write_text("command: python x.py\n", encoding="utf-8")
+    (project / "alias.agent.yaml").symlink_to(target)
+    (project / "local.agent.yaml").write_text("command: python y.py\n", encoding="utf-8")
+
+    discovered = discover_spec_files(project)
+
+    assert discovered == sorted([target.resolve(), (project / "local.agent.yaml").resolve()], key=str)
+
+
 def test_run_specs_reports_missing_baseline(tmp_path: Path) -> None:
     initialize_workspace(tmp_path)
     agent = tmp_path / "agent.py"
@@ -105,6 +146,67 @@ strict: true
     assert outcome.latest_report_json.exists()
 
 
+@pytest.mark.slow
+def test_run_specs_parallel_matches_sequential_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    initialize_workspace(tmp_path)
+    _write(tmp_path / "agent.py", "print('ok')")
+    targets: list[str] = []
+    for name in ("zeta", "alpha", "mid"):
+        spec = tmp_path / f"{name}.agent.yaml"
+        _write(spec, f"name: {name}\ncommand: python agent.py\nworkdir: .\nstrict: true\n")
+        targets.append(str(spec))
+
+    assert record_specs(targets=targets, project_root=tmp_path).exit_code == 0
+
+    pool_workers: list[int | None] = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def __init__(self, max_workers: int | None = None) -> None:
+            pool_workers.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr("trajectly.cli.engine.ThreadPoolExecutor", RecordingExecutor)
+
+    orders: list[list[str]] = []
+    for flag in ("0", "1"):
+        monkeypatch.setenv("TRAJECTLY_PARALLEL", flag)
+        outcome = run_specs(targets=targets, project_root=tmp_path)
+        assert outcome.exit_code == 0
+        assert outcome.processed_specs == 3
+        assert outcome.latest_report_json is not None
+        latest = json.loads(outcome.latest_report_json.read_text(encoding="utf-8"))
+        orders.append([row["spec"] for row in latest["reports"]])
+
+    assert orders[0] == orders[1]
+    assert len(pool_workers) == 1
+
+
+@pytest.mark.parametrize("flag", ["0", "1"])
+def test_run_specs_reports_spec_exceptions_as_errors(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    flag: str,
+) -> None:
+    initialize_workspace(tmp_path)
+    targets: list[str] = []
+    for name in ("good", "bad"):
+        spec = tmp_path / f"{name}.agent.yaml"
+        _write(spec, f"name: {name}\ncommand: python agent.py\nworkdir: .\n")
+        targets.append(str(spec))
+
+    def fake_run_one_spec(spec, **_: object):
+        if spec.name == "bad":
+            raise RuntimeError("boom")
+        return [], None
+
+    monkeypatch.setattr("trajectly.cli.engine._run_one_spec", fake_run_one_spec)
+    monkeypatch.setenv("TRAJECTLY_PARALLEL", flag)
+
+    outcome = run_specs(targets=targets, project_root=tmp_path)
+    assert outcome.exit_code == EXIT_INTERNAL_ERROR
+    assert outcome.errors == ["bad: internal error: boom"]
+
+
 def test_record_specs_blocks_ci_baseline_writes_without_override(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -162,6 +264,7 @@ strict: true
     run_outcome = run_specs(targets=[str(spec)], project_root=tmp_path)
     assert run_outcome.exit_code == EXIT_INTERNAL_ERROR
     assert any("NORMALIZER_VERSION_MISMATCH" in error for error in run_outcome.errors)
+    assert any("baseline=999" in error for error in run_outcome.errors)
 
 
 def test_read_latest_report_missing_raises(tmp_path: Path) -> None:
@@ -222,3 +325,19 @@ def test_resolve_repro_spec_prefers_latest_regression(tmp_path: Path) -> None:
     command = build_repro_command(spec_path=spec_path, project_root=tmp_path.resolve())
     assert "python -m trajectly run" in command
     assert str(spec_b.resolve()) in command
+
+
+def test_build_repro_command_quotes_shell_metacharacters(tmp_path: Path) -> None:
+    spec_path = tmp_path / "my specs" / 'it\'s "$HOME".agent.yaml'
+    command = build_repro_command(spec_path=spec_path, project_root=tmp_path, strict_override=False)
+
+    assert shlex.split(command) == [
+        "python",
+        "-m",
+        "trajectly",
+        "run",
+        str(spec_path),
+        "--project-root",
+        str(tmp_path),
+        "--no-strict",
+    ]
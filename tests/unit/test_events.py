@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import json
+import sys
 from pathlib import Path
 
 import pytest
 
-from trajectly.events import make_event, read_events_jsonl, write_events_jsonl
+from trajectly.canonical import sha256_of_subset
+from trajectly.events import TraceEvent, compute_event_id, make_event, read_events_jsonl, write_events_jsonl
 
 
 def test_make_event_id_ignores_rel_ms_and_meta() -> None:
@@ -67,3 +70,51 @@ def test_make_event_rejects_unknown_type() -> None:
             rel_ms=0,
             payload={},
         )
+
+
+def test_event_type_is_interned_for_parsed_events() -> None:
+    raw = json.loads('{"event_type": "tool_called", "seq": 1, "run_id": "r", "rel_ms": 0, "payload": {}}')
+    event = TraceEvent.from_dict(raw)
+    assert event.event_type is sys.intern("tool_called")
+
+
+def test_from_dict_coerces_bool_seq_and_rel_ms_to_int() -> None:
+    raw = json.loads('{"event_type": "tool_called", "seq": true, "rel_ms": false, "run_id": "r", "payload": {}}')
+    event = TraceEvent.from_dict(raw)
+    assert (type(event.seq), event.seq) == (int, 1)
+    assert (type(event.rel_ms), event.rel_ms) == (int, 0)
+
+
+def test_read_events_jsonl_skips_blank_lines_and_keeps_unicode(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    event = make_event(event_type="agent_step", seq=1, run_id="r", rel_ms=0, payload={"name": "café"})
+    write_events_jsonl(path, [event])
+    path.write_text("\n  \n" + path.read_text(encoding="utf-8") + "\n\n", encoding="utf-8")
+
+    loaded = read_events_jsonl(path)
+
+    assert [item.payload for item in loaded] == [{"name": "café"}]
+
+
+def test_read_events_jsonl_tolerates_leading_bom(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    event = make_event(event_type="agent_step", seq=1, run_id="r", rel_ms=0, payload={"name": "café"})
+    write_events_jsonl(path, [event])
+    path.write_bytes(b"\xef\xbb\xbf" + path.read_bytes())
+
+    loaded = read_events_jsonl(path)
+
+    assert [item.event_id for item in loaded] == [event.event_id]
+
+
+def test_compute_event_id_matches_legacy_subset_hash() -> None:
+    event = make_event(
+        event_type="llm_called",
+        seq=3,
+        run_id="run-a",
+        rel_ms=42,
+        payload={"provider": "p", "model": "m", "request": {"temperature": 0.5}},
+        meta={"source": "sdk"},
+    )
+    legacy = sha256_of_subset(event.to_dict(), ignored_keys={"event_id", "rel_ms", "meta"})
+    assert compute_event_id(event) == event.event_id == legacy
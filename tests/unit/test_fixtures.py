@@ -4,47 +4,54 @@ from __future__ import annotations
 
 import pytest
 
-from trajectly.events import make_event
-from trajectly.fixtures import FixtureExhaustedError, FixtureMatcher, FixtureStore
+from trajectly.canonical import sha256_of_data
+from trajectly.core import fixtures as fixtures_module
+from trajectly.events import TraceEvent, make_event
+from trajectly.fixtures import FixtureEntry, FixtureExhaustedError, FixtureMatcher, FixtureStore
 
+_RUN_ID = "run-1"
+# Built once at import; FixtureStore.from_events copies what it keeps, so the
+# shared events are never mutated by a test.
+_SAMPLE_EVENTS: tuple[TraceEvent, ...] = (
+    make_event(
+        event_type="tool_called",
+        seq=1,
+        run_id=_RUN_ID,
+        rel_ms=1,
+        payload={"tool_name": "add", "input": {"args": [1, 2], "kwargs": {}}},
+    ),
+    make_event(
+        event_type="tool_returned",
+        seq=2,
+        run_id=_RUN_ID,
+        rel_ms=2,
+        payload={"tool_name": "add", "output": 3, "error": None},
+    ),
+    make_event(
+        event_type="tool_called",
+        seq=3,
+        run_id=_RUN_ID,
+        rel_ms=3,
+        payload={"tool_name": "add", "input": {"args": [4, 5], "kwargs": {}}},
+    ),
+    make_event(
+        event_type="tool_returned",
+        seq=4,
+        run_id=_RUN_ID,
+        rel_ms=4,
+        payload={"tool_name": "add", "output": 9, "error": None},
+    ),
+)
 
-def _sample_events() -> list:
-    run_id = "run-1"
-    return [
-        make_event(
-            event_type="tool_called",
-            seq=1,
-            run_id=run_id,
-            rel_ms=1,
-            payload={"tool_name": "add", "input": {"args": [1, 2], "kwargs": {}}},
-        ),
-        make_event(
-            event_type="tool_returned",
-            seq=2,
-            run_id=run_id,
-            rel_ms=2,
-            payload={"tool_name": "add", "output": 3, "error": None},
-        ),
-        make_event(
-            event_type="tool_called",
-            seq=3,
-            run_id=run_id,
-            rel_ms=3,
-            payload={"tool_name": "add", "input": {"args": [4, 5], "kwargs": {}}},
-        ),
-        make_event(
-            event_type="tool_returned",
-            seq=4,
-            run_id=run_id,
-            rel_ms=4,
-            payload={"tool_name": "add", "output": 9, "error": None},
-        ),
-    ]
 
+@pytest.fixture(scope="module")
+def sample_store() -> FixtureStore:
+    # Matchers keep their own cursors, so one store can back every test.
+    return FixtureStore.from_events(_SAMPLE_EVENTS)
 
-def test_fixture_matcher_by_index() -> None:
-    store = FixtureStore.from_events(_sample_events())
-    matcher = FixtureMatcher(store=store, policy="by_index", strict=False)
+
+def test_fixture_matcher_by_index(sample_store: FixtureStore) -> None:
+    matcher = FixtureMatcher(store=sample_store, policy="by_index", strict=False)
     first = matcher.match("tool", "add", {"args": [1, 2], "kwargs": {}})
     second = matcher.match("tool", "add", {"args": [4, 5], "kwargs": {}})
     assert first is not None
@@ -53,9 +60,8 @@ def test_fixture_matcher_by_index() -> None:
     assert second.output_payload["output"] == 9
 
 
-def test_fixture_matcher_by_hash() -> None:
-    store = FixtureStore.from_events(_sample_events())
-    matcher = FixtureMatcher(store=store, policy="by_hash", strict=False)
+def test_fixture_matcher_by_hash(sample_store: FixtureStore) -> None:
+    matcher = FixtureMatcher(store=sample_store, policy="by_hash", strict=False)
     second = matcher.match("tool", "add", {"args": [4, 5], "kwargs": {}})
     first = matcher.match("tool", "add", {"args": [1, 2], "kwargs": {}})
     assert first is not None
@@ -64,9 +70,8 @@ def test_fixture_matcher_by_hash() -> None:
     assert second.output_payload["output"] == 9
 
 
-def test_fixture_matcher_by_hash_raises_fixture_exhausted_on_overuse() -> None:
-    store = FixtureStore.from_events(_sample_events())
-    matcher = FixtureMatcher(store=store, policy="by_hash", strict=False)
+def test_fixture_matcher_by_hash_raises_fixture_exhausted_on_overuse(sample_store: FixtureStore) -> None:
+    matcher = FixtureMatcher(store=sample_store, policy="by_hash", strict=False)
     first = matcher.match("tool", "add", {"args": [1, 2], "kwargs": {}})
     assert first is not None
 
@@ -74,11 +79,108 @@ def test_fixture_matcher_by_hash_raises_fixture_exhausted_on_overuse() -> None:
         matcher.match("tool", "add", {"args": [1, 2], "kwargs": {}})
 
 
-def test_fixture_matcher_by_index_raises_fixture_exhausted_on_overuse() -> None:
-    store = FixtureStore.from_events(_sample_events())
-    matcher = FixtureMatcher(store=store, policy="by_index", strict=False)
+def test_fixture_matcher_by_index_raises_fixture_exhausted_on_overuse(sample_store: FixtureStore) -> None:
+    matcher = FixtureMatcher(store=sample_store, policy="by_index", strict=False)
     assert matcher.match("tool", "add", {"args": [1, 2], "kwargs": {}}) is not None
     assert matcher.match("tool", "add", {"args": [4, 5], "kwargs": {}}) is not None
 
     with pytest.raises(FixtureExhaustedError, match="FIXTURE_EXHAUSTED"):
         matcher.match("tool", "add", {"args": [9, 9], "kwargs": {}})
+
+
+def test_fixture_store_from_events_hashes_shared_input_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    shared_input = {"args": [1, 2], "kwargs": {}}
+    events = []
+    for seq in range(1, 7, 2):
+        events.append(
+            make_event(
+                event_type="tool_called",
+                seq=seq,
+                run_id="run-1",
+                rel_ms=seq,
+                payload={"tool_name": "add", "input": shared_input},
+            )
+        )
+        events.append(
+            make_event(
+                event_type="tool_returned",
+                seq=seq + 1,
+                run_id="run-1",
+                rel_ms=seq + 1,
+                payload={"tool_name": "add", "output": 3, "error": None},
+            )
+        )
+    calls: list[object] = []
+    original = fixtures_module.sha256_of_data
+
+    def counting_sha256(value: object) -> str:
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(fixtures_module, "sha256_of_data", counting_sha256)
+    store = FixtureStore.from_events(events)
+
+    assert len(store.entries) == 3
+    assert len({entry.input_hash for entry in store.entries}) == 1
+    assert len(calls) == 1
+
+
+def test_fixture_matcher_by_hash_consumes_duplicates_in_recorded_order() -> None:
+    events = [
+        *_SAMPLE_EVENTS,
+        make_event(
+            event_type="tool_called",
+            seq=5,
+            run_id="run-1",
+            rel_ms=5,
+            payload={"tool_name": "add", "input": {"args": [1, 2], "kwargs": {}}},
+        ),
+        make_event(
+            event_type="tool_returned",
+            seq=6,
+            run_id="run-1",
+            rel_ms=6,
+            payload={"tool_name": "add", "output": 33, "error": None},
+        ),
+    ]
+    matcher = FixtureMatcher(store=FixtureStore.from_events(events), policy="by_hash", strict=False)
+
+    outputs = [matcher.match("tool", "add", {"args": [1, 2], "kwargs": {}}) for _ in range(2)]
+    assert [entry.output_payload["output"] for entry in outputs if entry is not None] == [3, 33]
+    assert matcher.match("tool", "other", {"args": [1, 2], "kwargs": {}}) is None
+
+    with pytest.raises(FixtureExhaustedError) as exc_info:
+        matcher.match("tool", "add", {"args": [1, 2], "kwargs": {}})
+    assert exc_info.value.consumed_count == 2
+    assert exc_info.value.available_count == 2
+
+
+def test_fixture_matcher_lenient_by_index_skips_request_hashing(
+    sample_store: FixtureStore,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[object] = []
+    original = fixtures_module.sha256_of_data
+
+    def counting_sha256(value: object) -> str:
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(fixtures_module, "sha256_of_data", counting_sha256)
+    lenient = FixtureMatcher(store=sample_store, policy="by_index", strict=False)
+    assert lenient.match("tool", "add", {"args": [0, 0], "kwargs": {}}) is not None
+    assert calls == []
+
+    strict = FixtureMatcher(store=sample_store, policy="by_index", strict=True)
+    assert strict.match("tool", "add", {"args": [1, 2], "kwargs": {}}) is not None
+    assert len(calls) == 1
+
+
+def test_fixture_entry_from_dict_fills_missing_input_hash() -> None:
+    row = {"kind": "tool", "name": "add", "input_payload": {"args": [1, 2], "kwargs": {}}, "output_payload": {}}
+
+    filled = FixtureEntry.from_dict({**row, "input_hash": ""})
+    kept = FixtureEntry.from_dict({**row, "input_hash": "recorded"})
+
+    assert filled.input_hash == sha256_of_data({"args": [1, 2], "kwargs": {}})
+    assert kept.input_hash == "recorded"
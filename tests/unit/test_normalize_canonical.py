@@ -16,9 +16,19 @@ def test_canonical_normalizer_is_deterministic_for_repeated_runs() -> None:
         },
     }
 
-    first = normalizer.canonical_dumps(payload)
-    for _ in range(100):
-        assert normalizer.canonical_dumps(payload) == first
+    # A handful of repeats catches state leaking between calls; the reordered
+    # copy covers insertion-order independence of the canonical bytes.
+    digest = normalizer.sha256(payload)
+    assert all(normalizer.sha256(payload) == digest for _ in range(3))
+    reordered = {
+        "payload": {
+            "request_id": "abc",
+            "args": {"timestamp": "volatile", "q": "laptop"},
+            "tool_name": "search",
+        },
+        "kind": "TOOL_CALL",
+    }
+    assert normalizer.sha256(reordered) == digest
 
 
 def test_canonical_normalizer_strips_volatile_fields_for_hashing() -> None:
@@ -3,70 +3,47 @@ nested volatile key stripping, float precision, sha256_subset."""
 
 from __future__ import annotations
 
-from trajectly.normalize.canonical import CanonicalNormalizer, canonical_dumps, sha256_of_data, sha256_of_subset
-
-
-def test_nan_normalized_to_string() -> None:
-    normalizer = CanonicalNormalizer()
-    result = normalizer.normalize(float("nan"), strip_volatile=False)
-    assert result == "NaN"
-
-
-def test_positive_infinity_normalized_to_string() -> None:
-    normalizer = CanonicalNormalizer()
-    result = normalizer.normalize(float("inf"), strip_volatile=False)
-    assert result == "Infinity"
-
-
-def test_negative_infinity_normalized_to_string() -> None:
-    normalizer = CanonicalNormalizer()
-    result = normalizer.normalize(float("-inf"), strip_volatile=False)
-    assert result == "-Infinity"
+import json
 
+import pytest
 
-def test_nan_in_nested_dict() -> None:
-    normalizer = CanonicalNormalizer()
-    data = {"a": {"b": float("nan")}}
-    result = normalizer.normalize(data, strip_volatile=False)
-    assert result == {"a": {"b": "NaN"}}
+from trajectly.normalize.canonical import CanonicalNormalizer, canonical_dumps, sha256_of_data, sha256_of_subset
 
 
-def test_infinity_in_list() -> None:
-    normalizer = CanonicalNormalizer()
-    data = [1.0, float("inf"), float("-inf")]
-    result = normalizer.normalize(data, strip_volatile=False)
-    assert result == [1.0, "Infinity", "-Infinity"]
+@pytest.fixture(scope="module")
+def normalizer() -> CanonicalNormalizer:
+    return CanonicalNormalizer()
 
 
-def test_bytes_decoded_to_utf8() -> None:
-    normalizer = CanonicalNormalizer()
-    result = normalizer.normalize(b"hello world", strip_volatile=False)
-    assert result == "hello world"
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param(float("nan"), "NaN", id="nan"),
+        pytest.param(float("inf"), "Infinity", id="positive_infinity"),
+        pytest.param(float("-inf"), "-Infinity", id="negative_infinity"),
+        pytest.param({"a": {"b": float("nan")}}, {"a": {"b": "NaN"}}, id="nan_in_nested_dict"),
+        pytest.param([1.0, float("inf"), float("-inf")], [1.0, "Infinity", "-Infinity"], id="infinity_in_list"),
+        pytest.param(b"hello world", "hello world", id="bytes_utf8"),
+        pytest.param({"key": [b"data"]}, {"key": ["data"]}, id="bytes_in_nested_structure"),
+    ],
+)
+def test_special_values_normalized(normalizer: CanonicalNormalizer, value: object, expected: object) -> None:
+    assert normalizer.normalize(value, strip_volatile=False) == expected
 
 
-def test_bytes_with_invalid_utf8_replaced() -> None:
-    normalizer = CanonicalNormalizer()
+def test_bytes_with_invalid_utf8_replaced(normalizer: CanonicalNormalizer) -> None:
     result = normalizer.normalize(b"\xff\xfe", strip_volatile=False)
     assert isinstance(result, str)
     assert "\ufffd" in result
 
 
-def test_bytes_in_nested_structure() -> None:
-    normalizer = CanonicalNormalizer()
-    data = {"key": [b"data"]}
-    result = normalizer.normalize(data, strip_volatile=False)
-    assert result == {"key": ["data"]}
-
-
-def test_bytes_stripped_volatile() -> None:
-    normalizer = CanonicalNormalizer()
+def test_bytes_stripped_volatile(normalizer: CanonicalNormalizer) -> None:
     data = {"content": b"payload", "timestamp": b"volatile"}
     result = normalizer.strip_volatile(data)
     assert result == {"content": "payload"}
 
 
-def test_nested_volatile_keys_stripped() -> None:
-    normalizer = CanonicalNormalizer()
+def test_nested_volatile_keys_stripped(normalizer: CanonicalNormalizer) -> None:
     data = {
         "outer": {
             "timestamp": "should-be-stripped",
@@ -88,8 +65,7 @@ def test_nested_volatile_keys_stripped() -> None:
     assert "event_id" not in result
 
 
-def test_volatile_keys_in_list_of_dicts() -> None:
-    normalizer = CanonicalNormalizer()
+def test_volatile_keys_in_list_of_dicts(normalizer: CanonicalNormalizer) -> None:
     data = [
         {"name": "a", "timestamp": "ts1"},
         {"name": "b", "created_at": "ca1"},
@@ -133,26 +109,35 @@ def test_sha256_of_subset_no_ignored() -> None:
     assert h1 == h2
 
 
-def test_none_and_bool_preserved() -> None:
-    normalizer = CanonicalNormalizer()
+def test_none_and_bool_preserved(normalizer: CanonicalNormalizer) -> None:
     assert normalizer.normalize(None, strip_volatile=False) is None
     assert normalizer.normalize(True, strip_volatile=False) is True
     assert normalizer.normalize(False, strip_volatile=False) is False
 
 
-def test_int_preserved() -> None:
-    normalizer = CanonicalNormalizer()
+def test_int_preserved(normalizer: CanonicalNormalizer) -> None:
     assert normalizer.normalize(42, strip_volatile=False) == 42
 
 
-def test_non_json_type_becomes_string() -> None:
-    normalizer = CanonicalNormalizer()
+def test_non_json_type_becomes_string(normalizer: CanonicalNormalizer) -> None:
     result = normalizer.normalize(set(), strip_volatile=False)
     assert isinstance(result, str)
 
 
-def test_dict_keys_sorted_in_output() -> None:
-    normalizer = CanonicalNormalizer()
+def test_dict_keys_sorted_in_output(normalizer: CanonicalNormalizer) -> None:
     data = {"z": 1, "a": 2, "m": 3}
     s = normalizer.canonical_dumps(data, strip_volatile=False)
     assert s.index('"a"') < s.index('"m"') < s.index('"z"')
+
+
+def test_canonical_dumps_matches_sort_keys_encoding_for_mixed_keys(normalizer: CanonicalNormalizer) -> None:
+    data = {"b": {"z": 1, 10: [b"x", {"y": 2, "a": None}]}, 2: "two", "a": {"timestamp": 1, "c": 1.5}}
+    for strip in (True, False):
+        expected = json.dumps(normalizer.normalize(data, strip_volatile=strip), sort_keys=True, separators=(",", ":"))
+        assert normalizer.canonical_dumps(data, strip_volatile=strip) == expected
+
+
+def test_custom_volatile_keys_are_stripped() -> None:
+    custom = CanonicalNormalizer(volatile_keys=("trace_id",))
+    assert custom.strip_volatile({"trace_id": "x", "timestamp": 1}) == {"timestamp": 1}
+    assert custom == CanonicalNormalizer(volatile_keys=("trace_id",))
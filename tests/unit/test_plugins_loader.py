@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
+import pytest
+
 from trajectly.diff.models import Finding
 from trajectly.plugins import loader
 
@@ -41,13 +44,28 @@ class _RunHookPlugin:
         self.called = True
 
 
-def test_run_semantic_plugins(monkeypatch) -> None:
-    fake = _FakeEntryPoints(
-        {
-            "trajectly.semantic_diff_plugins": [_FakeEntryPoint(_SemanticPlugin)],
-        }
-    )
-    monkeypatch.setattr(loader, "entry_points", lambda: fake)
+@pytest.fixture
+def install_entry_points(monkeypatch: pytest.MonkeyPatch) -> Iterator[Callable[[dict[str, list[Any]]], list[int]]]:
+    """Patch the entry-point scan with fake groups; returns a scan counter."""
+
+    def install(groups: dict[str, list[Any]]) -> list[int]:
+        scans: list[int] = []
+        fake = _FakeEntryPoints({group: [_FakeEntryPoint(obj) for obj in objs] for group, objs in groups.items()})
+
+        def scan() -> _FakeEntryPoints:
+            scans.append(1)
+            return fake
+
+        monkeypatch.setattr(loader, "entry_points", scan)
+        return scans
+
+    loader.reset_plugin_cache()
+    yield install
+    loader.reset_plugin_cache()
+
+
+def test_run_semantic_plugins(install_entry_points: Callable[[dict[str, list[Any]]], list[int]]) -> None:
+    install_entry_points({"trajectly.semantic_diff_plugins": [_SemanticPlugin]})
 
     findings = loader.run_semantic_plugins(baseline=[], current=[])
 
@@ -55,15 +73,24 @@ def test_run_semantic_plugins(monkeypatch) -> None:
     assert findings[0].classification == "semantic"
 
 
-def test_run_run_hooks(monkeypatch) -> None:
+def test_run_run_hooks(install_entry_points: Callable[[dict[str, list[Any]]], list[int]]) -> None:
     plugin = _RunHookPlugin()
-    fake = _FakeEntryPoints(
-        {
-            "trajectly.run_hook_plugins": [_FakeEntryPoint(plugin)],
-        }
-    )
-    monkeypatch.setattr(loader, "entry_points", lambda: fake)
+    install_entry_points({"trajectly.run_hook_plugins": [plugin]})
 
     loader.run_run_hooks(context={"spec": "x"}, report_paths={"json": Path("out.json")})
 
     assert plugin.called is True
+
+
+def test_plugin_groups_are_scanned_once_until_reset(
+    install_entry_points: Callable[[dict[str, list[Any]]], list[int]],
+) -> None:
+    scans = install_entry_points({"trajectly.semantic_diff_plugins": [_SemanticPlugin]})
+
+    loader.run_semantic_plugins(baseline=[], current=[])
+    loader.run_semantic_plugins(baseline=[], current=[])
+    assert len(scans) == 1
+
+    loader.reset_plugin_cache()
+    loader.run_semantic_plugins(baseline=[], current=[])
+    assert len(scans) == 2
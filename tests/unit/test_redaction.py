@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pytest
+
+from trajectly.core import redaction as redaction_module
 from trajectly.redaction import REDACTION_TOKEN, apply_redactions
 
 
@@ -23,3 +26,29 @@ def test_apply_redactions_nested_structures() -> None:
 def test_apply_redactions_no_patterns_returns_original_object() -> None:
     payload = {"value": "unchanged"}
     assert apply_redactions(payload, []) is payload
+
+
+@pytest.mark.parametrize(
+    ("patterns", "text", "expected"),
+    [
+        pytest.param([r"secret_[0-9]+"], "a secret_1 b", f"a {REDACTION_TOKEN} b", id="single"),
+        pytest.param([r"(\w)\1"], "aab", f"{REDACTION_TOKEN}b", id="backreference"),
+        pytest.param([r"abc", r"bcd"], "abcd", f"{REDACTION_TOKEN}d", id="applied_in_order"),
+    ],
+)
+def test_apply_redactions_pattern_sets(patterns: list[str], text: str, expected: str) -> None:
+    assert apply_redactions({"value": text}, patterns) == {"value": expected}
+    assert redaction_module._compile_patterns(tuple(patterns)) is redaction_module._compile_patterns(tuple(patterns))
+
+
+def test_apply_redactions_shares_untouched_subtrees() -> None:
+    clean = {"items": ["safe", 1, None], "flag": True}
+    payload = {"clean": clean, "dirty": ["secret_9"]}
+
+    assert apply_redactions(clean, [r"secret_[0-9]+"]) is clean
+
+    redacted = apply_redactions(payload, [r"secret_[0-9]+"])
+    assert redacted is not payload
+    assert redacted["clean"] is clean
+    assert redacted["dirty"] == [REDACTION_TOKEN]
+    assert payload["dirty"] == ["secret_9"]
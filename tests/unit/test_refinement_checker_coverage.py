@@ -5,17 +5,19 @@ from __future__ import annotations
 
 from trajectly.refinement import RefinementPolicy, SkeletonStep, check_skeleton_refinement
 
+# Steps are frozen, so the same instances can be shared by every skeleton.
+SEARCH_0 = SkeletonStep(event_index=0, tool_name="search")
+CHECKOUT_1 = SkeletonStep(event_index=1, tool_name="checkout")
+CONFIRM_1 = SkeletonStep(event_index=1, tool_name="confirm")
+DB_WRITE_1 = SkeletonStep(event_index=1, tool_name="db_write")
+NEW_TOOL_1 = SkeletonStep(event_index=1, tool_name="brand_new_tool")
+CONFIRM_2 = SkeletonStep(event_index=2, tool_name="confirm")
+SEARCH_2 = SkeletonStep(event_index=2, tool_name="search")
+
 
 def test_subsequence_failure_reports_first_missing_tool() -> None:
-    baseline = [
-        SkeletonStep(event_index=0, tool_name="search"),
-        SkeletonStep(event_index=1, tool_name="checkout"),
-        SkeletonStep(event_index=2, tool_name="confirm"),
-    ]
-    current = [
-        SkeletonStep(event_index=0, tool_name="search"),
-        SkeletonStep(event_index=1, tool_name="confirm"),
-    ]
+    baseline = (SEARCH_0, CHECKOUT_1, CONFIRM_2)
+    current = (SEARCH_0, CONFIRM_1)
     result = check_skeleton_refinement(
         baseline_steps=baseline,
         current_steps=current,
@@ -28,8 +30,8 @@ def test_subsequence_failure_reports_first_missing_tool() -> None:
 
 
 def test_subsequence_failure_with_empty_current() -> None:
-    baseline = [SkeletonStep(event_index=0, tool_name="search")]
-    current: list[SkeletonStep] = []
+    baseline = (SEARCH_0,)
+    current: tuple[SkeletonStep, ...] = ()
     result = check_skeleton_refinement(
         baseline_steps=baseline,
         current_steps=current,
@@ -43,11 +45,8 @@ def test_subsequence_failure_with_empty_current() -> None:
 
 
 def test_allow_new_tool_names_suppresses_new_name_violation() -> None:
-    baseline = [SkeletonStep(event_index=0, tool_name="search")]
-    current = [
-        SkeletonStep(event_index=0, tool_name="search"),
-        SkeletonStep(event_index=1, tool_name="brand_new_tool"),
-    ]
+    baseline = (SEARCH_0,)
+    current = (SEARCH_0, NEW_TOOL_1)
     result = check_skeleton_refinement(
         baseline_steps=baseline,
         current_steps=current,
@@ -60,11 +59,8 @@ def test_allow_new_tool_names_suppresses_new_name_violation() -> None:
 
 
 def test_allow_new_tool_names_false_emits_violation() -> None:
-    baseline = [SkeletonStep(event_index=0, tool_name="search")]
-    current = [
-        SkeletonStep(event_index=0, tool_name="search"),
-        SkeletonStep(event_index=1, tool_name="brand_new_tool"),
-    ]
+    baseline = (SEARCH_0,)
+    current = (SEARCH_0, NEW_TOOL_1)
     result = check_skeleton_refinement(
         baseline_steps=baseline,
         current_steps=current,
@@ -76,11 +72,8 @@ def test_allow_new_tool_names_false_emits_violation() -> None:
 
 
 def test_extra_side_effect_allowed_explicitly() -> None:
-    baseline = [SkeletonStep(event_index=0, tool_name="search")]
-    current = [
-        SkeletonStep(event_index=0, tool_name="search"),
-        SkeletonStep(event_index=1, tool_name="db_write"),
-    ]
+    baseline = (SEARCH_0,)
+    current = (SEARCH_0, DB_WRITE_1)
     result = check_skeleton_refinement(
         baseline_steps=baseline,
         current_steps=current,
@@ -94,11 +87,8 @@ def test_extra_side_effect_allowed_explicitly() -> None:
 
 
 def test_side_effect_not_in_extra_side_effect_list() -> None:
-    baseline = [SkeletonStep(event_index=0, tool_name="search")]
-    current = [
-        SkeletonStep(event_index=0, tool_name="search"),
-        SkeletonStep(event_index=1, tool_name="db_write"),
-    ]
+    baseline = (SEARCH_0,)
+    current = (SEARCH_0, DB_WRITE_1)
     result = check_skeleton_refinement(
         baseline_steps=baseline,
         current_steps=current,
@@ -111,8 +101,8 @@ def test_side_effect_not_in_extra_side_effect_list() -> None:
 
 
 def test_mode_none_skips_refinement() -> None:
-    baseline = [SkeletonStep(event_index=0, tool_name="search")]
-    current: list[SkeletonStep] = []
+    baseline = (SEARCH_0,)
+    current: tuple[SkeletonStep, ...] = ()
     result = check_skeleton_refinement(
         baseline_steps=baseline,
         current_steps=current,
@@ -124,14 +114,8 @@ def test_mode_none_skips_refinement() -> None:
 
 
 def test_perfect_match_no_violations() -> None:
-    baseline = [
-        SkeletonStep(event_index=0, tool_name="search"),
-        SkeletonStep(event_index=1, tool_name="checkout"),
-    ]
-    current = [
-        SkeletonStep(event_index=0, tool_name="search"),
-        SkeletonStep(event_index=1, tool_name="checkout"),
-    ]
+    baseline = (SEARCH_0, CHECKOUT_1)
+    current = (SEARCH_0, CHECKOUT_1)
     result = check_skeleton_refinement(
         baseline_steps=baseline,
         current_steps=current,
@@ -143,15 +127,8 @@ def test_perfect_match_no_violations() -> None:
 
 def test_existing_tool_as_extra_not_new_name() -> None:
     """If the extra tool appears in the baseline set, NEW_TOOL_NAME is not emitted."""
-    baseline = [
-        SkeletonStep(event_index=0, tool_name="search"),
-        SkeletonStep(event_index=1, tool_name="checkout"),
-    ]
-    current = [
-        SkeletonStep(event_index=0, tool_name="search"),
-        SkeletonStep(event_index=1, tool_name="checkout"),
-        SkeletonStep(event_index=2, tool_name="search"),
-    ]
+    baseline = (SEARCH_0, CHECKOUT_1)
+    current = (SEARCH_0, CHECKOUT_1, SEARCH_2)
     result = check_skeleton_refinement(
         baseline_steps=baseline,
         current_steps=current,
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import os
+import socket
+import subprocess
 import types
+import urllib.request
 
 import pytest
 
@@ -28,16 +32,58 @@ def _fake_getaddrinfo(*_args, **_kwargs):
     return []
 
 
-def test_activate_blocks_network_and_sets_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake_socket_module = types.SimpleNamespace(
+_GUARD_STATE = (
+    "_PATCHED",
+    "_ALLOWLIST",
+    "_SUBPROCESS_ALLOWLIST",
+    "_ORIGINAL_CREATE_CONNECTION",
+    "_ORIGINAL_GETADDRINFO",
+    "_ORIGINAL_SOCKET_CONNECT",
+    "_ORIGINAL_SOCKET_CONNECT_EX",
+    "_ORIGINAL_SOCKET_SENDTO",
+    "_ORIGINAL_URLOPEN",
+    "_ORIGINAL_SUBPROCESS_RUN",
+    "_ORIGINAL_SUBPROCESS_POPEN",
+)
+_PATCH_TARGETS = (
+    (socket, "create_connection"),
+    (socket, "getaddrinfo"),
+    (socket.socket, "connect"),
+    (socket.socket, "connect_ex"),
+    (socket.socket, "sendto"),
+    (urllib.request, "urlopen"),
+    (subprocess, "run"),
+    (subprocess, "Popen"),
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_guard(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test unpatched and undo whatever `activate` installs."""
+    for name in _GUARD_STATE:
+        monkeypatch.setattr(replay_guard, name, getattr(replay_guard, name))
+    monkeypatch.setattr(replay_guard, "_PATCHED", False)
+    for target, attr in _PATCH_TARGETS:
+        monkeypatch.setattr(target, attr, getattr(target, attr))
+    monkeypatch.setenv("TRAJECTLY_REPLAY_GUARD_ACTIVE", "")
+    monkeypatch.delenv("TRAJECTLY_REPLAY_GUARD_ACTIVE")
+
+
+@pytest.fixture
+def fake_socket_module(monkeypatch: pytest.MonkeyPatch) -> types.SimpleNamespace:
+    module = types.SimpleNamespace(
         create_connection=_fake_create_connection,
         getaddrinfo=_fake_getaddrinfo,
         socket=_FakeSocketClass,
     )
+    monkeypatch.setattr(replay_guard, "socket", module)
+    return module
 
-    monkeypatch.setattr(replay_guard, "socket", fake_socket_module)
-    monkeypatch.setattr(replay_guard, "_PATCHED", False)
-    monkeypatch.delenv("TRAJECTLY_REPLAY_GUARD_ACTIVE", raising=False)
+
+def test_activate_blocks_network_and_sets_env(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_socket_module: types.SimpleNamespace,
+) -> None:
     monkeypatch.delenv("TRAJECTLY_NETWORK_ALLOWLIST", raising=False)
 
     replay_guard.activate()
@@ -48,17 +94,11 @@ def test_activate_blocks_network_and_sets_env(monkeypatch: pytest.MonkeyPatch) -
         _FakeSocketClass().connect(("localhost", 80))
 
     assert replay_guard._PATCHED is True
-    assert "TRAJECTLY_REPLAY_GUARD_ACTIVE" in __import__("os").environ
+    assert "TRAJECTLY_REPLAY_GUARD_ACTIVE" in os.environ
 
 
+@pytest.mark.usefixtures("fake_socket_module")
 def test_activate_is_idempotent(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake_socket_module = types.SimpleNamespace(
-        create_connection=_fake_create_connection,
-        getaddrinfo=_fake_getaddrinfo,
-        socket=_FakeSocketClass,
-    )
-    monkeypatch.setattr(replay_guard, "socket", fake_socket_module)
-    monkeypatch.setattr(replay_guard, "_PATCHED", False)
     monkeypatch.delenv("TRAJECTLY_NETWORK_ALLOWLIST", raising=False)
 
     replay_guard.activate()
@@ -92,7 +132,6 @@ def test_activate_respects_network_allowlist(monkeypatch: pytest.MonkeyPatch) ->
     )
 
     monkeypatch.setattr(replay_guard, "socket", fake_socket_module)
-    monkeypatch.setattr(replay_guard, "_PATCHED", False)
     monkeypatch.setenv("TRAJECTLY_NETWORK_ALLOWLIST", "localhost,api.example.com")
 
     replay_guard.activate()
@@ -105,22 +144,43 @@ def test_activate_respects_network_allowlist(monkeypatch: pytest.MonkeyPatch) ->
     assert calls["connect"] == 1
 
 
+def test_network_allowlist_matches_exact_hosts_and_subdomains(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_socket_module: types.SimpleNamespace,
+) -> None:
+    monkeypatch.setenv("TRAJECTLY_NETWORK_ALLOWLIST", " Example.com ,localhost")
+
+    replay_guard.activate()
+
+    assert replay_guard._allowed(("example.com", 443))
+    assert replay_guard._allowed(("API.eu.example.com", 443))
+    assert replay_guard._allowed("localhost")
+    assert not replay_guard._allowed(("badexample.com", 443))
+    assert not replay_guard._allowed(("example.com.evil", 443))
+    assert not replay_guard._allowed(("com", 443))
+
+
 def test_activate_blocks_subprocess_network_tools(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(replay_guard, "_PATCHED", False)
     monkeypatch.delenv("TRAJECTLY_NETWORK_ALLOWLIST", raising=False)
     monkeypatch.delenv("TRAJECTLY_SUBPROCESS_ALLOWLIST", raising=False)
 
     replay_guard.activate()
 
     with pytest.raises(replay_guard.NetworkBlockedError):
-        __import__("subprocess").run(["curl", "https://example.com"], check=False)
+        subprocess.run(["curl", "https://example.com"], check=False)
 
 
 def test_activate_blocks_urllib_requests(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(replay_guard, "_PATCHED", False)
     monkeypatch.delenv("TRAJECTLY_NETWORK_ALLOWLIST", raising=False)
 
     replay_guard.activate()
 
     with pytest.raises(replay_guard.NetworkBlockedError):
-        __import__("urllib.request").request.urlopen("https://example.com")
+        urllib.request.urlopen("https://example.com")
+
+
+def test_guard_patches_do_not_leak_between_tests() -> None:
+    assert replay_guard._PATCHED is False
+    assert subprocess.run is replay_guard._BASE_SUBPROCESS_RUN
+    assert urllib.request.urlopen is replay_guard._BASE_URLOPEN
+    assert "TRAJECTLY_REPLAY_GUARD_ACTIVE" not in os.environ
@@ -5,12 +5,16 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+
 from trajectly.constants import SCHEMA_VERSION
 from trajectly.diff.models import DiffResult, Finding
 from trajectly.report.renderers import render_markdown, render_pr_comment, write_reports
 
 
-def _result_with_finding() -> DiffResult:
+@pytest.fixture(scope="module")
+def result_with_finding() -> DiffResult:
+    # Renderers only read the result, so one instance serves the module.
     return DiffResult(
         summary={
             "regression": True,
@@ -28,8 +32,8 @@ def _result_with_finding() -> DiffResult:
     )
 
 
-def test_render_markdown_contains_sections() -> None:
-    markdown = render_markdown("demo", _result_with_finding())
+def test_render_markdown_contains_sections(result_with_finding: DiffResult) -> None:
+    markdown = render_markdown("demo", result_with_finding)
 
     assert "## Trajectly Report: demo" in markdown
     assert "Regression detected" in markdown
@@ -74,10 +78,10 @@ def test_render_markdown_renders_first_divergence_summary() -> None:
     assert "**3**" in markdown
 
 
-def test_write_reports_outputs_json_and_markdown(tmp_path: Path) -> None:
+def test_write_reports_outputs_json_and_markdown(tmp_path: Path, result_with_finding: DiffResult) -> None:
     json_path = tmp_path / "out" / "report.json"
     md_path = tmp_path / "out" / "report.md"
-    write_reports("demo", _result_with_finding(), json_path, md_path)
+    write_reports("demo", result_with_finding, json_path, md_path)
 
     assert json_path.exists()
     assert md_path.exists()
@@ -87,6 +91,21 @@ def test_write_reports_outputs_json_and_markdown(tmp_path: Path) -> None:
     assert "Trajectly Report" in md_path.read_text(encoding="utf-8")
 
 
+def test_write_reports_includes_extra_sections(tmp_path: Path, result_with_finding: DiffResult) -> None:
+    json_path = tmp_path / "report.json"
+    write_reports(
+        "demo",
+        result_with_finding,
+        json_path,
+        tmp_path / "report.md",
+        extra={"trt_v03": {"status": "FAIL"}},
+    )
+
+    data = json.loads(json_path.read_text(encoding="utf-8"))
+    assert data["trt_v03"] == {"status": "FAIL"}
+    assert data["summary"]["regression"] is True
+
+
 def test_render_pr_comment_outputs_markdown_table() -> None:
     markdown = render_pr_comment(
         {
@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import json
+import subprocess
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from trajectly.runtime import execute_spec
 from trajectly.specs import AgentContracts, AgentSpec, NetworkContracts
@@ -20,6 +25,7 @@ def _spec(tmp_path: Path, command: str, workdir: str | None = ".") -> AgentSpec:
     return AgentSpec(name="demo", command=command, source_path=spec_path, workdir=workdir)
 
 
+@pytest.mark.slow
 def test_execute_spec_collects_events_and_sets_replay_guard(tmp_path: Path) -> None:
     script_path = tmp_path / "agent.py"
     _write(
@@ -68,23 +74,24 @@ def test_execute_spec_returns_internal_error_on_invalid_workdir(tmp_path: Path)
     assert isinstance(result.raw_events, list)
 
 
-def test_execute_spec_includes_custom_env(tmp_path: Path) -> None:
-    script_path = tmp_path / "agent.py"
-    _write(
-        script_path,
-        """
-import os
-print(os.getenv("CUSTOM_ENV"))
-""",
-    )
+def _capturing_runner(captured: dict[str, Any]) -> Callable[..., subprocess.CompletedProcess[str]]:
+    def run(command: str, **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        captured["command"] = command
+        captured.update(kwargs)
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    return run
+
 
+def test_execute_spec_includes_custom_env(tmp_path: Path) -> None:
     spec = AgentSpec(
         name="demo",
-        command=f"{sys.executable} {script_path.name}",
+        command="agent --run",
         source_path=tmp_path / "demo.agent.yaml",
         workdir=".",
         env={"CUSTOM_ENV": "works"},
     )
+    captured: dict[str, Any] = {}
 
     result = execute_spec(
         spec=spec,
@@ -92,29 +99,25 @@ print(os.getenv("CUSTOM_ENV"))
         events_path=tmp_path / "events.jsonl",
         fixtures_path=None,
         strict=False,
+        runner=_capturing_runner(captured),
     )
 
     assert result.returncode == 0
-    assert "works" in result.stdout
+    assert captured["command"] == "agent --run"
+    assert captured["env"]["CUSTOM_ENV"] == "works"
+    assert captured["env"]["TRAJECTLY_MODE"] == "record"
+    assert "TRAJECTLY_REPLAY_GUARD" not in captured["env"]
 
 
 def test_execute_spec_sets_network_allowlist_env(tmp_path: Path) -> None:
-    script_path = tmp_path / "agent.py"
-    _write(
-        script_path,
-        """
-import os
-print(os.getenv("TRAJECTLY_NETWORK_ALLOWLIST", "missing"))
-""",
-    )
-
     spec = AgentSpec(
         name="demo",
-        command=f"{sys.executable} {script_path.name}",
+        command="agent --run",
         source_path=tmp_path / "demo.agent.yaml",
         workdir=".",
         contracts=AgentContracts(network=NetworkContracts(allowlist=["api.example.com", "localhost"])),
     )
+    captured: dict[str, Any] = {}
 
     result = execute_spec(
         spec=spec,
@@ -122,12 +125,15 @@ print(os.getenv("TRAJECTLY_NETWORK_ALLOWLIST", "missing"))
         events_path=tmp_path / "events.jsonl",
         fixtures_path=None,
         strict=True,
+        runner=_capturing_runner(captured),
     )
 
     assert result.returncode == 0
-    assert "api.example.com,localhost" in result.stdout
+    assert captured["env"]["TRAJECTLY_NETWORK_ALLOWLIST"] == "api.example.com,localhost"
+    assert captured["env"]["TRAJECTLY_REPLAY_GUARD"] == "1"
 
 
+@pytest.mark.slow
 def test_execute_spec_sets_trace_env_and_writes_meta(tmp_path: Path) -> None:
     script_path = tmp_path / "agent.py"
     _write(
@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from trajectly.constants import SCHEMA_VERSION
+from trajectly.errors import ERROR_CODE_SCHEMA_INVALID, ERROR_CODE_SCHEMA_VERSION_UNSUPPORTED
 from trajectly.events import read_events_jsonl
 from trajectly.schema import (
     SchemaValidationError,
@@ -32,6 +33,17 @@ def test_validate_trace_event_defaults_missing_schema_version() -> None:
     assert normalized["schema_version"] == SCHEMA_VERSION
 
 
+def test_validate_trace_event_returns_shared_schema_version_constant() -> None:
+    raw = json.loads(
+        '{"schema_version": "v1", "event_type": "run_started", "seq": 1,'
+        ' "run_id": "run-1", "rel_ms": 0, "payload": {}}'
+    )
+
+    normalized = validate_trace_event_dict(raw)
+
+    assert normalized["schema_version"] is SCHEMA_VERSION
+
+
 def test_validate_trace_event_rejects_unsupported_schema_version() -> None:
     with pytest.raises(SchemaValidationError, match="Unsupported trace schema_version"):
         validate_trace_event_dict(
@@ -49,25 +61,16 @@ def test_validate_trace_event_rejects_unsupported_schema_version() -> None:
 
 def test_read_events_jsonl_rejects_unsupported_schema_version(tmp_path: Path) -> None:
     path = tmp_path / "bad-trace.jsonl"
-    path.write_text(
-        json.dumps(
-            {
-                "schema_version": "v999",
-                "event_type": "run_started",
-                "seq": 1,
-                "run_id": "run-1",
-                "rel_ms": 0,
-                "payload": {},
-                "meta": {},
-            }
-        )
-        + "\n",
-        encoding="utf-8",
+    path.write_bytes(
+        b'{"schema_version":"v999","event_type":"run_started","seq":1,'
+        b'"run_id":"run-1","rel_ms":0,"payload":{},"meta":{}}\n'
     )
 
-    with pytest.raises(SchemaValidationError, match="Migration required"):
+    with pytest.raises(SchemaValidationError, match="Migration required") as excinfo:
         read_events_jsonl(path)
 
+    assert excinfo.value.code == ERROR_CODE_SCHEMA_VERSION_UNSUPPORTED
+
 
 def test_validate_diff_report_defaults_schema_version() -> None:
     normalized = validate_diff_report_dict(
@@ -115,3 +118,10 @@ def test_validate_latest_report_rejects_unsupported_schema_version() -> None:
                 "reports": [],
             }
         )
+
+
+def test_schema_validation_error_defaults_to_invalid_code() -> None:
+    with pytest.raises(SchemaValidationError) as excinfo:
+        validate_diff_report_dict({"summary": {}, "findings": "nope"})
+
+    assert excinfo.value.code == ERROR_CODE_SCHEMA_INVALID
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from trajectly.constants import (
     SIDE_EFFECT_TOOL_REGISTRY_V1,
+    SIDE_EFFECT_TOOL_SET,
     TRT_NORMALIZER_VERSION,
     TRT_REPORT_SCHEMA_VERSION,
     TRT_SIDE_EFFECT_REGISTRY_VERSION,
@@ -32,6 +33,7 @@ def test_side_effect_registry_v1_is_deterministic() -> None:
         "filesystem_write",
         "http_request",
     )
+    assert SIDE_EFFECT_TOOL_SET == frozenset(SIDE_EFFECT_TOOL_REGISTRY_V1)
 
 
 def test_witness_class_order_is_refinement_then_contract_then_tooling() -> None:
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+from dataclasses import dataclass
 from types import SimpleNamespace
-from typing import Any
+from typing import Any, NamedTuple
 
 import pytest
 
@@ -25,9 +26,18 @@ from trajectly.sdk.adapters import (
 )
 
 
+class Call(NamedTuple):
+    kind: str
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    name: str = ""
+    provider: str = ""
+    model: str = ""
+
+
 class FakeContext:
     def __init__(self) -> None:
-        self.calls: list[dict[str, Any]] = []
+        self.calls: list[Call] = []
 
     def invoke_tool(
         self,
@@ -36,7 +46,7 @@ class FakeContext:
         args: tuple[Any, ...],
         kwargs: dict[str, Any],
     ) -> Any:
-        self.calls.append({"kind": "tool", "name": name, "args": args, "kwargs": kwargs})
+        self.calls.append(Call("tool", args, kwargs, name=name))
         return fn(*args, **kwargs)
 
     def invoke_llm(
@@ -47,15 +57,7 @@ class FakeContext:
         args: tuple[Any, ...],
         kwargs: dict[str, Any],
     ) -> Any:
-        self.calls.append(
-            {
-                "kind": "llm",
-                "provider": provider,
-                "model": model,
-                "args": args,
-                "kwargs": kwargs,
-            }
-        )
+        self.calls.append(Call("llm", args, kwargs, provider=provider, model=model))
         return fn(*args, **kwargs)
 
 
@@ -67,7 +69,7 @@ class FakeAsyncContext(FakeContext):
         args: tuple[Any, ...],
         kwargs: dict[str, Any],
     ) -> Any:
-        self.calls.append({"kind": "tool_async", "name": name, "args": args, "kwargs": kwargs})
+        self.calls.append(Call("tool_async", args, kwargs, name=name))
         result = fn(*args, **kwargs)
         if inspect.isawaitable(result):
             return await result
@@ -81,15 +83,7 @@ class FakeAsyncContext(FakeContext):
         args: tuple[Any, ...],
         kwargs: dict[str, Any],
     ) -> Any:
-        self.calls.append(
-            {
-                "kind": "llm_async",
-                "provider": provider,
-                "model": model,
-                "args": args,
-                "kwargs": kwargs,
-            }
-        )
+        self.calls.append(Call("llm_async", args, kwargs, provider=provider, model=model))
         result = fn(*args, **kwargs)
         if inspect.isawaitable(result):
             return await result
@@ -124,14 +118,14 @@ class FakeGeminiClient:
         self.models = SimpleNamespace(generate_content=self.generate_content)
 
 
+@dataclass(frozen=True)
 class OpenAIUsage:
-    def __init__(self, total_tokens: int) -> None:
-        self.total_tokens = total_tokens
+    total_tokens: int
 
 
+@dataclass(frozen=True)
 class OpenAIMessage:
-    def __init__(self, content: str) -> None:
-        self.content = content
+    content: str
 
 
 class OpenAIChoice:
@@ -145,15 +139,15 @@ class OpenAIResponse:
         self.usage = OpenAIUsage(total_tokens)
 
 
+@dataclass(frozen=True)
 class AnthropicUsage:
-    def __init__(self, input_tokens: int, output_tokens: int) -> None:
-        self.input_tokens = input_tokens
-        self.output_tokens = output_tokens
+    input_tokens: int
+    output_tokens: int
 
 
+@dataclass(frozen=True)
 class AnthropicBlock:
-    def __init__(self, text: str) -> None:
-        self.text = text
+    text: str
 
 
 class AnthropicResponse:
@@ -162,21 +156,21 @@ class AnthropicResponse:
         self.usage = AnthropicUsage(input_tokens, output_tokens)
 
 
+@dataclass(frozen=True)
 class GeminiUsageMetadata:
-    def __init__(self, prompt_tokens: int, candidates_tokens: int, total_tokens: int) -> None:
-        self.prompt_token_count = prompt_tokens
-        self.candidates_token_count = candidates_tokens
-        self.total_token_count = total_tokens
+    prompt_token_count: int
+    candidates_token_count: int
+    total_token_count: int
 
 
+@dataclass(frozen=True)
 class GeminiPart:
-    def __init__(self, text: str) -> None:
-        self.text = text
+    text: str
 
 
+@dataclass(frozen=True)
 class GeminiContent:
-    def __init__(self, parts: list[GeminiPart]) -> None:
-        self.parts = parts
+    parts: list[GeminiPart]
 
 
 class GeminiCandidate:
@@ -184,10 +178,10 @@ class GeminiCandidate:
         self.content = GeminiContent(parts)
 
 
+@dataclass(frozen=True)
 class GeminiResponse:
-    def __init__(self, candidates: list[GeminiCandidate], usage_metadata: GeminiUsageMetadata) -> None:
-        self.candidates = candidates
-        self.usage_metadata = usage_metadata
+    candidates: list[GeminiCandidate]
+    usage_metadata: GeminiUsageMetadata
 
 
 class FakeRunnable:
@@ -293,14 +287,7 @@ def test_invoke_tool_call_uses_context() -> None:
     result = invoke_tool_call("add", add, 2, 5, context=context)
 
     assert result == 7
-    assert context.calls == [
-        {
-            "kind": "tool",
-            "name": "add",
-            "args": (2, 5),
-            "kwargs": {},
-        }
-    ]
+    assert context.calls == [Call("tool", (2, 5), {}, name="add")]
 
 
 def test_invoke_llm_call_uses_context() -> None:
@@ -312,9 +299,9 @@ def test_invoke_llm_call_uses_context() -> None:
     result = invoke_llm_call("mock", "deterministic", fake_llm, context=context, prompt="hello")
 
     assert result == {"response": "HELLO", "usage": {"total_tokens": 3}}
-    assert context.calls[0]["provider"] == "mock"
-    assert context.calls[0]["model"] == "deterministic"
-    assert context.calls[0]["kwargs"] == {"prompt": "hello"}
+    assert context.calls[0].provider == "mock"
+    assert context.calls[0].model == "deterministic"
+    assert context.calls[0].kwargs == {"prompt": "hello"}
 
 
 def test_invoke_tool_call_async_uses_context() -> None:
@@ -326,14 +313,7 @@ def test_invoke_tool_call_async_uses_context() -> None:
     result = asyncio.run(invoke_tool_call_async("add", add, 2, 5, context=context))
 
     assert result == 7
-    assert context.calls == [
-        {
-            "kind": "tool_async",
-            "name": "add",
-            "args": (2, 5),
-            "kwargs": {},
-        }
-    ]
+    assert context.calls == [Call("tool_async", (2, 5), {}, name="add")]
 
 
 def test_invoke_llm_call_async_uses_context() -> None:
@@ -345,9 +325,9 @@ def test_invoke_llm_call_async_uses_context() -> None:
     result = asyncio.run(invoke_llm_call_async("mock", "deterministic", fake_llm, context=context, prompt="hello"))
 
     assert result == {"response": "HELLO", "usage": {"total_tokens": 3}}
-    assert context.calls[0]["provider"] == "mock"
-    assert context.calls[0]["model"] == "deterministic"
-    assert context.calls[0]["kwargs"] == {"prompt": "hello"}
+    assert context.calls[0].provider == "mock"
+    assert context.calls[0].model == "deterministic"
+    assert context.calls[0].kwargs == {"prompt": "hello"}
 
 
 def test_openai_adapter_from_mapping_response() -> None:
@@ -370,7 +350,7 @@ def test_openai_adapter_from_mapping_response() -> None:
     assert result["response"] == "openai mapping"
     assert result["usage"] == {"total_tokens": 11}
     assert client.create.requests[0]["model"] == "gpt-4o-mini"
-    assert context.calls[0]["provider"] == "openai"
+    assert context.calls[0].provider == "openai"
 
 
 def test_openai_adapter_from_object_response() -> None:
@@ -413,7 +393,7 @@ def test_anthropic_adapter_from_mapping_response() -> None:
     assert result["response"] == "line one\nline two"
     assert result["usage"] == {"input_tokens": 9, "output_tokens": 5}
     assert client.create.requests[0]["max_tokens"] == 64
-    assert context.calls[0]["provider"] == "anthropic"
+    assert context.calls[0].provider == "anthropic"
 
 
 def test_anthropic_adapter_from_object_response() -> None:
@@ -464,8 +444,8 @@ def test_gemini_adapter_from_mapping_response() -> None:
         "total_token_count": 10,
     }
     assert client.generate_content.requests[0]["contents"] == "hello world"
-    assert context.calls[0]["provider"] == "gemini"
-    assert context.calls[0]["model"] == "gemini-2.0-flash"
+    assert context.calls[0].provider == "gemini"
+    assert context.calls[0].model == "gemini-2.0-flash"
 
 
 def test_gemini_adapter_from_object_response() -> None:
@@ -476,7 +456,7 @@ def test_gemini_adapter_from_object_response() -> None:
                 GeminiCandidate([GeminiPart("line one "), GeminiPart("line two")]),
                 GeminiCandidate([GeminiPart("line three")]),
             ],
-            usage_metadata=GeminiUsageMetadata(prompt_tokens=5, candidates_tokens=7, total_tokens=12),
+            usage_metadata=GeminiUsageMetadata(prompt_token_count=5, candidates_token_count=7, total_token_count=12),
         )
     )
 
@@ -555,8 +535,8 @@ def test_llamaindex_adapter_from_mapping_response() -> None:
     assert result["response"] == "llamaindex answer"
     assert result["usage"] == {"prompt_tokens": 4, "completion_tokens": 6}
     assert query_engine.calls[0] == ("What is trajectly?", {"top_k": 2})
-    assert context.calls[0]["provider"] == "llamaindex"
-    assert context.calls[0]["model"] == "llamaindex-query-v1"
+    assert context.calls[0].provider == "llamaindex"
+    assert context.calls[0].model == "llamaindex-query-v1"
 
 
 def test_llamaindex_adapter_from_object_response() -> None:
@@ -597,8 +577,8 @@ def test_crewai_adapter_with_execute_method_and_mapping_result() -> None:
     assert result["response"] == "crew output"
     assert result["usage"] == {"total_tokens": 9}
     assert task.calls[0] == {"topic": "ci reliability", "temperature": 0}
-    assert context.calls[0]["provider"] == "crewai"
-    assert context.calls[0]["model"] == "crew-task-v1"
+    assert context.calls[0].provider == "crewai"
+    assert context.calls[0].model == "crew-task-v1"
 
 
 def test_crewai_adapter_with_run_method_and_object_result() -> None:
@@ -639,8 +619,8 @@ def test_autogen_adapter_with_mapping_result() -> None:
     assert result["response"] == "autogen reply"
     assert result["usage"] == {"total_tokens": 14}
     assert runner.calls[0] == (messages, {"temperature": 0})
-    assert context.calls[0]["provider"] == "autogen"
-    assert context.calls[0]["model"] == "autogen-model"
+    assert context.calls[0].provider == "autogen"
+    assert context.calls[0].model == "autogen-model"
 
 
 def test_autogen_adapter_with_object_result() -> None:
@@ -679,8 +659,8 @@ def test_dspy_adapter_with_callable_program() -> None:
     assert result["response"] == "dspy answer"
     assert result["usage"] == {"total_tokens": 8}
     assert program.calls[0] == ("What is trajectly?", {"max_depth": 2})
-    assert context.calls[0]["provider"] == "dspy"
-    assert context.calls[0]["model"] == "dspy-program-v1"
+    assert context.calls[0].provider == "dspy"
+    assert context.calls[0].model == "dspy-program-v1"
 
 
 def test_dspy_adapter_with_forward_program_object_result() -> None:
@@ -14,8 +14,8 @@ from trajectly.sdk.context import SDKContext, SDKRuntimeError, _RuntimeContracts
 
 
 def _read_events(path: Path) -> list[dict[str, object]]:
-    lines = path.read_text(encoding="utf-8").splitlines()
-    return [json.loads(line) for line in lines if line.strip()]
+    with path.open(encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if not line.isspace()]
 
 
 def test_sdk_context_record_mode_emits_events(tmp_path: Path) -> None:
@@ -46,6 +46,25 @@ def test_sdk_context_record_mode_emits_events(tmp_path: Path) -> None:
     assert event_types == ["tool_called", "tool_returned", "llm_called", "llm_returned"]
 
 
+def test_sdk_context_stringifies_unserializable_payload_values(tmp_path: Path) -> None:
+    events_path = tmp_path / "events.jsonl"
+    settings = _RuntimeSettings(
+        mode="record",
+        events_path=events_path,
+        fixtures_path=None,
+        fixture_policy="by_index",
+        strict=False,
+    )
+    ctx = SDKContext(settings)
+
+    ctx.invoke_tool("wrap", lambda value: {"value": value}, (Path("a.txt"),), {})
+
+    events = _read_events(events_path)
+
+    assert events[0]["payload"]["input"]["args"] == ["a.txt"]
+    assert events[1]["payload"]["output"] == {"value": "a.txt"}
+
+
 def test_sdk_context_record_mode_async_emits_events(tmp_path: Path) -> None:
     events_path = tmp_path / "events.jsonl"
     settings = _RuntimeSettings(
@@ -105,13 +124,8 @@ def test_sdk_context_replay_mode_uses_fixtures_without_calling_function(tmp_path
         ]
     )
 
-    # Recompute hashes through save/load path.
-    normalized = FixtureStore.from_dict(store.to_dict())
-    for entry in normalized.entries:
-        from trajectly.canonical import sha256_of_data
-
-        entry.input_hash = sha256_of_data(entry.input_payload)
-    normalized.save(fixtures_path)
+    # Loading fills in the blank input hashes.
+    FixtureStore.from_dict(store.to_dict()).save(fixtures_path)
 
     settings = _RuntimeSettings(
         mode="replay",
@@ -163,12 +177,8 @@ def test_sdk_context_replay_mode_async_uses_fixtures_without_calling_function(tm
             ),
         ]
     )
-    normalized = FixtureStore.from_dict(store.to_dict())
-    for entry in normalized.entries:
-        from trajectly.canonical import sha256_of_data
-
-        entry.input_hash = sha256_of_data(entry.input_payload)
-    normalized.save(fixtures_path)
+    # Loading fills in the blank input hashes.
+    FixtureStore.from_dict(store.to_dict()).save(fixtures_path)
 
     settings = _RuntimeSettings(
         mode="replay",
@@ -229,12 +239,8 @@ def test_sdk_context_replay_fixture_exhausted_raises_stable_error(tmp_path: Path
             )
         ]
     )
-    normalized = FixtureStore.from_dict(store.to_dict())
-    for entry in normalized.entries:
-        from trajectly.canonical import sha256_of_data
-
-        entry.input_hash = sha256_of_data(entry.input_payload)
-    normalized.save(fixtures_path)
+    # Loading fills in the blank input hashes.
+    FixtureStore.from_dict(store.to_dict()).save(fixtures_path)
 
     settings = _RuntimeSettings(
         mode="replay",
@@ -334,7 +340,7 @@ def test_sdk_context_emits_v04_trace_when_trace_paths_provided(tmp_path: Path) -
     _ = ctx.invoke_tool("add", lambda a, b: a + b, (1, 2), {})
 
     raw_meta = json.loads(trace_meta_path.read_text(encoding="utf-8"))
-    trace_lines = [json.loads(line) for line in trace_path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    trace_lines = _read_events(trace_path)
 
     assert raw_meta["schema_version"] == "0.4"
     assert raw_meta["normalizer_version"] == "1"
@@ -54,3 +54,25 @@ def test_ddmin_shrink_rejects_non_failing_input() -> None:
             max_seconds=1.0,
             max_iterations=10,
         )
+
+
+def test_ddmin_shrink_never_evaluates_the_same_candidate_twice() -> None:
+    events = [_event("agent_step", seq) for seq in range(1, 17)]
+    events[5] = _event("tool_called", 6)
+    events[11] = _event("tool_called", 12)
+    seen: list[tuple[int, ...]] = []
+
+    def failure_predicate(candidate: list[TraceEvent]) -> bool:
+        seen.append(tuple(event.seq for event in candidate))
+        return sum(event.event_type == "tool_called" for event in candidate) == 2
+
+    result = ddmin_shrink(
+        events=events,
+        failure_predicate=failure_predicate,
+        max_seconds=5.0,
+        max_iterations=1000,
+    )
+
+    assert [event.seq for event in result.reduced_events] == [6, 12]
+    assert len(seen) == len(set(seen))
+    assert result.iterations == len(seen) - 1
@@ -1,10 +1,13 @@
 """Tests for spec extends + deterministic deep-merge."""
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from trajectly.core import specs as specs_module
 from trajectly.core.specs import deep_merge, load_spec
 
 
@@ -111,3 +114,41 @@ class TestSpecExtends:
         )
         spec = load_spec(spec_file)
         assert spec.name == "solo"
+
+    def test_shared_base_is_parsed_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        base = tmp_path / "shared.agent.yaml"
+        base.write_text("schema_version: '0.4'\nname: base\ncommand: python agent.py\n")
+        for name in ("one", "two"):
+            (tmp_path / f"{name}.agent.yaml").write_text(f"extends: shared.agent.yaml\nname: {name}\n")
+        loaded: list[Path] = []
+        original = specs_module.load_yaml_mapping
+
+        def counting_load(path: Path) -> dict[str, Any]:
+            loaded.append(path)
+            return original(path)
+
+        monkeypatch.setattr(specs_module, "load_yaml_mapping", counting_load)
+
+        first = load_spec(tmp_path / "one.agent.yaml")
+        second = load_spec(tmp_path / "two.agent.yaml")
+        base.write_text("schema_version: '0.4'\nname: base\ncommand: python changed.py\n")
+        third = load_spec(tmp_path / "one.agent.yaml")
+
+        assert (first.name, second.name) == ("one", "two")
+        assert third.command == "python changed.py"
+        assert loaded.count(base.resolve()) == 2
+
+    def test_editing_transitive_ancestor_invalidates_descendants(self, tmp_path: Path) -> None:
+        grand = tmp_path / "grand.agent.yaml"
+        grand.write_text("schema_version: '0.4'\nname: grand\ncommand: python a.py\n")
+        (tmp_path / "base.agent.yaml").write_text("extends: grand.agent.yaml\nname: base\n")
+        child = tmp_path / "child.agent.yaml"
+        child.write_text("extends: base.agent.yaml\nname: child\n")
+
+        assert load_spec(child).command == "python a.py"
+
+        grand.write_text("schema_version: '0.4'\nname: grand\ncommand: python b.py\n")
+        stat = grand.stat()
+        os.utime(grand, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_spec(child).command == "python b.py"
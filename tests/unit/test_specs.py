@@ -261,6 +261,14 @@ command: python script.py
             "command: python a.py\ncontracts:\n  data_leak:\n    secret_patterns: nope",
             "contracts.data_leak.secret_patterns must be a list",
         ),
+        (
+            "command: python a.py\ncontracts:\n  data_leak:\n    secret_patterns: ['sk_(']",
+            "contracts.data_leak.secret_patterns has invalid regex",
+        ),
+        (
+            "command: python a.py\nredact: ['[unclosed']",
+            "redact has invalid regex",
+        ),
     ],
 )
 def test_load_spec_validation_errors(tmp_path: Path, body: str, message: str) -> None:
@@ -13,3 +13,31 @@ def test_structural_diff_reports_paths() -> None:
     assert changes[0].path == "$.a.b[1].c"
     assert changes[0].baseline == "x"
     assert changes[0].current == "y"
+
+
+def test_structural_diff_handles_nesting_beyond_recursion_limit() -> None:
+    baseline: dict[str, object] = {"leaf": 1}
+    current: dict[str, object] = {"leaf": 2}
+    for _ in range(5000):
+        baseline = {"n": baseline}
+        current = {"n": current}
+
+    changes = structural_diff(baseline, current)
+
+    assert len(changes) == 1
+    assert changes[0].path == "$" + ".n" * 5000 + ".leaf"
+
+
+def test_structural_diff_orders_missing_and_nested_changes_by_position() -> None:
+    baseline = {"a": 1, "b": [1, 2, 3], "c": {"d": 1}}
+    current = {"b": [1, 5], "c": {"d": 2}, "e": 0}
+
+    changes = structural_diff(baseline, current)
+
+    assert [(c.path, c.baseline, c.current) for c in changes] == [
+        ("$.a", 1, None),
+        ("$.b[1]", 2, 5),
+        ("$.b[2]", 3, None),
+        ("$.c.d", 1, 2),
+        ("$.e", None, 0),
+    ]
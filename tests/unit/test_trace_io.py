@@ -7,7 +7,13 @@ from pathlib import Path
 
 import pytest
 
-from trajectly.trace.io import append_trace_event, read_trace_events, read_trace_meta, write_trace_meta
+from trajectly.trace.io import (
+    append_trace_event,
+    read_trace_events,
+    read_trace_meta,
+    read_trace_meta_version,
+    write_trace_meta,
+)
 from trajectly.trace.models import TraceEventV03, TraceMetaV03
 from trajectly.trace.validate import TraceValidationError
 
@@ -61,3 +67,19 @@ def test_trace_meta_reader_rejects_wrong_normalizer_version(tmp_path: Path) -> N
 
     with pytest.raises(TraceValidationError, match="Unsupported normalizer_version"):
         read_trace_meta(meta_path)
+
+
+def test_read_trace_meta_version_skips_full_validation(tmp_path: Path) -> None:
+    meta_path = tmp_path / "demo.trace.meta.json"
+    write_trace_meta(meta_path, TraceMetaV03(spec_name="demo"))
+    assert read_trace_meta_version(meta_path) == "1"
+
+    payload = json.loads(meta_path.read_text(encoding="utf-8"))
+    payload["normalizer_version"] = "999"
+    payload["metadata"] = {"normalizer_version": "1"}
+    meta_path.write_text(json.dumps(payload), encoding="utf-8")
+    assert read_trace_meta_version(meta_path) == "999"
+
+    meta_path.write_text(json.dumps({"schema_version": "0.4"}), encoding="utf-8")
+    with pytest.raises(ValueError, match="normalizer_version"):
+        read_trace_meta_version(meta_path)
@@ -26,21 +26,19 @@ NUM_TRIALS = 50
 
 
 def _random_tool_events(rng: random.Random, n: int, tools: list[str]) -> list[TraceEvent]:
-    events = []
-    for i in range(n):
-        events.append(
-            make_event(
-                event_type="tool_called",
-                seq=i + 1,
-                run_id="r1",
-                rel_ms=i + 1,
-                payload={
-                    "tool_name": rng.choice(tools),
-                    "input": {"args": [], "kwargs": {}},
-                },
-            )
+    return [
+        make_event(
+            event_type="tool_called",
+            seq=i + 1,
+            run_id="r1",
+            rel_ms=i + 1,
+            payload={
+                "tool_name": tool_name,
+                "input": {"args": [], "kwargs": {}},
+            },
         )
-    return events
+        for i, tool_name in enumerate(rng.choices(tools, k=n))
+    ]
 
 
 def _spec() -> AgentSpec:
@@ -8,12 +8,14 @@ from trajectly.events import make_event
 from trajectly.specs import AgentSpec, ToolContracts
 from trajectly.trt.runner import evaluate_trt
 
+_SOURCE_PATH = Path("demo.agent.yaml")
+
 
 def _spec() -> AgentSpec:
     return AgentSpec(
         name="demo",
         command="python agent.py",
-        source_path=Path("demo.agent.yaml"),
+        source_path=_SOURCE_PATH,
     )
 
 
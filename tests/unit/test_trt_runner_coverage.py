@@ -4,17 +4,22 @@ branches, vacuous refinement, combined multi-witness."""
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from trajectly.events import make_event
 from trajectly.specs import AgentContracts, AgentSpec, SequenceContracts, ToolContracts
 from trajectly.trt.runner import _event_index_from_finding, evaluate_trt
 
+_SOURCE_PATH = Path("demo.agent.yaml")
+
 
 def _spec(**overrides: object) -> AgentSpec:
     defaults: dict = {
         "name": "demo",
         "command": "python agent.py",
-        "source_path": Path("demo.agent.yaml"),
+        "source_path": _SOURCE_PATH,
     }
     defaults.update(overrides)
     return AgentSpec(**defaults)
@@ -24,184 +29,146 @@ def _spec(**overrides: object) -> AgentSpec:
 # FIXTURE_EXHAUSTED handling
 # ---------------------------------------------------------------------------
 
-def test_fixture_exhausted_in_tool_returned() -> None:
+@pytest.mark.parametrize(
+    ("called_type", "called_payload", "returned_type", "returned_payload", "expected_signature", "observed"),
+    [
+        pytest.param(
+            "tool_called",
+            {"tool_name": "search", "input": {"args": [], "kwargs": {}}},
+            "tool_returned",
+            {
+                "tool_name": "search",
+                "error_code": "FIXTURE_EXHAUSTED",
+                "error": "No more fixtures for search",
+                "error_details": {
+                    "expected_signature": "abc123",
+                    "available_count": 1,
+                    "consumed_count": 2,
+                    "tool_name": "search",
+                },
+            },
+            "abc123",
+            {"consumed_count": 2, "tool_name": "search"},
+            id="tool_returned",
+        ),
+        pytest.param(
+            "llm_called",
+            {"provider": "openai", "model": "gpt-4"},
+            "llm_returned",
+            {
+                "error_code": "FIXTURE_EXHAUSTED",
+                "error": "No more LLM fixtures",
+                "error_details": {
+                    "llm_signature": "openai/gpt-4",
+                    "available_count": 0,
+                    "consumed_count": 1,
+                },
+            },
+            None,
+            {"consumed_count": 1, "llm_signature": "openai/gpt-4"},
+            id="llm_returned",
+        ),
+    ],
+)
+def test_fixture_exhausted_in_returned_event(
+    called_type: str,
+    called_payload: dict[str, Any],
+    returned_type: str,
+    returned_payload: dict[str, Any],
+    expected_signature: str | None,
+    observed: dict[str, Any],
+) -> None:
     spec = _spec()
     baseline = [
-        make_event(event_type="tool_called", seq=1, run_id="r1", rel_ms=1,
-                   payload={"tool_name": "search", "input": {"args": [], "kwargs": {}}}),
+        make_event(event_type=called_type, seq=1, run_id="r1", rel_ms=1, payload=dict(called_payload)),
     ]
     current = [
-        make_event(event_type="tool_called", seq=1, run_id="r2", rel_ms=1,
-                   payload={"tool_name": "search", "input": {"args": [], "kwargs": {}}}),
-        make_event(event_type="tool_returned", seq=2, run_id="r2", rel_ms=2,
-                   payload={
-                       "tool_name": "search",
-                       "error_code": "FIXTURE_EXHAUSTED",
-                       "error": "No more fixtures for search",
-                       "error_details": {
-                           "expected_signature": "abc123",
-                           "available_count": 1,
-                           "consumed_count": 2,
-                           "tool_name": "search",
-                       },
-                   }),
+        make_event(event_type=called_type, seq=1, run_id="r2", rel_ms=1, payload=dict(called_payload)),
+        make_event(event_type=returned_type, seq=2, run_id="r2", rel_ms=2, payload=returned_payload),
     ]
     result = evaluate_trt(baseline_events=baseline, current_events=current, spec=spec)
     assert result.status == "FAIL"
     fixture_violations = [v for v in result.contract_violations if v.code == "FIXTURE_EXHAUSTED"]
     assert len(fixture_violations) == 1
     assert fixture_violations[0].event_index == 1
-    assert fixture_violations[0].expected["expected_signature"] == "abc123"
-    assert fixture_violations[0].observed["consumed_count"] == 2
-
-
-def test_fixture_exhausted_in_llm_returned() -> None:
-    spec = _spec()
-    baseline = [
-        make_event(event_type="llm_called", seq=1, run_id="r1", rel_ms=1,
-                   payload={"provider": "openai", "model": "gpt-4"}),
-    ]
-    current = [
-        make_event(event_type="llm_called", seq=1, run_id="r2", rel_ms=1,
-                   payload={"provider": "openai", "model": "gpt-4"}),
-        make_event(event_type="llm_returned", seq=2, run_id="r2", rel_ms=2,
-                   payload={
-                       "error_code": "FIXTURE_EXHAUSTED",
-                       "error": "No more LLM fixtures",
-                       "error_details": {
-                           "llm_signature": "openai/gpt-4",
-                           "available_count": 0,
-                           "consumed_count": 1,
-                       },
-                   }),
-    ]
-    result = evaluate_trt(baseline_events=baseline, current_events=current, spec=spec)
-    fixture_violations = [v for v in result.contract_violations if v.code == "FIXTURE_EXHAUSTED"]
-    assert len(fixture_violations) == 1
-    assert fixture_violations[0].observed["llm_signature"] == "openai/gpt-4"
+    assert fixture_violations[0].expected["expected_signature"] == expected_signature
+    for key, value in observed.items():
+        assert fixture_violations[0].observed[key] == value
 
 
 # ---------------------------------------------------------------------------
 # _event_index_from_finding branches
 # ---------------------------------------------------------------------------
 
-def test_event_index_from_finding_no_path() -> None:
-    idx = _event_index_from_finding(
-        path=None,
-        baseline=None,
-        call_tokens=[],
-        operations=[],
-        fallback_index=99,
-    )
-    assert idx == 99
-
-
-def test_event_index_from_finding_tool_calls_index() -> None:
-    call_tokens = [(10, "search"), (20, "checkout")]
+@pytest.mark.parametrize(
+    ("path", "baseline", "call_tokens", "operations", "fallback_index", "expected"),
+    [
+        pytest.param(None, None, [], [], 99, 99, id="no_path"),
+        pytest.param(
+            "$.tool_calls[1]", None, [(10, "search"), (20, "checkout")], [], 0, 20, id="tool_calls_index"
+        ),
+        pytest.param("$.tool_calls[5]", None, [(10, "search")], [], 99, 99, id="tool_calls_index_oob"),
+        pytest.param(
+            "$.operations[2]",
+            None,
+            [],
+            [(5, "tool:search"), (10, "llm:openai:gpt-4"), (15, "step:done")],
+            0,
+            15,
+            id="operations_index",
+        ),
+        pytest.param(
+            "$.operations[10]", None, [(5, "tool:search")], [(5, "tool:search")], 42, 42, id="operations_oob"
+        ),
+        pytest.param(
+            "$.tool_call.checkout.fields.price",
+            None,
+            [(10, "search"), (20, "checkout")],
+            [],
+            0,
+            20,
+            id="tool_call_name",
+        ),
+        pytest.param(
+            "$.tool_call.missing_tool.fields.x", None, [(10, "search")], [], 77, 77, id="tool_call_name_not_found"
+        ),
+        pytest.param(
+            "$.tool_calls.refund",
+            1,
+            [(5, "refund"), (10, "refund"), (15, "refund")],
+            [],
+            0,
+            10,
+            id="per_tool_match",
+        ),
+        pytest.param(
+            "$.tool_calls.refund",
+            "not-an-int",
+            [(5, "refund"), (10, "refund")],
+            [],
+            0,
+            10,
+            id="per_tool_no_baseline_index",
+        ),
+        pytest.param("$.tool_calls.missing", 0, [(5, "search")], [], 88, 88, id="per_tool_not_found"),
+    ],
+)
+def test_event_index_from_finding(
+    path: str | None,
+    baseline: object,
+    call_tokens: list[tuple[int, str]],
+    operations: list[tuple[int, str]],
+    fallback_index: int,
+    expected: int,
+) -> None:
     idx = _event_index_from_finding(
-        path="$.tool_calls[1]",
-        baseline=None,
+        path=path,
+        baseline=baseline,
         call_tokens=call_tokens,
-        operations=[],
-        fallback_index=0,
-    )
-    assert idx == 20
-
-
-def test_event_index_from_finding_tool_calls_index_oob() -> None:
-    call_tokens = [(10, "search")]
-    idx = _event_index_from_finding(
-        path="$.tool_calls[5]",
-        baseline=None,
-        call_tokens=call_tokens,
-        operations=[],
-        fallback_index=99,
-    )
-    assert idx == 99
-
-
-def test_event_index_from_finding_operations_index() -> None:
-    operations = [(5, "tool:search"), (10, "llm:openai:gpt-4"), (15, "step:done")]
-    idx = _event_index_from_finding(
-        path="$.operations[2]",
-        baseline=None,
-        call_tokens=[],
         operations=operations,
-        fallback_index=0,
-    )
-    assert idx == 15
-
-
-def test_event_index_from_finding_operations_oob() -> None:
-    operations = [(5, "tool:search")]
-    idx = _event_index_from_finding(
-        path="$.operations[10]",
-        baseline=None,
-        call_tokens=operations,
-        operations=operations,
-        fallback_index=42,
-    )
-    assert idx == 42
-
-
-def test_event_index_from_finding_tool_call_name() -> None:
-    call_tokens = [(10, "search"), (20, "checkout")]
-    idx = _event_index_from_finding(
-        path="$.tool_call.checkout.fields.price",
-        baseline=None,
-        call_tokens=call_tokens,
-        operations=[],
-        fallback_index=0,
-    )
-    assert idx == 20
-
-
-def test_event_index_from_finding_tool_call_name_not_found() -> None:
-    call_tokens = [(10, "search")]
-    idx = _event_index_from_finding(
-        path="$.tool_call.missing_tool.fields.x",
-        baseline=None,
-        call_tokens=call_tokens,
-        operations=[],
-        fallback_index=77,
-    )
-    assert idx == 77
-
-
-def test_event_index_from_finding_per_tool_match() -> None:
-    call_tokens = [(5, "refund"), (10, "refund"), (15, "refund")]
-    idx = _event_index_from_finding(
-        path="$.tool_calls.refund",
-        baseline=1,
-        call_tokens=call_tokens,
-        operations=[],
-        fallback_index=0,
-    )
-    assert idx == 10
-
-
-def test_event_index_from_finding_per_tool_no_baseline_index() -> None:
-    call_tokens = [(5, "refund"), (10, "refund")]
-    idx = _event_index_from_finding(
-        path="$.tool_calls.refund",
-        baseline="not-an-int",
-        call_tokens=call_tokens,
-        operations=[],
-        fallback_index=0,
-    )
-    assert idx == 10
-
-
-def test_event_index_from_finding_per_tool_not_found() -> None:
-    call_tokens = [(5, "search")]
-    idx = _event_index_from_finding(
-        path="$.tool_calls.missing",
-        baseline=0,
-        call_tokens=call_tokens,
-        operations=[],
-        fallback_index=88,
+        fallback_index=fallback_index,
     )
-    assert idx == 88
+    assert idx == expected
 
 
 # ---------------------------------------------------------------------------
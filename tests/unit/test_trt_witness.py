@@ -71,3 +71,14 @@ def test_resolve_witness_refinement_wins_tie_at_same_index() -> None:
         "REFINEMENT_B",
         "CONTRACT_A",
     ]
+
+
+def test_resolve_witness_ranks_unknown_failure_class_last() -> None:
+    violations = [
+        TRTViolation(code="A_UNKNOWN", message="unknown", failure_class="CUSTOM", event_index=2),
+        TRTViolation(code="Z_CONTRACT", message="contract", failure_class=FAILURE_CLASS_CONTRACT, event_index=2),
+    ]
+
+    witness = resolve_witness(violations)
+    assert witness is not None
+    assert [item.code for item in witness.all_violations_at_witness] == ["Z_CONTRACT", "A_UNKNOWN"]